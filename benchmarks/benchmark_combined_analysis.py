@@ -0,0 +1,128 @@
+"""
+Compare per-stage and combined LLM analysis of a transcript for tokens and latency.
+
+Per-stage mode sends the transcript in four requests (summary, tasks,
+sentiment, topic), run concurrently as in the dashboard. Combined mode sends
+it once through `CombinedAnalyzer`, plus per-stage calls for any section that
+failed validation. Reported per mode, averaged over the runs: requests,
+prompt tokens, prompt tokens served from the provider's prompt cache, and
+completion tokens (from the API `usage` field), wall time, and for combined
+mode the sections that fell back. The response cache is bypassed. Run it once
+with each `llm.prompt_layout` to compare the inline and shared-prefix layouts
+(concurrent requests can only hit the prompt cache once an earlier request
+with the same prefix has been processed, so later runs show the saving).
+Requires OPENROUTER_API_KEY and network access.
+
+Usage:
+    python benchmarks/benchmark_combined_analysis.py --transcript data/transcripts/meeting.txt --runs 3
+"""
+import sys
+import os
+import time
+import argparse
+from pathlib import Path
+
+# --- Project path setup ---
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from dotenv import load_dotenv
+
+from config.config_loader import load_model_config
+
+from src.llm.base_llm_client import BaseLLMClient, generate_many
+from src.llm.deepseek_client import DeepSeekV3Client
+from src.llm.client_registry import run_async
+from src.analysis.summarizer import MeetingSummarizer
+from src.analysis.task_extractor import TaskExtractor
+from src.analysis.sentiment_analyzer import SentimentAnalyzer
+from src.research.topic_extractor import TopicExtractor
+from src.analysis.combined_analyzer import CombinedAnalyzer
+
+load_dotenv()
+
+
+class UsageRecorder(BaseLLMClient):
+    """Uncached client that adds up the token usage of every call made through it."""
+
+    def __init__(self, totals: dict):
+        self.client = DeepSeekV3Client(api_key=os.getenv("OPENROUTER_API_KEY"))
+        self.totals = totals
+
+    def describe(self) -> dict:
+        return self.client.describe()
+
+    def _record(self):
+        usage = self.client.last_usage or {}
+        self.totals["requests"] += 1
+        self.totals["prompt_tokens"] += usage.get("prompt_tokens", 0)
+        self.totals["cached_tokens"] += (usage.get("prompt_tokens_details") or {}).get("cached_tokens") or 0
+        self.totals["completion_tokens"] += usage.get("completion_tokens", 0)
+
+    def generate(self, prompt: str, **kwargs):
+        result = self.client.generate(prompt, **kwargs)
+        self._record()
+        return result
+
+    async def agenerate(self, prompt: str, **kwargs):
+        result = await self.client.agenerate(prompt, **kwargs)
+        self._record()
+        return result
+
+
+def uncached(analyzer, totals: dict):
+    """Give an analyzer its own recording client, bypassing the response cache."""
+    analyzer.client = UsageRecorder(totals)
+    return analyzer
+
+
+async def per_stage(transcript: str, totals: dict):
+    await generate_many([
+        uncached(MeetingSummarizer(), totals).asummarize(transcript),
+        uncached(TaskExtractor(), totals).aextract_tasks(transcript),
+        uncached(SentimentAnalyzer(), totals).aanalyze_sentiment(transcript),
+        uncached(TopicExtractor(), totals).aextract_topic(transcript),
+    ])
+
+
+async def combined(transcript: str, totals: dict):
+    analyzer = uncached(CombinedAnalyzer(), totals)
+    for stage in (analyzer.summarizer, analyzer.task_extractor, analyzer.sentiment_analyzer, analyzer.topic_extractor):
+        uncached(stage, totals)
+    await analyzer.aanalyze(transcript)
+    totals["fallbacks"].extend(analyzer.last_fallbacks)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--transcript", required=True, help="Transcript text file")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per mode")
+    args = parser.parse_args()
+
+    if not os.getenv("OPENROUTER_API_KEY"):
+        sys.exit("OPENROUTER_API_KEY is not set")
+    transcript = Path(args.transcript).read_text(encoding="utf-8")
+
+    layout = load_model_config().get("llm", {}).get("prompt_layout", "inline")
+    print(f"Transcript: {len(transcript)} characters, {args.runs} runs per mode, {layout} prompt layout")
+    print(
+        f"{'mode':>10} {'requests':>9} {'prompt tok':>11} {'cached tok':>11} {'completion tok':>15} "
+        f"{'wall (s)':>9} {'fallbacks':>20}"
+    )
+    for name, analyze in (("per-stage", per_stage), ("combined", combined)):
+        totals = {"requests": 0, "prompt_tokens": 0, "cached_tokens": 0, "completion_tokens": 0, "fallbacks": []}
+        start = time.perf_counter()
+        for _ in range(args.runs):
+            run_async(analyze(transcript, totals)).result()
+        elapsed = time.perf_counter() - start
+        fallbacks = ", ".join(sorted(set(totals["fallbacks"]))) or "-"
+        print(
+            f"{name:>10} {totals['requests'] / args.runs:>9.1f} {totals['prompt_tokens'] / args.runs:>11.0f} "
+            f"{totals['cached_tokens'] / args.runs:>11.0f} {totals['completion_tokens'] / args.runs:>15.0f} "
+            f"{elapsed / args.runs:>9.2f} {fallbacks:>20}"
+        )
+
+
+if __name__ == "__main__":
+    main()
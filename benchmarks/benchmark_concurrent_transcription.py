@@ -0,0 +1,85 @@
+"""
+Benchmark transcription throughput when several meetings are processed at once.
+
+Compares two layouts of the Whisper model server for the same number of
+concurrent jobs:
+- oversubscribed: one worker per job, each using every core (the behaviour
+  without the scheduler);
+- scheduled: one worker per scheduler slot, each pinned to its own core set
+  with an even share of the threads; extra jobs wait for a free worker.
+Reports mean queue wait, mean run time and total throughput (audio seconds
+transcribed per wall-clock second). Requires openai-whisper.
+
+Usage:
+    python benchmarks/benchmark_concurrent_transcription.py --jobs 4 --slots 2 --minutes 2
+"""
+import sys
+import os
+import time
+import argparse
+
+# --- Project path setup ---
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from benchmarks.utils import synthesize_meeting
+from src.audio.loader import SAMPLE_RATE
+from src.transcription.model_server import WhisperModelServer
+from src.transcription.whisper_transcriber import load_decode_profile
+from src.transcription.scheduler import available_cores
+from config.config_loader import load_model_config
+
+
+def run_layout(workers: int, threads: int, jobs: int, audio, model_size: str) -> dict:
+    """Transcribe `jobs` copies of the audio concurrently on one server layout."""
+    server = WhisperModelServer(workers=workers, max_resident_models=1, threads_per_worker=threads).start()
+    options = load_decode_profile()
+    try:
+        # Warm-up: load the model in every worker
+        for future in [server.submit(model_size, audio[:SAMPLE_RATE], **options) for _ in range(workers)]:
+            future.result()
+
+        start = time.perf_counter()
+        futures = [server.submit(model_size, audio, **options) for _ in range(jobs)]
+        for future in futures:
+            future.result()
+        elapsed = time.perf_counter() - start
+        recent = server.stats()["recent"][-jobs:]
+    finally:
+        server.shutdown()
+
+    return {
+        "mean_wait": sum(job["queue_wait"] for job in recent) / jobs,
+        "mean_run": sum(job["run_time"] for job in recent) / jobs,
+        "throughput": jobs * len(audio) / SAMPLE_RATE / elapsed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=4, help="Concurrent transcriptions")
+    parser.add_argument("--slots", type=int, default=2, help="Scheduler slots for the scheduled layout")
+    parser.add_argument("--minutes", type=float, default=2, help="Length of each synthetic meeting")
+    args = parser.parse_args()
+
+    cores = len(available_cores())
+    model_size = load_model_config()["whisper"]["model_size"]
+    audio = synthesize_meeting(args.minutes * 60, sr=SAMPLE_RATE)
+
+    layouts = [
+        ("oversubscribed", args.jobs, cores),
+        ("scheduled", args.slots, max(1, cores // args.slots)),
+    ]
+    print(f"{args.jobs} jobs of {args.minutes:.1f} min on {cores} cores, model '{model_size}'")
+    print(f"{'layout':>15} {'workers':>8} {'threads':>8} {'wait (s)':>9} {'run (s)':>8} {'throughput (x RT)':>18}")
+    for name, workers, threads in layouts:
+        row = run_layout(workers, threads, args.jobs, audio, model_size)
+        print(
+            f"{name:>15} {workers:>8} {threads:>8} {row['mean_wait']:>9.1f} "
+            f"{row['mean_run']:>8.1f} {row['throughput']:>18.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
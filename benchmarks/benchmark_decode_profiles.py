@@ -0,0 +1,66 @@
+"""
+Compare Whisper decode profiles for speed and accuracy on a local test set.
+
+The test set is a directory of audio files with same-named .txt reference
+transcripts. The model is loaded once and every profile in
+`whisper.decode_profiles` (or the ones given) transcribes the whole set, with
+the transcript cache disabled. Reported per profile: wall time, real-time
+factor and word error rate. Requires openai-whisper.
+
+Usage:
+    python benchmarks/benchmark_decode_profiles.py --test-set data/test_set
+    python benchmarks/benchmark_decode_profiles.py --test-set data/test_set --profiles fast,accurate --no-vad
+"""
+import sys
+import os
+import time
+import argparse
+
+# --- Project path setup ---
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from benchmarks.utils import load_test_set
+from config.config_loader import load_model_config
+from src.audio.loader import load_pcm, SAMPLE_RATE
+from src.transcription.whisper_transcriber import WhisperTranscriber, load_decode_profile
+from src.transcription.utils import word_error_rate
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--test-set", required=True, help="Directory of audio files with .txt references")
+    parser.add_argument("--profiles", help="Comma-separated profiles (default: all configured profiles)")
+    parser.add_argument("--no-vad", action="store_true", help="Decode without VAD silence trimming")
+    args = parser.parse_args()
+
+    test_set = load_test_set(args.test_set)
+    if not test_set:
+        sys.exit(f"No audio files with .txt references found in {args.test_set}")
+    profiles = args.profiles.split(",") if args.profiles else list(load_model_config()["whisper"]["decode_profiles"])
+
+    audio = [(load_pcm(path), reference) for path, reference in test_set]
+    duration = sum(len(samples) for samples, _ in audio) / SAMPLE_RATE
+    words = sum(len(reference.split()) for _, reference in audio)
+
+    transcriber = WhisperTranscriber()
+    transcriber.use_cache = False
+    transcriber.use_vad = transcriber.use_vad and not args.no_vad
+    print(f"Test set: {len(test_set)} files, {duration / 60:.1f} min, model '{transcriber.model_size}'")
+    print(f"{'profile':>10} {'time (s)':>9} {'RTF':>7} {'WER':>7}")
+
+    for profile in profiles:
+        transcriber.decode_options = load_decode_profile(profile)
+        elapsed = errors = 0.0
+        for samples, reference in audio:
+            start = time.perf_counter()
+            hypothesis = transcriber.transcribe(samples)
+            elapsed += time.perf_counter() - start
+            errors += word_error_rate(reference, hypothesis) * len(reference.split())
+
+        print(f"{profile:>10} {elapsed:>9.1f} {elapsed / duration:>7.3f} {errors / max(words, 1):>7.1%}")
+
+
+if __name__ == "__main__":
+    main()
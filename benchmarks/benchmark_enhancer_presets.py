@@ -0,0 +1,59 @@
+"""
+Benchmark real-time factor and output SNR of each audio enhancement preset.
+
+Real-time factor (RTF) is processing time divided by audio duration, so
+values below 1.0 are faster than real time. Output SNR is measured against
+the noise-free synthetic speech.
+
+Usage:
+    python benchmarks/benchmark_enhancer_presets.py --seconds 120 --snr-db 5
+"""
+import sys
+import os
+import time
+import argparse
+
+# --- Project path setup ---
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+import numpy as np
+
+from benchmarks.utils import synthesize_noisy_speech
+from config.config_loader import load_model_config
+from src.audio.enhancer import reduce_noise
+
+
+def snr_db(reference: np.ndarray, estimate: np.ndarray) -> float:
+    """Signal-to-noise ratio of an estimate against a reference signal, in dB."""
+    n = min(len(reference), len(estimate))
+    error = reference[:n] - estimate[:n]
+    return 10 * np.log10(np.sum(reference[:n] ** 2) / (np.sum(error ** 2) + 1e-12))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=120, help="Length of the synthetic recording")
+    parser.add_argument("--sr", type=int, default=16000, help="Sampling rate of the synthetic recording")
+    parser.add_argument("--snr-db", type=float, default=5, help="Input speech-to-noise ratio")
+    parser.add_argument("--repeats", type=int, default=3, help="Runs per preset (best time is reported)")
+    args = parser.parse_args()
+
+    noisy, clean = synthesize_noisy_speech(args.seconds, sr=args.sr, snr_db=args.snr_db, return_clean=True)
+    presets = load_model_config()["audio"]["enhancement"]["presets"]
+
+    print(f"Synthetic noisy speech: {args.seconds:g} s @ {args.sr} Hz, input SNR {snr_db(clean, noisy):.1f} dB")
+    print(f"{'preset':>10} {'best time (s)':>14} {'RTF':>8} {'output SNR (dB)':>16}")
+    for name in presets:
+        timings = []
+        for _ in range(args.repeats):
+            start = time.perf_counter()
+            denoised = reduce_noise(noisy, args.sr, preset=name)
+            timings.append(time.perf_counter() - start)
+        best = min(timings)
+        print(f"{name:>10} {best:>14.2f} {best / args.seconds:>8.3f} {snr_db(clean, denoised):>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark peak RSS and wall time of one-shot vs streaming audio enhancement.
+
+Each mode runs in a fresh process so peak RSS is measured independently.
+The streaming output is then compared with the one-shot output.
+
+Usage:
+    python benchmarks/benchmark_enhancer_streaming.py --minutes 30 --sr 48000 --preset standard
+"""
+import sys
+import os
+import time
+import argparse
+import tempfile
+import multiprocessing as mp
+
+# --- Project path setup ---
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+import numpy as np
+import soundfile as sf
+
+from benchmarks.utils import write_synthetic_recording, peak_rss_mb
+
+
+def _run_mode(mode, input_file, output_file, preset, queue):
+    """Run one enhancement mode in a child process and report time and peak RSS."""
+    from src.audio import enhancer
+
+    start = time.perf_counter()
+    if mode == "one-shot":
+        result = enhancer.enhance_audio(input_file, output_file, preset=preset)
+    else:
+        result = enhancer.enhance_audio_streaming(input_file, output_file, preset=preset)
+
+    queue.put({"mode": mode, "result": result, "seconds": time.perf_counter() - start, "peak_rss_mb": peak_rss_mb()})
+
+
+def _compare(file_a, file_b, block=1_000_000):
+    """Blockwise maximum and RMS absolute difference between two audio files."""
+    max_diff, sq_sum, count = 0.0, 0.0, 0
+    with sf.SoundFile(file_a) as a, sf.SoundFile(file_b) as b:
+        while True:
+            x, y = a.read(block, dtype="float32"), b.read(block, dtype="float32")
+            n = min(len(x), len(y))
+            if n == 0:
+                break
+            diff = np.abs(x[:n] - y[:n])
+            max_diff = max(max_diff, float(diff.max()))
+            sq_sum += float(np.sum(diff.astype(np.float64) ** 2))
+            count += n
+    return max_diff, (sq_sum / max(count, 1)) ** 0.5
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--minutes", type=float, default=10, help="Length of the synthetic recording")
+    parser.add_argument("--sr", type=int, default=48000, help="Sampling rate of the synthetic recording")
+    parser.add_argument("--preset", default=None, help="Enhancement preset (default: config value)")
+    args = parser.parse_args()
+
+    ctx = mp.get_context("spawn")
+    with tempfile.TemporaryDirectory() as tmp:
+        input_file = os.path.join(tmp, "meeting.wav")
+        write_synthetic_recording(input_file, args.minutes * 60, sr=args.sr)
+        print(f"Synthetic recording: {args.minutes:g} min @ {args.sr} Hz, preset {args.preset or 'default'}")
+
+        outputs = {}
+        for mode in ("one-shot", "streaming"):
+            output_file = os.path.join(tmp, f"{mode}.wav")
+            queue = ctx.Queue()
+            process = ctx.Process(target=_run_mode, args=(mode, input_file, output_file, args.preset, queue))
+            process.start()
+            stats = queue.get()
+            process.join()
+            outputs[mode] = output_file
+            print(f"{mode:>10}: {stats['seconds']:8.2f} s  peak RSS {stats['peak_rss_mb']:8.1f} MB")
+
+        max_diff, rms_diff = _compare(outputs["streaming"], outputs["one-shot"])
+        print(f"streaming vs one-shot: max |diff| {max_diff:.2e}, RMS diff {rms_diff:.2e}")
+
+
+if __name__ == "__main__":
+    main()
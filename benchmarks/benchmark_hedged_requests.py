@@ -0,0 +1,113 @@
+"""
+Measure tail latency with and without hedged LLM requests against local fake servers.
+
+Two local HTTP/1.1 servers stand in for the providers. The primary answers
+most requests after `--fast-ms` but a fraction (`--slow-fraction`) only after
+`--slow-ms`, like OpenRouter's tail; the secondary always answers after
+`--secondary-ms`. Calls are made with a `DeepSeekV3Client` per server, first
+to the primary alone, then through a `HedgedLLMClient` that learns the hedge
+delay from the primary's latency percentile. Reports p50/p95/p99/max latency,
+the hedge rate and how often the secondary won. No API key or network access
+is needed.
+
+Usage:
+    python benchmarks/benchmark_hedged_requests.py --calls 200 --slow-fraction 0.1
+"""
+import sys
+import os
+import json
+import time
+import random
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# --- Project path setup ---
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from src.llm.deepseek_client import DeepSeekV3Client
+from src.llm.hedged_client import HedgedLLMClient, LatencyHistogram
+from src.llm.rate_limiter import ProviderRateLimiter
+
+RESPONSE = json.dumps({"choices": [{"message": {"content": "ok"}}]}).encode()
+
+
+class DelayingHandler(BaseHTTPRequestHandler):
+    """Chat completion stand-in that answers after a delay drawn by `server.delay()`."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        time.sleep(self.server.delay())
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(RESPONSE)))
+        self.end_headers()
+        self.wfile.write(RESPONSE)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server(name: str, delay) -> DeepSeekV3Client:
+    """Start a stand-in server and return an unthrottled client for it, named after `name`."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), DelayingHandler)
+    server.delay = delay
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    client = DeepSeekV3Client(api_key="stand-in")
+    client.url = f"http://127.0.0.1:{server.server_address[1]}/api/v1/chat/completions"
+    client.provider = name
+    client.rate_limiter = ProviderRateLimiter(name)
+    return client
+
+
+def run(client, calls: int) -> dict:
+    """Make `calls` sequential requests and return latency percentiles in milliseconds."""
+    latencies = LatencyHistogram(window=calls)
+    for _ in range(calls):
+        start = time.perf_counter()
+        client.generate("ping")
+        latencies.record(time.perf_counter() - start)
+    return {
+        "p50": latencies.percentile(50) * 1000,
+        "p95": latencies.percentile(95) * 1000,
+        "p99": latencies.percentile(99) * 1000,
+        "max": max(latencies.recent) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=200, help="Requests per scenario")
+    parser.add_argument("--fast-ms", type=float, default=50, help="Usual primary latency")
+    parser.add_argument("--slow-ms", type=float, default=2000, help="Primary tail latency")
+    parser.add_argument("--slow-fraction", type=float, default=0.1, help="Fraction of slow primary answers")
+    parser.add_argument("--secondary-ms", type=float, default=150, help="Secondary latency")
+    parser.add_argument("--percentile", type=float, default=90, help="Hedge delay percentile")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    primary = start_server(
+        "primary-stand-in",
+        lambda: (args.slow_ms if rng.random() < args.slow_fraction else args.fast_ms) / 1000,
+    )
+    secondary = start_server("secondary-stand-in", lambda: args.secondary_ms / 1000)
+    hedged = HedgedLLMClient(primary, secondary, percentile=args.percentile, min_samples=20, initial_delay=1, min_delay=0)
+
+    print(f"{'client':>14} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8} {'hedge rate':>11} {'secondary wins':>15}")
+    for name, client in (("primary only", primary), ("hedged", hedged)):
+        row = run(client, args.calls)
+        stats = hedged.stats() if client is hedged else None
+        rate = f"{stats['hedge_rate']:.1%}" if stats else "-"
+        wins = stats["secondary_wins"] if stats else "-"
+        print(f"{name:>14} {row['p50']:>8.0f} {row['p95']:>8.0f} {row['p99']:>8.0f} {row['max']:>8.0f} {rate:>11} {wins:>15}")
+    print(f"Final hedge delay: {hedged.hedge_delay() * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
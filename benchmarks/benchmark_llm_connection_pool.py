@@ -0,0 +1,97 @@
+"""
+Check connection reuse of the pooled DeepSeek client against a local stand-in server.
+
+A local HTTP/1.1 server answers with a fixed chat completion and records the
+client port of every request, so the number of distinct ports is the number of
+TCP connections opened. The pooled `DeepSeekV3Client` is compared with a bare
+`requests.post` per call (the previous behaviour), sequentially and from
+several threads. No API key or network access is needed. Over loopback
+without TLS the time saved per call is small; against OpenRouter each avoided
+connection also saves a TLS handshake over the network.
+
+Usage:
+    python benchmarks/benchmark_llm_connection_pool.py --calls 50 --threads 4
+"""
+import sys
+import os
+import json
+import time
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# --- Project path setup ---
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+import requests
+
+from src.llm.deepseek_client import DeepSeekV3Client
+
+RESPONSE = json.dumps({"choices": [{"message": {"content": "ok"}}]}).encode()
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Chat completion stand-in that records which connection served each request."""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body are sent in separate writes; avoid Nagle/delayed-ACK stalls on kept-alive connections
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        with self.server.lock:
+            self.server.ports.add(self.client_address[1])
+            self.server.requests += 1
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(RESPONSE)))
+        self.end_headers()
+        self.wfile.write(RESPONSE)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def run(server, call, calls: int, threads: int) -> tuple[int, float]:
+    """Make `calls` requests from `threads` threads; return (connections opened, ms per call)."""
+    server.ports.clear()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(lambda _: call(), range(calls)))
+    elapsed = time.perf_counter() - start
+    return len(server.ports), elapsed / calls * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=50, help="Requests per scenario")
+    parser.add_argument("--threads", type=int, default=4, help="Threads for the concurrent scenarios")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    server.lock, server.ports, server.requests = threading.Lock(), set(), 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/api/v1/chat/completions"
+
+    client = DeepSeekV3Client(api_key="stand-in")
+    client.url = url
+    payload = {"model": client.model_name, "messages": [{"role": "user", "content": "ping"}]}
+
+    scenarios = [
+        ("bare requests.post", lambda: requests.post(url, json=payload).json()),
+        ("pooled client", lambda: client.generate("ping")),
+    ]
+    print(f"{'client':>20} {'threads':>8} {'calls':>6} {'connections':>12} {'ms/call':>8}")
+    for threads in (1, args.threads):
+        for name, call in scenarios:
+            connections, ms = run(server, call, args.calls, threads)
+            print(f"{name:>20} {threads:>8} {args.calls:>6} {connections:>12} {ms:>8.2f}")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Benchmark throughput scaling of parallel segment-level transcription.
+
+For each worker count, the pool is started and warmed up first, so the
+reported time covers chunking, decoding and stitching only. Throughput is
+audio seconds transcribed per wall-clock second. Requires openai-whisper.
+
+Usage:
+    python benchmarks/benchmark_parallel_transcription.py --minutes 20 --workers 1,2,4
+    python benchmarks/benchmark_parallel_transcription.py --audio meeting.mp3 --workers 1,2,4,8
+"""
+import sys
+import os
+import time
+import argparse
+
+# --- Project path setup ---
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+import numpy as np
+
+from benchmarks.utils import synthesize_meeting
+from src.audio.loader import load_pcm, SAMPLE_RATE
+from src.transcription.parallel_transcriber import ParallelWhisperTranscriber
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--audio", help="Long recording to use instead of synthetic audio")
+    parser.add_argument("--minutes", type=float, default=20, help="Length of the synthetic meeting")
+    parser.add_argument("--workers", default="1,2,4", help="Comma-separated worker counts")
+    args = parser.parse_args()
+
+    audio = load_pcm(args.audio) if args.audio else synthesize_meeting(args.minutes * 60, sr=SAMPLE_RATE)
+    duration = len(audio) / SAMPLE_RATE
+    print(f"Audio: {duration / 60:.1f} min")
+    print(f"{'workers':>8} {'time (s)':>10} {'throughput (x RT)':>18} {'speedup':>8} {'segments':>9}")
+
+    baseline = None
+    for workers in (int(n) for n in args.workers.split(",")):
+        transcriber = ParallelWhisperTranscriber(workers=workers)
+        transcriber.use_vad = False
+        # Warm-up: start the pool and give every worker a chunk, so all models are loaded
+        silence = np.zeros(int(SAMPLE_RATE * transcriber.max_segment_seconds * workers), dtype=np.float32)
+        transcriber._decode(silence)
+
+        start = time.perf_counter()
+        segments = transcriber.transcribe_segments(audio)
+        elapsed = time.perf_counter() - start
+        transcriber.close()
+
+        baseline = baseline or elapsed
+        print(f"{workers:>8} {elapsed:>10.1f} {duration / elapsed:>18.2f} {baseline / elapsed:>8.2f} {len(segments):>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Check retries, backoff and the circuit breaker of the LLM rate limiter against a local fake server.
+
+A local HTTP/1.1 server stands in for OpenRouter: it answers the first
+`--throttled` requests with 429 and a `Retry-After` header, then with a fixed
+chat completion. `DeepSeekV3Client` calls go through a `ProviderRateLimiter`
+built from the configured limits (with short backoffs), from several threads.
+Reports calls that succeeded or failed, 429s served, retries and wall time.
+A second scenario answers every request with 429 and shows the circuit
+opening: once it is open, calls fail fast without reaching the server.
+No API key or network access is needed.
+
+Usage:
+    python benchmarks/benchmark_rate_limiter.py --calls 20 --threads 4 --throttled 6
+"""
+import sys
+import os
+import json
+import time
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# --- Project path setup ---
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from src.llm.deepseek_client import DeepSeekV3Client
+from src.llm.rate_limiter import ProviderRateLimiter
+from src.handlers.error_handler import MeetingMindError
+from config.config_loader import load_model_config
+
+RESPONSE = json.dumps({"choices": [{"message": {"content": "ok"}}]}).encode()
+THROTTLED = json.dumps({"error": {"message": "Rate limit exceeded", "code": 429}}).encode()
+
+
+class ThrottlingHandler(BaseHTTPRequestHandler):
+    """Chat completion stand-in that rate limits the first `server.throttled` requests."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        with self.server.lock:
+            self.server.requests += 1
+            throttle = self.server.requests <= self.server.throttled
+            self.server.rejected += throttle
+        self.send_response(429 if throttle else 200)
+        if throttle:
+            self.send_header("Retry-After", str(self.server.retry_after))
+        body = THROTTLED if throttle else RESPONSE
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def run(server, client, calls: int, threads: int, throttled: int) -> dict:
+    """Make `calls` requests from `threads` threads against a server throttling the first `throttled`."""
+    server.requests, server.rejected, server.throttled = 0, 0, throttled
+    limiter = client.rate_limiter
+
+    def call(_):
+        try:
+            client.generate("ping")
+            return None
+        except MeetingMindError as e:
+            return type(e).__name__
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        errors = [error for error in pool.map(call, range(calls)) if error]
+    return {
+        "ok": calls - len(errors),
+        "failed": ", ".join(f"{errors.count(name)} {name}" for name in sorted(set(errors))) or "0",
+        "served_429": server.rejected,
+        "requests": server.requests,
+        "retries": limiter.retries,
+        "circuit": limiter.breaker.state,
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=20, help="Calls per scenario")
+    parser.add_argument("--threads", type=int, default=4, help="Concurrent callers")
+    parser.add_argument("--throttled", type=int, default=6, help="Requests answered with 429 before recovering")
+    parser.add_argument("--retry-after", type=float, default=0.2, help="Retry-After sent with each 429 (seconds)")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ThrottlingHandler)
+    server.lock, server.retry_after = threading.Lock(), args.retry_after
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    limits = {
+        **load_model_config()["deepseek"].get("rate_limits", {}),
+        "backoff_base_seconds": 0.05,
+        "backoff_max_seconds": 1,
+        "circuit_reset_seconds": 2,
+    }
+    scenarios = [
+        ("transient 429s", args.throttled),
+        ("persistent 429s", args.calls * 100),
+    ]
+    print(f"{'scenario':>16} {'ok':>4} {'failed':>28} {'429s':>5} {'requests':>9} {'retries':>8} {'circuit':>10} {'s':>6}")
+    for name, throttled in scenarios:
+        client = DeepSeekV3Client(api_key="stand-in")
+        client.url = f"http://127.0.0.1:{server.server_address[1]}/api/v1/chat/completions"
+        client.rate_limiter = ProviderRateLimiter("stand-in", limits)
+        row = run(server, client, args.calls, args.threads, throttled)
+        print(
+            f"{name:>16} {row['ok']:>4} {row['failed']:>28} {row['served_429']:>5} {row['requests']:>9} "
+            f"{row['retries']:>8} {row['circuit']:>10} {row['seconds']:>6.2f}"
+        )
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
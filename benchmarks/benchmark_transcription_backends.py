@@ -0,0 +1,100 @@
+"""
+Compare transcription backends on a fixed local test set.
+
+The test set is a directory of audio files, each with a reference transcript
+of the same name and a .txt extension (e.g. standup.wav + standup.txt). Each
+backend runs in its own process, so its peak memory is measured in isolation.
+Reported per backend: model load time, real-time factor (decode time / audio
+duration, lower is faster), peak RSS and word error rate over the whole set.
+Peak RSS of the server and parallel backends excludes their worker processes.
+Requires openai-whisper and faster-whisper.
+
+Usage:
+    python benchmarks/benchmark_transcription_backends.py --test-set data/test_set
+    python benchmarks/benchmark_transcription_backends.py --test-set data/test_set --backends local,faster_whisper
+"""
+import sys
+import os
+import time
+import argparse
+import queue
+import multiprocessing as mp
+
+# --- Project path setup ---
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from benchmarks.utils import peak_rss_mb, load_test_set
+
+def run_backend(backend: str, test_set: list[tuple[str, str]], results):
+    """Child process: transcribe the test set with one backend and report metrics."""
+    from src.audio.loader import load_pcm, SAMPLE_RATE
+    from src.transcription.factory import create_transcriber
+    from src.transcription.utils import word_error_rate
+
+    # Decode all files first, so ffmpeg time is not charged to the backend
+    audio = [(load_pcm(path), reference) for path, reference in test_set]
+
+    start = time.perf_counter()
+    transcriber = create_transcriber(backend)
+    load_time = time.perf_counter() - start
+
+    duration = decode_time = 0.0
+    errors = words = 0.0
+    for samples, reference in audio:
+        start = time.perf_counter()
+        hypothesis = transcriber.transcribe(samples)
+        decode_time += time.perf_counter() - start
+        duration += len(samples) / SAMPLE_RATE
+
+        n_words = len(reference.split())
+        errors += word_error_rate(reference, hypothesis) * n_words
+        words += n_words
+
+    if hasattr(transcriber, "close"):
+        transcriber.close()
+    results.put({
+        "backend": backend,
+        "load_time": load_time,
+        "rtf": decode_time / duration,
+        "peak_rss_mb": peak_rss_mb(),
+        "wer": errors / max(words, 1),
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--test-set", required=True, help="Directory of audio files with .txt references")
+    parser.add_argument("--backends", default="local,faster_whisper", help="Comma-separated backends")
+    args = parser.parse_args()
+
+    test_set = load_test_set(args.test_set)
+    if not test_set:
+        sys.exit(f"No audio files with .txt references found in {args.test_set}")
+    print(f"Test set: {len(test_set)} files")
+    print(f"{'backend':>16} {'load (s)':>9} {'RTF':>7} {'peak RSS (MB)':>14} {'WER':>7}")
+
+    context = mp.get_context("spawn")
+    for backend in args.backends.split(","):
+        results = context.Queue()
+        process = context.Process(target=run_backend, args=(backend, test_set, results))
+        process.start()
+        row = None
+        while row is None and (process.is_alive() or not results.empty()):
+            try:
+                row = results.get(timeout=5)
+            except queue.Empty:
+                pass
+        process.join()
+        if row is None:
+            print(f"{backend:>16} failed (exit code {process.exitcode})")
+            continue
+        print(
+            f"{row['backend']:>16} {row['load_time']:>9.1f} {row['rtf']:>7.3f} "
+            f"{row['peak_rss_mb']:>14.0f} {row['wer']:>7.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
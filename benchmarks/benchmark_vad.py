@@ -0,0 +1,72 @@
+"""
+Benchmark the VAD stage: fraction of audio removed and transcription speedup.
+
+Without --audio, a synthetic meeting with quiet breaks is used. The
+end-to-end comparison needs openai-whisper; without it, only the VAD
+statistics are reported.
+
+Usage:
+    python benchmarks/benchmark_vad.py --minutes 10 --speech-fraction 0.5
+    python benchmarks/benchmark_vad.py --audio meeting.wav --model base
+"""
+import sys
+import os
+import time
+import argparse
+
+# --- Project path setup ---
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from benchmarks.utils import synthesize_meeting
+from src.audio.vad import trim_silence
+
+SAMPLE_RATE = 16000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--audio", help="Real recording to use instead of synthetic audio")
+    parser.add_argument("--minutes", type=float, default=10, help="Length of the synthetic meeting")
+    parser.add_argument("--speech-fraction", type=float, default=0.5, help="Speech share of the synthetic meeting")
+    parser.add_argument("--model", default="base", help="Whisper model size for the end-to-end comparison")
+    args = parser.parse_args()
+
+    if args.audio:
+        import whisper
+
+        audio = whisper.load_audio(args.audio)
+    else:
+        audio = synthesize_meeting(args.minutes * 60, sr=SAMPLE_RATE, speech_fraction=args.speech_fraction)
+    duration = len(audio) / SAMPLE_RATE
+
+    start = time.perf_counter()
+    condensed, _, regions = trim_silence(audio, SAMPLE_RATE)
+    vad_seconds = time.perf_counter() - start
+
+    removed = 1 - len(condensed) / len(audio)
+    print(f"Audio: {duration:.1f} s, {len(regions)} speech regions")
+    print(f"VAD: {vad_seconds * 1000:.1f} ms, removed {removed:.1%} of the audio")
+
+    try:
+        import whisper
+    except ImportError:
+        print("openai-whisper is not installed, skipping the end-to-end comparison")
+        return
+
+    model = whisper.load_model(args.model)
+    timings = {}
+    for name, buffer in (("full", audio), ("vad", condensed)):
+        start = time.perf_counter()
+        model.transcribe(buffer, fp16=False)
+        timings[name] = time.perf_counter() - start
+    timings["vad"] += vad_seconds
+
+    print(f"Transcription without VAD: {timings['full']:.1f} s (RTF {timings['full'] / duration:.3f})")
+    print(f"Transcription with VAD:    {timings['vad']:.1f} s (RTF {timings['vad'] / duration:.3f})")
+    print(f"End-to-end speedup: {timings['full'] / timings['vad']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
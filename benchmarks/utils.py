@@ -0,0 +1,134 @@
+from pathlib import Path
+import numpy as np
+import soundfile as sf
+
+AUDIO_EXTENSIONS = {".wav", ".mp3", ".flac", ".m4a", ".ogg"}
+
+
+def synthesize_noisy_speech(
+    seconds: float, sr: int = 16000, snr_db: float = 10.0, seed: int = 0, return_clean: bool = False
+):
+    """
+    Generate a speech-like signal mixed with stationary background noise.
+
+    The "speech" is a harmonic tone whose pitch drifts between 100 and 220 Hz,
+    gated by a syllable-rate envelope with regular pauses, which is enough to
+    exercise denoising, VAD and transcription timing without shipping audio files.
+
+    Args:
+        seconds (float): Duration of the signal.
+        sr (int, optional): Sampling rate in Hz. Defaults to 16000.
+        snr_db (float, optional): Speech-to-noise ratio in dB. Defaults to 10.
+        seed (int, optional): Seed for the noise generator. Defaults to 0.
+        return_clean (bool, optional): Also return the noise-free signal,
+                                       scaled like the noisy one. Defaults to False.
+
+    Returns:
+        np.ndarray | tuple: Mono float32 signal in the range [-1, 1], or
+                            (noisy, clean) when `return_clean` is True.
+    """
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(seconds * sr)) / sr
+
+    f0 = 160 + 60 * np.sin(2 * np.pi * 0.3 * t)
+    phase = 2 * np.pi * np.cumsum(f0) / sr
+    speech = sum(np.sin(k * phase) / k for k in range(1, 6))
+
+    syllables = np.clip(np.sin(2 * np.pi * 4 * t), 0, None)
+    pauses = (np.sin(2 * np.pi * 0.1 * t) > -0.5).astype(float)
+    speech *= syllables * pauses
+
+    noise = rng.standard_normal(len(t))
+    speech_power = np.mean(speech ** 2) + 1e-12
+    noise *= np.sqrt(speech_power / (10 ** (snr_db / 10)))
+
+    y = speech + noise
+    scale = 0.5 / (np.max(np.abs(y)) + 1e-12)
+    noisy = (scale * y).astype(np.float32)
+    if return_clean:
+        return noisy, (scale * speech).astype(np.float32)
+    return noisy
+
+
+def synthesize_meeting(seconds: float, sr: int = 16000, speech_fraction: float = 0.5, seed: int = 0) -> np.ndarray:
+    """
+    Generate a meeting-like recording: speech turns separated by quiet breaks.
+
+    Turn and break lengths are drawn at random so that roughly `speech_fraction`
+    of the recording is speech; breaks contain only low-level background noise.
+
+    Args:
+        seconds (float): Duration of the recording.
+        sr (int, optional): Sampling rate in Hz. Defaults to 16000.
+        speech_fraction (float, optional): Expected fraction of speech. Defaults to 0.5.
+        seed (int, optional): Seed for the random generator. Defaults to 0.
+
+    Returns:
+        np.ndarray: Mono float32 signal.
+    """
+    rng = np.random.default_rng(seed)
+    pieces, total = [], 0
+    while total < seconds * sr:
+        turn = rng.uniform(3, 20)
+        pause = turn * (1 - speech_fraction) / speech_fraction * rng.uniform(0.5, 1.5)
+        pieces.append(synthesize_noisy_speech(turn, sr=sr, snr_db=25, seed=len(pieces)))
+        pieces.append((0.002 * rng.standard_normal(int(pause * sr))).astype(np.float32))
+        total += len(pieces[-2]) + len(pieces[-1])
+    return np.concatenate(pieces)[: int(seconds * sr)]
+
+
+def write_synthetic_recording(path: str, seconds: float, sr: int = 16000, snr_db: float = 10.0, chunk_seconds: float = 60.0) -> str:
+    """
+    Write a long synthetic noisy recording to disk chunk by chunk.
+
+    Args:
+        path (str): Destination audio file (format inferred from the extension).
+        seconds (float): Total duration of the recording.
+        sr (int, optional): Sampling rate in Hz. Defaults to 16000.
+        snr_db (float, optional): Speech-to-noise ratio in dB. Defaults to 10.
+        chunk_seconds (float, optional): Duration generated per chunk. Defaults to 60.
+
+    Returns:
+        str: Path to the written file.
+    """
+    with sf.SoundFile(path, "w", samplerate=sr, channels=1) as f:
+        written, seed = 0.0, 0
+        while written < seconds:
+            length = min(chunk_seconds, seconds - written)
+            f.write(synthesize_noisy_speech(length, sr=sr, snr_db=snr_db, seed=seed))
+            written += length
+            seed += 1
+    return str(path)
+
+
+def peak_rss_mb() -> float:
+    """
+    Return the peak resident set size of the current process in MB.
+
+    Returns:
+        float: Peak RSS in megabytes.
+    """
+    import resource
+    import sys
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes on Linux
+    return peak / (1024 ** 2) if sys.platform == "darwin" else peak / 1024
+
+
+def load_test_set(directory: str) -> list[tuple[str, str]]:
+    """
+    Load a transcription test set: audio files with same-named .txt references.
+
+    Args:
+        directory (str): Directory holding e.g. standup.wav and standup.txt.
+
+    Returns:
+        list[tuple[str, str]]: (audio path, reference transcript) pairs, sorted by name.
+    """
+    pairs = []
+    for audio in sorted(Path(directory).iterdir()):
+        reference = audio.with_suffix(".txt")
+        if audio.suffix.lower() in AUDIO_EXTENSIONS and reference.exists():
+            pairs.append((str(audio), reference.read_text(encoding="utf-8")))
+    return pairs
@@ -1,14 +1,36 @@
+import copy
+import threading
 import yaml
 from pathlib import Path
 
 BASE_CONFIG_PATH = Path(__file__).resolve().parents[1] / "config"
 
+# Parsed YAML files, reloaded when the file changes on disk: {path: (mtime_ns, data)}
+_CACHE = {}
+_CACHE_LOCK = threading.Lock()
+
+
+def _load_yaml(name: str):
+    """
+    Return a parsed config file, parsing it only when it changed since the last call.
+
+    Each call returns its own deep copy, so callers may modify the result
+    without affecting other callers.
+    """
+    path = BASE_CONFIG_PATH / name
+    mtime = path.stat().st_mtime_ns
+    with _CACHE_LOCK:
+        cached = _CACHE.get(path)
+        if cached is None or cached[0] != mtime:
+            with open(path, "r", encoding="utf-8") as f:
+                cached = (mtime, yaml.safe_load(f))
+            _CACHE[path] = cached
+    return copy.deepcopy(cached[1])
+
 
 def load_model_config():
-    with open(BASE_CONFIG_PATH / "model_config.yaml", "r") as f:
-        return yaml.safe_load(f)
+    return _load_yaml("model_config.yaml")
 
 
 def load_prompt_config():
-    with open(BASE_CONFIG_PATH / "prompt_templates.yaml", "r") as f:
-        return yaml.safe_load(f)
\ No newline at end of file
+    return _load_yaml("prompt_templates.yaml")
@@ -0,0 +1,179 @@
+import sys
+import os
+from pathlib import Path
+import logging
+from dotenv import load_dotenv
+from pydantic import ValidationError
+
+from src.prompt_engineering.templates import load_prompt_template, build_prompt
+from src.handlers.error_handler import handle_errors, MeetingMindError
+from langchain_core.output_parsers import JsonOutputParser
+from src.llm.analysis_client import build_analysis_client
+from src.llm.base_llm_client import generate_many
+from src.analysis.summarizer import MeetingSummarizer
+from src.analysis.task_extractor import TaskExtractor, TaskList
+from src.analysis.sentiment_analyzer import SentimentAnalyzer
+from src.research.topic_extractor import TopicExtractor
+
+
+# Load environment variables from .env
+load_dotenv()
+
+# Ensure project root is available for imports
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+SECTIONS = ("summary", "tasks", "sentiment", "topic")
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s"
+)
+
+
+class CombinedAnalyzer:
+    """
+    CombinedAnalyzer produces the summary, tasks, sentiment and topic of a
+    meeting with a single LLM request, so the transcript is sent once instead
+    of once per analysis.
+
+    Each section of the joint response is validated on its own (tasks with the
+    `TaskList` model). Sections that are missing or invalid are recomputed with
+    the per-stage analyzer, so one bad section does not cost the whole meeting.
+
+    Responsibilities:
+    - Format the "combined_analysis" prompt and send it to the LLM.
+    - Validate each section of the JSON response.
+    - Fall back to per-stage calls for the sections that fail validation.
+    """
+
+    def __init__(self, client=None):
+        """
+        Initialize CombinedAnalyzer.
+
+        Args:
+            client (optional): Custom LLM client instance (e.g., DeepSeekV3Client).
+                If None, uses the default analysis client (see `build_analysis_client`).
+                The per-stage fallbacks use the same client.
+        """
+        self.parser = JsonOutputParser()
+        self.prompt_template = load_prompt_template("combined_analysis")
+        self.client = build_analysis_client("combined_analyzer", client)
+
+        self.summarizer = MeetingSummarizer(client)
+        self.task_extractor = TaskExtractor(client)
+        self.sentiment_analyzer = SentimentAnalyzer(client)
+        self.topic_extractor = TopicExtractor(client)
+        # Sections recomputed per stage in the latest analysis
+        self.last_fallbacks = []
+
+    @handle_errors("Failed to analyze meeting")
+    def analyze(self, transcript: str) -> dict:
+        """
+        Analyze a transcript with one combined request, falling back per section.
+
+        Args:
+            transcript (str): Raw meeting transcript text.
+
+        Returns:
+            dict: {"summary": str, "tasks": list[dict], "sentiment": dict, "topic": str}, each
+                  section shaped like the result of its per-stage analyzer (or its error dict).
+        """
+        try:
+            prompt, options = self._format_prompt(transcript)
+            data = self.client.generate(prompt=prompt, output_parser=self.parser, json_output=True, **options)
+        except Exception as e:
+            logging.warning(f"Combined analysis request failed, using per-stage calls: {e}")
+            data = None
+
+        results, failed = self._validate(transcript, data)
+        fallbacks = {
+            "summary": self.summarizer.summarize,
+            "tasks": self.task_extractor.extract_tasks,
+            "sentiment": self.sentiment_analyzer.analyze_sentiment,
+            "topic": self.topic_extractor.extract_topic,
+        }
+        for section in failed:
+            results[section] = fallbacks[section](transcript)
+        return results
+
+    @handle_errors("Failed to analyze meeting")
+    async def aanalyze(self, transcript: str) -> dict:
+        """
+        Analyze a transcript without blocking the event loop; fallbacks run concurrently.
+
+        Args:
+            transcript (str): Raw meeting transcript text.
+
+        Returns:
+            dict: Sections as returned by `analyze`.
+        """
+        try:
+            prompt, options = self._format_prompt(transcript)
+            data = await self.client.agenerate(prompt=prompt, output_parser=self.parser, json_output=True, **options)
+        except Exception as e:
+            logging.warning(f"Combined analysis request failed, using per-stage calls: {e}")
+            data = None
+
+        results, failed = self._validate(transcript, data)
+        fallbacks = {
+            "summary": self.summarizer.asummarize,
+            "tasks": self.task_extractor.aextract_tasks,
+            "sentiment": self.sentiment_analyzer.aanalyze_sentiment,
+            "topic": self.topic_extractor.aextract_topic,
+        }
+        outputs = await generate_many([fallbacks[section](transcript) for section in failed])
+        results.update(zip(failed, outputs))
+        return results
+
+    def _format_prompt(self, transcript: str) -> tuple[str, dict]:
+        """Return the prompt and client options for the configured prompt layout (see `build_prompt`)."""
+        return build_prompt(self.prompt_template, transcript)
+
+    def _validate(self, transcript: str, data) -> tuple[dict, list[str]]:
+        """
+        Validate each section of the combined response.
+
+        Args:
+            transcript (str): Transcript the response was generated for.
+            data: Parsed response (raw text if JSON parsing failed).
+
+        Returns:
+            tuple: (valid sections, names of the sections that need a per-stage call).
+        """
+        if not isinstance(data, dict):
+            data = {}
+        results = {}
+
+        summary = data.get("summary")
+        if isinstance(summary, list):
+            summary = "\n".join(f"- {point}" for point in summary if isinstance(point, str))
+        if isinstance(summary, str) and summary.strip():
+            results["summary"] = summary
+
+        try:
+            tasks = TaskList.model_validate({"tasks": data.get("tasks")})
+            results["tasks"] = [task.dict() for task in tasks.tasks]
+        except ValidationError:
+            pass
+
+        sentiment = data.get("sentiment")
+        if (
+            isinstance(sentiment, dict)
+            and isinstance(sentiment.get("overall_sentiment"), str)
+            and isinstance(sentiment.get("emotions"), list)
+        ):
+            results["sentiment"] = self.sentiment_analyzer._to_sentiment_data(transcript, sentiment)
+
+        topic = data.get("topic")
+        if isinstance(topic, str) and topic.strip():
+            results["topic"] = topic.strip()
+
+        failed = [section for section in SECTIONS if section not in results]
+        self.last_fallbacks = failed
+        if failed:
+            logging.warning(f"Combined analysis invalid for {', '.join(failed)}; using per-stage calls")
+        else:
+            logging.info("Combined analysis complete")
+        return results, failed
@@ -5,11 +5,11 @@ import logging
 import json
 from dotenv import load_dotenv
 
-from src.prompt_engineering.templates import load_prompt_template
+from src.prompt_engineering.templates import load_prompt_template, build_prompt
 from src.handlers.error_handler import handle_errors, MeetingMindError
-from langchain_core.prompts import PromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
-from src.llm.deepseek_client import DeepSeekV3Client
+from src.llm.analysis_client import build_analysis_client
+from src.llm.structured_output import extract_json
 
 
 
@@ -51,11 +51,11 @@ class SentimentAnalyzer:
 
         Args:
             client (optional): Custom LLM client instance (e.g., DeepSeekV3Client). 
-                If None, initializes DeepSeekV3Client with API key from environment (OPENROUTER_API_KEY).
+                If None, uses the default analysis client (see `build_analysis_client`).
         """
         self.parser = JsonOutputParser()
         self.prompt_template = load_prompt_template("sentiment_analysis")
-        self.client = client or DeepSeekV3Client(api_key=os.getenv("OPENROUTER_API_KEY"))
+        self.client = build_analysis_client("sentiment_analyzer", client)
 
 
     @handle_errors("Failed analyzing sentiment")
@@ -64,9 +64,8 @@ class SentimentAnalyzer:
         Analyze the emotional tone and sentiment of a meeting transcript.
 
         This method sends the transcript to the LLM using a sentiment
-        analysis prompt template and attempts to parse the response as JSON.
-        If parsing fails, a fallback structure containing the raw text and
-        AI output is returned.
+        analysis prompt template in JSON mode. Malformed or truncated JSON
+        is repaired by the client (see `src.llm.structured_output`).
 
         Args:
             transcript (str): Raw meeting transcript text.
@@ -74,27 +73,67 @@ class SentimentAnalyzer:
         Returns:
             dict: Structured sentiment analysis result. Example:
                 {
-                    "overall_sentiment": "neutral",
-                    "sentiment_score": 0.2,
-                    "emotions": ["concern"]
+                    "text": "<transcript>",
+                    "sentiment": {
+                        "overall_sentiment": "neutral",
+                        "emotions": ["concern"]
+                    }
                 }
 
         Raises:
             MeetingMindError:
-                If an unexpected error occurs during processing.
+                If the response is not a valid sentiment object or an unexpected error occurs.
         """
-        prompt = PromptTemplate(
-            template=self.prompt_template,
-            input_variables=["transcript"]
-        )
-    
-        prompt = prompt.format(transcript=transcript)
-        text = self.client.generate(prompt=prompt, output_parser=self.parser)
-
-        try:
-            sentiment_data  = json.loads(text)
-        except Exception :
-            sentiment_data = {"text" : transcript , "sentiment": text}
+        prompt, options = self._format_prompt(transcript)
+        text = self.client.generate(prompt=prompt, output_parser=self.parser, json_output=True, **options)
+        return self._to_sentiment_data(transcript, text)
+
+    @handle_errors("Failed analyzing sentiment")
+    async def aanalyze_sentiment(self, transcript: str) -> dict:
+        """
+        Analyze the sentiment of a meeting transcript without blocking the event loop.
+
+        Args:
+            transcript (str): Raw meeting transcript text.
+
+        Returns:
+            dict: Structured sentiment analysis result, as returned by `analyze_sentiment`.
+        """
+        prompt, options = self._format_prompt(transcript)
+        text = await self.client.agenerate(prompt=prompt, output_parser=self.parser, json_output=True, **options)
+        return self._to_sentiment_data(transcript, text)
+
+    def _format_prompt(self, transcript: str) -> tuple[str, dict]:
+        """Return the prompt and client options for the configured prompt layout (see `build_prompt`)."""
+        return build_prompt(self.prompt_template, transcript)
+
+    def _to_sentiment_data(self, transcript: str, sentiment) -> dict:
+        """
+        Normalize a sentiment response into the result structure.
+
+        Args:
+            transcript (str): Transcript the sentiment was analyzed for.
+            sentiment: Parsed sentiment object, or text containing one.
+
+        Returns:
+            dict: {"text": transcript, "sentiment": {"overall_sentiment": str, "emotions": list, ...}}
+
+        Raises:
+            MeetingMindError: If the response is not a sentiment object.
+        """
+        if isinstance(sentiment, str):
+            try:
+                sentiment = extract_json(sentiment)
+            except ValueError as e:
+                raise MeetingMindError(f"Sentiment response is not JSON: {e}")
+        if not isinstance(sentiment, dict) or not isinstance(sentiment.get("overall_sentiment"), str):
+            raise MeetingMindError(f"Sentiment response has no overall_sentiment: {str(sentiment)[:200]}")
+
+        emotions = sentiment.get("emotions") or []
+        sentiment_data = {
+            "text": transcript,
+            "sentiment": {**sentiment, "emotions": emotions if isinstance(emotions, list) else [emotions]},
+        }
 
         logging.info("Sentiment analysis complete")
         return sentiment_data
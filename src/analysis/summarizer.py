@@ -4,11 +4,10 @@ from pathlib import Path
 import logging
 from dotenv import load_dotenv
 
-from src.prompt_engineering.templates import load_prompt_template
+from src.prompt_engineering.templates import load_prompt_template, build_prompt
 from src.handlers.error_handler import handle_errors, MeetingMindError
-from langchain_core.prompts import PromptTemplate
 from langchain_core.output_parsers import StrOutputParser
-from src.llm.deepseek_client import DeepSeekV3Client
+from src.llm.analysis_client import build_analysis_client
 
 
 # Load environment variables from .env
@@ -48,11 +47,11 @@ class MeetingSummarizer:
 
         Args:
             client (optional): Custom LLM client instance (e.g., DeepSeekV3Client). 
-                If None, initializes DeepSeekV3Client with API key from environment (OPENROUTER_API_KEY).
+                If None, uses the default analysis client (see `build_analysis_client`).
         """
         self.parser = StrOutputParser()
         self.prompt_template = load_prompt_template("summarization")
-        self.client = client or DeepSeekV3Client(api_key=os.getenv("OPENROUTER_API_KEY"))
+        self.client = build_analysis_client("summarizer", client)
 
 
     @handle_errors("Failed to summarize transcript")
@@ -70,17 +69,47 @@ class MeetingSummarizer:
             MeetingMindError: If summarization fails unexpectedly.
         """
 
-        prompt = PromptTemplate(
-            template=self.prompt_template,
-            input_variables=["transcript"]
-        )
-    
-        prompt = prompt.format(transcript=transcript)
-        summary = self.client.generate(prompt , self.parser)
-        
+        prompt, options = self._format_prompt(transcript)
+        summary = self.client.generate(prompt, self.parser, **options)
+
         logging.info("Summary generated successfully")
         return summary
 
+    @handle_errors("Failed to summarize transcript")
+    async def asummarize(self, transcript: str) -> str:
+        """
+        Generate a structured summary without blocking the event loop.
+
+        Args:
+            transcript (str): Full meeting transcript.
+
+        Returns:
+            str: AI-generated summary in structured bullet format.
+        """
+        prompt, options = self._format_prompt(transcript)
+        summary = await self.client.agenerate(prompt, self.parser, **options)
+
+        logging.info("Summary generated successfully")
+        return summary
+
+    def stream_summary(self, transcript: str):
+        """
+        Generate a structured summary and yield it piece by piece as it is generated.
+
+        Args:
+            transcript (str): Full meeting transcript.
+
+        Yields:
+            str: Successive pieces of the summary.
+        """
+        prompt, options = self._format_prompt(transcript)
+        yield from self.client.stream(prompt, **options)
+        logging.info("Summary generated successfully")
+
+    def _format_prompt(self, transcript: str) -> tuple[str, dict]:
+        """Return the prompt and client options for the configured prompt layout (see `build_prompt`)."""
+        return build_prompt(self.prompt_template, transcript)
+
     def save_summary(self, summary: str, output_file: str = None) -> str:
         """
         Save the summary text to a file.
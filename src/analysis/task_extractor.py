@@ -5,10 +5,10 @@ import re
 import json
 import logging
 from dotenv import load_dotenv
-from src.prompt_engineering.templates import load_prompt_template
+from src.prompt_engineering.templates import load_prompt_template, build_prompt
 from src.handlers.error_handler import handle_errors, MeetingMindError
-from src.llm.deepseek_client import DeepSeekV3Client
-from langchain_core.prompts import PromptTemplate
+from src.llm.analysis_client import build_analysis_client
+from src.llm.structured_output import extract_json
 from langchain.output_parsers import PydanticOutputParser
 from pydantic import BaseModel, Field 
 from typing import Optional, List
@@ -60,11 +60,11 @@ class TaskExtractor:
 
         Args:
             client (optional): Custom LLM client instance (e.g., DeepSeekV3Client). 
-                If None, initializes DeepSeekV3Client with API key from environment (OPENROUTER_API_KEY).
+                If None, uses the default analysis client (see `build_analysis_client`).
         """
         self.parser = PydanticOutputParser(pydantic_object=TaskList)
         self.prompt_template = load_prompt_template("task_extraction")
-        self.client = client or DeepSeekV3Client(api_key=os.getenv("OPENROUTER_API_KEY"))
+        self.client = build_analysis_client("task_extractor", client)
 
 
     @handle_errors("Failed to extract tasks")
@@ -92,18 +92,61 @@ class TaskExtractor:
                 If task extraction fails unexpectedly.
         """
 
-        prompt = PromptTemplate(
-            template=self.prompt_template,
-            input_variables=["transcript"],
-            partial_variables={"format_instructions" : self.parser.get_format_instructions()}
+        prompt, options = self._format_prompt(transcript)
+        tasks = self._to_task_list(
+            self.client.generate(prompt=prompt, output_parser=self.parser, json_output=True, **options)
         )
-    
-        prompt = prompt.format(transcript=transcript)
 
-        tasks = self.client.generate(prompt=prompt, output_parser=self.parser)
+        logging.info(f"Extracted {len(tasks.tasks)} tasks")
+        return [task.dict() for task in tasks.tasks]
+
+    @handle_errors("Failed to extract tasks")
+    async def aextract_tasks(self, transcript: str) -> list[dict]:
+        """
+        Extract actionable tasks from a transcript without blocking the event loop.
+
+        Args:
+            transcript (str): Raw meeting transcript text.
+
+        Returns:
+            list[dict]: Task dictionaries, as returned by `extract_tasks`.
+        """
+        prompt, options = self._format_prompt(transcript)
+        tasks = self._to_task_list(
+            await self.client.agenerate(prompt=prompt, output_parser=self.parser, json_output=True, **options)
+        )
 
         logging.info(f"Extracted {len(tasks.tasks)} tasks")
         return [task.dict() for task in tasks.tasks]
+
+    @staticmethod
+    def _to_task_list(tasks) -> TaskList:
+        """
+        Normalize a task response into a TaskList.
+
+        Clients return a TaskList when the parser was applied, but a custom
+        client may return a dict, a bare list of tasks or text.
+
+        Raises:
+            MeetingMindError: If the response does not describe a task list.
+        """
+        if isinstance(tasks, TaskList):
+            return tasks
+        try:
+            if isinstance(tasks, str):
+                tasks = extract_json(tasks)
+            if isinstance(tasks, list):
+                tasks = {"tasks": tasks}
+            return TaskList.model_validate(tasks)
+        except ValueError as e:
+            # pydantic's ValidationError is a ValueError
+            raise MeetingMindError(f"Task response is not a valid task list: {e}")
+
+    def _format_prompt(self, transcript: str) -> tuple[str, dict]:
+        """Return the prompt and client options for the configured prompt layout (see `build_prompt`)."""
+        return build_prompt(
+            self.prompt_template, transcript, format_instructions=self.parser.get_format_instructions()
+        )
     
     def save_tasks(self, tasks: list[dict], output_file: str = None) -> str:
         """
@@ -1,12 +1,18 @@
 from pathlib import Path
+import inspect
 import librosa
+import numpy as np
 import soundfile as sf
 import noisereduce as nr
 import logging
+import threading
+import time
 import sys
 import os
 
 from src.handlers.error_handler import handle_errors, MeetingMindError
+from src.audio.loader import load_pcm, SAMPLE_RATE
+from config.config_loader import load_model_config
 
 # --- Project path setup ---
 # Ensure project root is in sys.path for absolute imports
@@ -17,12 +23,141 @@ if str(PROJECT_ROOT) not in sys.path:
 PROCESSED_AUDIO_DIR = PROJECT_ROOT / "data" / "processed_audio"
 PROCESSED_AUDIO_DIR.mkdir(parents=True, exist_ok=True)
 
+# Length of the analysis frames used to locate the quietest part of a recording
+NOISE_FRAME_SECONDS = 0.05
+
+# Counters of adaptive enhancement decisions across all calls in this process
+_STATS_LOCK = threading.Lock()
+_ENHANCEMENT_STATS = {
+    "denoise": 0,
+    "light": 0,
+    "skip": 0,
+    "audio_seconds": {"denoise": 0.0, "light": 0.0, "skip": 0.0},
+    "estimate_seconds": 0.0,
+    "enhance_seconds": {"denoise": 0.0, "light": 0.0},
+}
+
 # Logging configuration
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
 
+def _resolve_output_path(input_path: Path, output_file: str = None) -> Path:
+    """
+    Build the output path for an enhanced audio file.
+
+    Args:
+        input_path (Path): Path of the source audio file.
+        output_file (str, optional): Explicit output path.
+
+    Returns:
+        Path: Explicit output path, or (data / processed_audio /{input_file_stem}_clean.wav).
+    """
+    if output_file is None:
+        return PROCESSED_AUDIO_DIR / (input_path.stem + "_clean.wav")
+    return Path(output_file)
+
+
+def estimate_noise_clip(y: np.ndarray, sr: int, clip_seconds: float = 2.0) -> np.ndarray:
+    """
+    Build a noise profile from the quietest frames of a mono signal.
+
+    The signal is split into short frames, and the lowest-energy frames are
+    concatenated (in their original order) until `clip_seconds` of audio is collected.
+
+    Args:
+        y (np.ndarray): Mono audio signal.
+        sr (int): Sampling rate of the signal.
+        clip_seconds (float, optional): Duration of the noise clip. Defaults to 2.0.
+
+    Returns:
+        np.ndarray: Noise clip suitable for `noisereduce.reduce_noise(y_noise=...)`.
+    """
+    frame_length = max(1, int(NOISE_FRAME_SECONDS * sr))
+    n_frames = len(y) // frame_length
+    if n_frames == 0:
+        return y.astype(np.float32)
+
+    frames = y[: n_frames * frame_length].reshape(n_frames, frame_length)
+    energy = np.einsum("ij,ij->i", frames, frames)
+
+    n_keep = min(n_frames, max(1, int(clip_seconds / NOISE_FRAME_SECONDS)))
+    quietest = np.sort(np.argpartition(energy, n_keep - 1)[:n_keep])
+    return frames[quietest].reshape(-1).astype(np.float32)
+
+
+def load_enhancement_preset(preset: str = None) -> dict:
+    """
+    Load the noise-reduction options of a named enhancement preset.
+
+    Args:
+        preset (str, optional): Preset name (e.g. "standard", "fast", "balanced", "quality").
+                                Defaults to the `audio.enhancement.preset` config value.
+
+    Returns:
+        dict: Keyword arguments for `noisereduce.reduce_noise`.
+
+    Raises:
+        MeetingMindError: If the preset is not defined in the config file.
+    """
+    config = load_model_config().get("audio", {}).get("enhancement", {})
+    presets = config.get("presets", {})
+    preset = preset or config.get("preset", "standard")
+
+    if preset not in presets:
+        raise MeetingMindError(f"Unknown enhancement preset '{preset}'. Available: {', '.join(presets)}")
+
+    return dict(presets[preset])
+
+
+def enhancement_settings(adaptive: bool = True) -> dict:
+    """
+    Return the settings that change the output of `enhance_audio_to_array`.
+
+    Used to key cached transcripts of enhanced audio by the original recording.
+
+    Args:
+        adaptive (bool, optional): Whether adaptive enhancement is used. Defaults to True.
+
+    Returns:
+        dict: JSON-serializable enhancement settings.
+    """
+    config = load_model_config().get("audio", {}).get("enhancement", {})
+    return {
+        "preset": config.get("preset", "standard"),
+        "presets": config.get("presets", {}),
+        "adaptive": config.get("adaptive", {}) if adaptive else None,
+        "noise_scan_seconds": config.get("noise_scan_seconds", 30),
+        "noise_profile_seconds": config.get("noise_profile_seconds", 2),
+    }
+
+
+def reduce_noise(y: np.ndarray, sr: int, preset: str = None) -> np.ndarray:
+    """
+    Denoise a mono signal in memory using an enhancement preset.
+
+    Stationary presets use a noise profile taken from the quietest frames of the
+    first `noise_scan_seconds` of the signal instead of the whole signal.
+
+    Args:
+        y (np.ndarray): Mono audio signal.
+        sr (int): Sampling rate of the signal.
+        preset (str, optional): Enhancement preset name. Defaults to the config value.
+
+    Returns:
+        np.ndarray: Denoised signal.
+    """
+    config = load_model_config().get("audio", {}).get("enhancement", {})
+    options = load_enhancement_preset(preset)
+
+    if options.get("stationary", False):
+        head = y[: int(config.get("noise_scan_seconds", 30) * sr)]
+        options["y_noise"] = estimate_noise_clip(head, sr, config.get("noise_profile_seconds", 2))
+
+    return nr.reduce_noise(y=y, sr=sr, **options)
+
+
 @handle_errors("Failed to enhance audio")
-def enhance_audio(input_file: str, output_file: str = None) -> str:
+def enhance_audio(input_file: str, output_file: str = None, preset: str = None) -> str:
     """
     Enhance audio quality by reducing background noise.
 
@@ -30,6 +165,8 @@ def enhance_audio(input_file: str, output_file: str = None) -> str:
         input_file (str): Path to the input audio file (WAV or other supported formats).
         output_file (str, optional): Path to save the enhanced audio file.
                                     Defaults to (data / processed_audio /{input_file_stem}_clean.wav).
+        preset (str, optional): Enhancement preset ("standard", "fast", "balanced", "quality").
+                                Defaults to the `audio.enhancement.preset` config value.
 
     Returns:
         str: Path to the processed (denoised) audio file.
@@ -38,22 +175,328 @@ def enhance_audio(input_file: str, output_file: str = None) -> str:
     if not input_path.exists():
         raise FileNotFoundError(f"{input_file} not found")
 
-    logging.info(f"Enhancing audio: {input_file}")
+    logging.info(f"Enhancing audio: {input_file} (preset: {preset or 'default'})")
 
     # Load audio
     y, sr = librosa.load(input_path, sr=None)
 
     # Apply noise reduction
-    y_denoised = nr.reduce_noise(y=y, sr=sr)
+    y_denoised = reduce_noise(y, sr, preset)
 
     # Determine output path
-    if output_file is None:
-        output_file = PROCESSED_AUDIO_DIR / (input_path.stem + "_clean.wav")
-    else:
-        output_file = Path(output_file)
+    output_file = _resolve_output_path(input_path, output_file)
 
     # Save processed audio
     sf.write(output_file, y_denoised, sr)
 
     logging.info(f"Audio enhancement complete: {output_file}")
     return str(output_file)
+
+
+@handle_errors("Failed to enhance audio in streaming mode")
+def enhance_audio_streaming(input_file: str, output_file: str = None, preset: str = None) -> str:
+    """
+    Enhance a long recording chunk by chunk with bounded memory.
+
+    `noisereduce` already denoises long signals in chunks of `chunk_size`
+    samples, each with `padding` samples of context on both sides. This
+    function reads exactly those padded chunks from the file with `soundfile`
+    instead of loading the whole recording, and writes each denoised chunk to
+    the output file incrementally, so peak memory depends on the chunk size only.
+    For stationary presets, the noise profile is estimated once from the quietest
+    frames at the start of the recording, as in `reduce_noise`.
+
+    The output is therefore identical to `enhance_audio` with the same preset
+    (for mono input; multi-channel input is downmixed like `librosa.load`).
+
+    Args:
+        input_file (str): Path to the input audio file.
+        output_file (str, optional): Path to save the enhanced audio file.
+                                    Defaults to (data / processed_audio /{input_file_stem}_clean.wav).
+        preset (str, optional): Enhancement preset name. Defaults to the config value.
+                                Its chunk_size/padding options (or noisereduce's defaults)
+                                set the chunks read; n_jobs is ignored.
+
+    Returns:
+        str: Path to the processed (denoised) audio file.
+    """
+    input_path = Path(input_file)
+    if not input_path.exists():
+        raise FileNotFoundError(f"{input_file} not found")
+
+    config = load_model_config().get("audio", {}).get("enhancement", {})
+    noise_scan_seconds = config.get("noise_scan_seconds", 30)
+    noise_profile_seconds = config.get("noise_profile_seconds", 2)
+
+    options = load_enhancement_preset(preset)
+    options.pop("n_jobs", None)
+    defaults = inspect.signature(nr.reduce_noise).parameters
+    chunk_size = options.pop("chunk_size", defaults["chunk_size"].default)
+    padding = options.pop("padding", defaults["padding"].default)
+
+    output_file = _resolve_output_path(input_path, output_file)
+    logging.info(f"Enhancing audio (streaming): {input_file}")
+
+    with sf.SoundFile(input_path) as source:
+        sr, total = source.samplerate, source.frames
+
+        # Estimate the noise profile once from the beginning of the recording
+        if options.get("stationary", False):
+            head = source.read(int(noise_scan_seconds * sr), dtype="float32", always_2d=True)
+            options["y_noise"] = estimate_noise_clip(head.mean(axis=1), sr, noise_profile_seconds)
+            del head
+
+        # noisereduce pads every chunk to the same length, or the whole signal when it fits in one chunk
+        length = chunk_size if total > chunk_size else total
+
+        with sf.SoundFile(output_file, "w", samplerate=sr, channels=1) as sink:
+            for start in range(0, total, chunk_size):
+                # Chunk with its context on both sides, zero-padded past the ends of the file
+                first, last = max(0, start - padding), min(total, start + length + padding)
+                source.seek(first)
+                data = source.read(last - first, dtype="float32", always_2d=True).mean(axis=1)
+                padded = np.zeros(length + 2 * padding, dtype=np.float32)
+                offset = first - (start - padding)
+                padded[offset:offset + len(data)] = data
+
+                # The context is already included: denoise in one piece without extra padding
+                y_denoised = nr.reduce_noise(y=padded, sr=sr, chunk_size=len(padded), padding=0, **options)
+                sink.write(y_denoised[padding:padding + min(length, total - start)].astype(np.float32))
+
+    logging.info(f"Audio enhancement complete: {output_file}")
+    return str(output_file)
+
+
+def estimate_snr(input_file: str, n_windows: int = 16, window_seconds: float = 1.0) -> dict:
+    """
+    Estimate the SNR and noise floor of a recording from a sample of frames.
+
+    Only `n_windows` short windows spread evenly over the file are read (by
+    seeking), so the cost does not grow with the length of the recording. The
+    windows are split into frames; the 10th percentile of frame energy is taken
+    as the noise floor and the 95th percentile as the speech level.
+
+    Args:
+        input_file (str): Path to the audio file.
+        n_windows (int, optional): Number of windows to sample. Defaults to 16.
+        window_seconds (float, optional): Length of each window. Defaults to 1.0.
+
+    Returns:
+        dict: {"snr_db": float, "noise_floor_db": float, "duration": float (seconds)}
+    """
+    with sf.SoundFile(input_file) as source:
+        sr, total = source.samplerate, source.frames
+        window = min(total, int(window_seconds * sr))
+        starts = np.linspace(0, max(total - window, 0), num=n_windows, dtype=np.int64)
+
+        samples = []
+        for start in np.unique(starts):
+            source.seek(int(start))
+            samples.append(source.read(window, dtype="float32", always_2d=True).mean(axis=1))
+
+    return _snr_from_samples(np.concatenate(samples), sr, total / sr)
+
+
+def estimate_snr_array(y: np.ndarray, sr: int, n_windows: int = 16, window_seconds: float = 1.0) -> dict:
+    """
+    Estimate the SNR and noise floor of an in-memory (or memory-mapped) signal.
+
+    Same estimator as `estimate_snr`, reading only the sampled windows of `y`.
+
+    Args:
+        y (np.ndarray): Mono audio signal.
+        sr (int): Sampling rate of the signal.
+        n_windows (int, optional): Number of windows to sample. Defaults to 16.
+        window_seconds (float, optional): Length of each window. Defaults to 1.0.
+
+    Returns:
+        dict: {"snr_db": float, "noise_floor_db": float, "duration": float (seconds)}
+    """
+    window = min(len(y), int(window_seconds * sr))
+    starts = np.unique(np.linspace(0, max(len(y) - window, 0), num=n_windows, dtype=np.int64))
+    samples = np.concatenate([np.asarray(y[start: start + window], dtype=np.float32) for start in starts])
+    return _snr_from_samples(samples, sr, len(y) / sr)
+
+
+def _snr_from_samples(y: np.ndarray, sr: int, duration: float) -> dict:
+    """Noise floor (10th percentile) and speech level (95th percentile) of frame energy."""
+    frame_length = max(1, int(NOISE_FRAME_SECONDS * sr))
+    n_frames = max(1, len(y) // frame_length)
+    frames = np.resize(y, n_frames * frame_length).reshape(n_frames, frame_length)
+    energy = np.einsum("ij,ij->i", frames, frames) / frame_length + 1e-12
+
+    noise_floor, speech_level = np.percentile(energy, [10, 95])
+    return {
+        "snr_db": float(10 * np.log10(speech_level / noise_floor)),
+        "noise_floor_db": float(10 * np.log10(noise_floor)),
+        "duration": duration,
+    }
+
+
+def _decide(snr_db: float, config: dict) -> tuple[str, str]:
+    """Map an SNR estimate to an adaptive decision and the preset it uses."""
+    if snr_db >= config.get("skip_snr_db", 30):
+        return "skip", None
+    if snr_db >= config.get("light_snr_db", 20):
+        return "light", config.get("light_preset", "fast")
+    return "denoise", None
+
+
+def _record_decision(decision: str, duration: float, estimate_seconds: float, enhance_seconds: float = 0.0):
+    """Update the process-wide adaptive enhancement counters."""
+    with _STATS_LOCK:
+        _ENHANCEMENT_STATS[decision] += 1
+        _ENHANCEMENT_STATS["audio_seconds"][decision] += duration
+        _ENHANCEMENT_STATS["estimate_seconds"] += estimate_seconds
+        if decision != "skip":
+            _ENHANCEMENT_STATS["enhance_seconds"][decision] += enhance_seconds
+
+
+def get_enhancement_stats() -> dict:
+    """
+    Return adaptive enhancement counters for this process.
+
+    `estimated_seconds_saved` extrapolates the real-time factor observed for full
+    denoising to the audio that was skipped or lightened.
+
+    Returns:
+        dict: Decision counts, audio seconds per decision, time spent estimating
+              and enhancing, and the estimated enhancement time saved.
+    """
+    with _STATS_LOCK:
+        stats = {
+            key: dict(value) if isinstance(value, dict) else value
+            for key, value in _ENHANCEMENT_STATS.items()
+        }
+
+    audio, spent = stats["audio_seconds"], stats["enhance_seconds"]
+    denoise_rtf = spent["denoise"] / audio["denoise"] if audio["denoise"] else 0.0
+    stats["estimated_seconds_saved"] = (
+        denoise_rtf * (audio["skip"] + audio["light"]) - spent["light"] - stats["estimate_seconds"]
+    )
+    return stats
+
+
+@handle_errors("Failed to enhance audio")
+def enhance_audio_adaptive(input_file: str, output_file: str = None) -> str:
+    """
+    Enhance audio only as much as its estimated SNR requires.
+
+    - SNR >= `skip_snr_db`: no enhancement, the original path is returned as is.
+    - SNR >= `light_snr_db`: denoise with the light preset.
+    - Otherwise: denoise with the default preset.
+
+    Recordings longer than `streaming_min_seconds` are enhanced in streaming mode.
+    The decision, SNR and timings are logged for every call.
+
+    Args:
+        input_file (str): Path to the input audio file.
+        output_file (str, optional): Path to save the enhanced audio file.
+                                    Defaults to (data / processed_audio /{input_file_stem}_clean.wav).
+
+    Returns:
+        str: Path to the enhanced audio file, or `input_file` when enhancement is skipped.
+    """
+    input_path = Path(input_file)
+    if not input_path.exists():
+        raise FileNotFoundError(f"{input_file} not found")
+
+    config = load_model_config().get("audio", {}).get("enhancement", {}).get("adaptive", {})
+
+    start = time.perf_counter()
+    try:
+        estimate = estimate_snr(
+            input_path,
+            n_windows=config.get("sample_windows", 16),
+            window_seconds=config.get("window_seconds", 1.0),
+        )
+    except Exception as e:
+        # Formats soundfile cannot seek into are enhanced with the default preset
+        logging.warning(f"SNR estimation failed for {input_file}, denoising by default: {e}")
+        estimate = {"snr_db": float("-inf"), "noise_floor_db": float("nan"), "duration": 0.0}
+    estimate_seconds = time.perf_counter() - start
+
+    decision, preset = _decide(estimate["snr_db"], config)
+
+    enhance_seconds = 0.0
+    if decision == "skip":
+        result = str(input_file)
+    else:
+        start = time.perf_counter()
+        if estimate["duration"] >= config.get("streaming_min_seconds", 1800):
+            result = enhance_audio_streaming(input_file, output_file, preset=preset)
+        else:
+            result = enhance_audio(input_file, output_file, preset=preset)
+        enhance_seconds = time.perf_counter() - start
+
+        if isinstance(result, dict):
+            raise MeetingMindError(result["message"])
+
+    _record_decision(decision, estimate["duration"], estimate_seconds, enhance_seconds)
+    logging.info(
+        f"Adaptive enhancement: decision={decision} snr_db={estimate['snr_db']:.1f} "
+        f"noise_floor_db={estimate['noise_floor_db']:.1f} duration={estimate['duration']:.1f}s "
+        f"estimate_ms={estimate_seconds * 1000:.1f} enhance_ms={enhance_seconds * 1000:.1f}"
+    )
+    return result
+
+
+@handle_errors("Failed to enhance audio")
+def enhance_audio_to_array(
+    input_file: str, output_file: str = None, adaptive: bool = True, cache_key: str = None
+) -> np.ndarray:
+    """
+    Enhance audio and return it as a 16 kHz mono float32 buffer for Whisper.
+
+    The file is decoded and resampled once (through the PCM cache), denoised in
+    memory at 16 kHz and handed over without a WAV round trip. Writing the
+    enhanced audio to disk is optional.
+
+    Args:
+        input_file (str): Path to the input audio file.
+        output_file (str, optional): Also save the enhanced audio to this path.
+                                    Defaults to the `audio.enhancement.write_intermediate`
+                                    config value: when true, (data / processed_audio /{input_file_stem}_clean.wav).
+        adaptive (bool, optional): Choose skip/light/default denoising from the
+                                   estimated SNR, as in `enhance_audio_adaptive`. Defaults to True.
+        cache_key (str, optional): Content identity for the PCM cache (e.g. the
+                                   upload's SHA-256). Defaults to a file fingerprint.
+
+    Returns:
+        np.ndarray: 16 kHz mono float32 samples (the cached PCM itself when denoising is skipped).
+    """
+    config = load_model_config().get("audio", {}).get("enhancement", {})
+    adaptive_config = config.get("adaptive", {})
+
+    y = load_pcm(input_file, SAMPLE_RATE, cache_key=cache_key)
+
+    start = time.perf_counter()
+    estimate = {"snr_db": float("-inf"), "noise_floor_db": float("nan"), "duration": len(y) / SAMPLE_RATE}
+    if adaptive:
+        estimate = estimate_snr_array(
+            y,
+            SAMPLE_RATE,
+            n_windows=adaptive_config.get("sample_windows", 16),
+            window_seconds=adaptive_config.get("window_seconds", 1.0),
+        )
+    estimate_seconds = time.perf_counter() - start
+
+    decision, preset = _decide(estimate["snr_db"], adaptive_config)
+    enhance_seconds = 0.0
+    if decision != "skip":
+        start = time.perf_counter()
+        y = reduce_noise(np.asarray(y), SAMPLE_RATE, preset).astype(np.float32)
+        enhance_seconds = time.perf_counter() - start
+
+    if output_file is not None or config.get("write_intermediate", False):
+        output_file = _resolve_output_path(Path(input_file), output_file)
+        sf.write(output_file, y, SAMPLE_RATE)
+        logging.info(f"Enhanced audio saved to {output_file}")
+
+    _record_decision(decision, estimate["duration"], estimate_seconds, enhance_seconds)
+    logging.info(
+        f"Adaptive enhancement (in memory): decision={decision} snr_db={estimate['snr_db']:.1f} "
+        f"duration={estimate['duration']:.1f}s estimate_ms={estimate_seconds * 1000:.1f} "
+        f"enhance_ms={enhance_seconds * 1000:.1f}"
+    )
+    return y
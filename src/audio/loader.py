@@ -0,0 +1,227 @@
+from pathlib import Path
+import hashlib
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import numpy as np
+
+from src.handlers.error_handler import MeetingMindError
+from config.config_loader import load_model_config
+
+# --- Project path setup ---
+# Ensure project root is in sys.path for absolute imports
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+PCM_CACHE_DIR = PROJECT_ROOT / "data" / "pcm_cache"
+PCM_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+# Whisper models expect 16 kHz mono float32 input
+SAMPLE_RATE = 16000
+
+# Samples converted per step when writing the cache file
+_CONVERT_BLOCK = 1 << 20
+
+# One lock per cache entry being loaded, so concurrent loads of the same file decode it once:
+# {file name: {"lock": Lock, "users": int}}; entries are removed when their last user is done
+_DECODE_LOCKS = {}
+_DECODE_LOCKS_GUARD = threading.Lock()
+_SWEEP_LOCK = threading.Lock()
+
+# Logging configuration
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+
+def file_fingerprint(input_file: str) -> str:
+    """
+    Build a cheap identity for a file from its resolved path, size and modification time.
+
+    Args:
+        input_file (str): Path to the file.
+
+    Returns:
+        str: Hex digest identifying this version of the file.
+    """
+    path = Path(input_file).resolve()
+    stat = path.stat()
+    return hashlib.sha1(f"{path}:{stat.st_size}:{stat.st_mtime_ns}".encode()).hexdigest()
+
+
+def _ffmpeg_command(input_file: str, sr: int) -> list[str]:
+    return [
+        "ffmpeg", "-nostdin", "-loglevel", "error", "-threads", "0",
+        "-i", str(input_file),
+        "-f", "s16le", "-ac", "1", "-acodec", "pcm_s16le", "-ar", str(sr),
+        "-",
+    ]
+
+
+def _decode_to_memory(input_file: str, sr: int) -> np.ndarray:
+    """Decode and resample an audio file to a mono float32 array with ffmpeg."""
+    result = subprocess.run(_ffmpeg_command(input_file, sr), capture_output=True)
+    if result.returncode != 0:
+        raise MeetingMindError(f"Failed to decode {input_file}: {result.stderr.decode(errors='ignore').strip()}")
+    return np.frombuffer(result.stdout, np.int16).astype(np.float32) / 32768.0
+
+
+def _decode_to_cache(input_file: str, sr: int, cache_file: Path):
+    """
+    Decode an audio file into a float32 `.npy` cache file with bounded memory.
+
+    ffmpeg output is streamed to a raw int16 spool file, which is then converted
+    block by block into a memory-mapped `.npy` file and atomically moved into place.
+    """
+    with tempfile.NamedTemporaryFile(dir=PCM_CACHE_DIR, suffix=".raw", delete=False) as raw:
+        raw_path = Path(raw.name)
+        process = subprocess.Popen(_ffmpeg_command(input_file, sr), stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        shutil.copyfileobj(process.stdout, raw, _CONVERT_BLOCK)
+        stderr = process.stderr.read()
+        process.wait()
+
+    tmp_file = cache_file.with_suffix(".tmp.npy")
+    try:
+        if process.returncode != 0:
+            raise MeetingMindError(f"Failed to decode {input_file}: {stderr.decode(errors='ignore').strip()}")
+
+        n_samples = raw_path.stat().st_size // 2
+        out = np.lib.format.open_memmap(tmp_file, mode="w+", dtype=np.float32, shape=(n_samples,))
+        if n_samples:
+            pcm = np.memmap(raw_path, dtype=np.int16, mode="r")
+            for start in range(0, n_samples, _CONVERT_BLOCK):
+                stop = min(start + _CONVERT_BLOCK, n_samples)
+                out[start:stop] = pcm[start:stop] / np.float32(32768.0)
+            del pcm
+        out.flush()
+        del out
+        os.replace(tmp_file, cache_file)
+    finally:
+        raw_path.unlink(missing_ok=True)
+        tmp_file.unlink(missing_ok=True)
+
+
+def sweep_pcm_cache(max_size_mb: float = None, max_age_hours: float = None) -> int:
+    """
+    Bound the PCM cache: delete entries unused for too long, then least recently used ones over the size limit.
+
+    Entries are ordered by modification time, which `load_pcm` refreshes on
+    every hit. Entries being loaded are kept. Deleting a file that another
+    caller still has memory-mapped is safe on POSIX; where the OS refuses, the
+    file is kept until a later sweep.
+
+    Args:
+        max_size_mb (float, optional): Size limit of the cache. Defaults to the
+                                       `audio.pcm_cache.max_size_mb` config value or 2048.
+        max_age_hours (float, optional): Entries (and leftover temporary files) unused for
+                                         longer are deleted. Defaults to the
+                                         `audio.pcm_cache.max_age_hours` config value or 72.
+
+    Returns:
+        int: Number of files deleted.
+    """
+    config = load_model_config().get("audio", {}).get("pcm_cache", {})
+    max_bytes = (max_size_mb or config.get("max_size_mb", 2048)) * 1024 * 1024
+    cutoff = time.time() - (max_age_hours or config.get("max_age_hours", 72)) * 3600
+
+    with _SWEEP_LOCK:
+        with _DECODE_LOCKS_GUARD:
+            in_use = set(_DECODE_LOCKS)
+
+        entries = []
+        total = 0
+        for path in PCM_CACHE_DIR.iterdir():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            # Entries being loaded count towards the size but are never deleted
+            total += stat.st_size
+            if path.name not in in_use:
+                entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+
+        deleted = 0
+        for mtime, size, path in entries:
+            # Temporary files of a decode in progress are recent: only old ones are leftovers
+            is_entry = path.suffix == ".npy" and not path.name.endswith(".tmp.npy")
+            if mtime >= cutoff and (total <= max_bytes or not is_entry):
+                continue
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logging.warning(f"Could not delete PCM cache file {path.name}: {e}")
+                continue
+            total -= size
+            deleted += 1
+
+    if deleted:
+        logging.info(f"Deleted {deleted} PCM cache files")
+    return deleted
+
+
+def load_pcm(input_file: str, sr: int = SAMPLE_RATE, cache: bool = None, cache_key: str = None) -> np.ndarray:
+    """
+    Load an audio file as mono float32 PCM at the given sampling rate.
+
+    Decoding and resampling happen once, in ffmpeg. With caching enabled, the
+    result is stored as `.npy` in data/pcm_cache and returned as a read-only
+    memory map, so later stages and re-runs on the same file never decode it again.
+    The cache is bounded in size and age by `sweep_pcm_cache`, run after each new entry.
+
+    Args:
+        input_file (str): Path to the audio file (any format ffmpeg can read).
+        sr (int, optional): Target sampling rate. Defaults to 16000.
+        cache (bool, optional): Use the on-disk PCM cache. Defaults to the
+                                `audio.pcm_cache.enabled` config value.
+        cache_key (str, optional): Identity of the audio content. Defaults to a
+                                   fingerprint of the path, size and modification time.
+
+    Returns:
+        np.ndarray: 1-D float32 samples in [-1, 1] (a `np.memmap` when cached).
+
+    Raises:
+        FileNotFoundError: If the input file does not exist.
+        MeetingMindError: If ffmpeg cannot decode the file.
+    """
+    if not Path(input_file).exists():
+        raise FileNotFoundError(f"{input_file} not found")
+
+    if cache is None:
+        cache = load_model_config().get("audio", {}).get("pcm_cache", {}).get("enabled", True)
+    if not cache:
+        return _decode_to_memory(input_file, sr)
+
+    cache_file = PCM_CACHE_DIR / f"{cache_key or file_fingerprint(input_file)}_{sr}.npy"
+
+    with _DECODE_LOCKS_GUARD:
+        entry = _DECODE_LOCKS.setdefault(cache_file.name, {"lock": threading.Lock(), "users": 0})
+        entry["users"] += 1
+
+    decoded = False
+    try:
+        with entry["lock"]:
+            if cache_file.exists():
+                logging.info(f"PCM cache hit: {input_file}")
+                # Marks the entry as recently used for the sweep
+                os.utime(cache_file)
+            else:
+                logging.info(f"Decoding {input_file} to {sr} Hz PCM cache")
+                _decode_to_cache(input_file, sr, cache_file)
+                decoded = True
+            pcm = np.load(cache_file, mmap_mode="r")
+    finally:
+        with _DECODE_LOCKS_GUARD:
+            entry["users"] -= 1
+            if not entry["users"]:
+                del _DECODE_LOCKS[cache_file.name]
+
+    if decoded:
+        sweep_pcm_cache()
+    return pcm
@@ -0,0 +1,235 @@
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+import numpy as np
+import logging
+import sys
+
+from config.config_loader import load_model_config
+
+# --- Project path setup ---
+# Ensure project root is in sys.path for absolute imports
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+# Logging configuration
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+
+class OffsetMap:
+    """
+    Maps timestamps in a condensed (silence-trimmed) buffer back to the original timeline.
+
+    Each kept region is stored as (condensed_start, original_start, duration) in seconds.
+    """
+
+    def __init__(self, spans: list[tuple[float, float, float]]):
+        """
+        Initialize OffsetMap.
+
+        Args:
+            spans (list[tuple[float, float, float]]): (condensed_start, original_start, duration)
+                                                      for every kept region, in order.
+        """
+        self.spans = spans
+        self._condensed_starts = [span[0] for span in spans]
+
+    def to_original(self, t: float, is_end: bool = False) -> float:
+        """
+        Convert a time in the condensed buffer to a time in the original recording.
+
+        Args:
+            t (float): Time in seconds within the condensed buffer.
+            is_end (bool, optional): `t` ends an interval: a time exactly on the boundary
+                                     between two regions maps to the end of the earlier
+                                     one, not to the start of the next. Defaults to False.
+
+        Returns:
+            float: Corresponding time in seconds within the original recording.
+        """
+        if not self.spans:
+            return t
+
+        search = bisect_left if is_end else bisect_right
+        index = max(0, search(self._condensed_starts, t) - 1)
+        condensed_start, original_start, duration = self.spans[index]
+        return original_start + min(max(t - condensed_start, 0.0), duration)
+
+    def map_segments(self, segments: list[dict]) -> list[dict]:
+        """
+        Map the "start"/"end" keys of transcription segments back to the original timeline.
+
+        Args:
+            segments (list[dict]): Segments with "start" and "end" in condensed time.
+
+        Returns:
+            list[dict]: Copies of the segments with original-timeline timestamps.
+        """
+        return [
+            {
+                **segment,
+                "start": self.to_original(segment["start"]),
+                "end": self.to_original(segment["end"], is_end=True),
+            }
+            for segment in segments
+        ]
+
+
+# Detector defaults, overridden by the `audio.vad` config section
+_VAD_DEFAULTS = {
+    "frame_seconds": 0.03,
+    "energy_margin_db": 10,
+    "zcr_max": 0.25,
+    "min_speech_seconds": 0.25,
+    "min_silence_seconds": 0.5,
+    "padding_seconds": 0.2,
+}
+
+
+def vad_settings() -> dict:
+    """
+    Return the effective detector settings: the `audio.vad` config over the defaults.
+
+    Returns:
+        dict: frame_seconds, energy_margin_db, zcr_max, min_speech_seconds,
+              min_silence_seconds and padding_seconds.
+    """
+    config = load_model_config().get("audio", {}).get("vad", {})
+    return {name: default if config.get(name) is None else config[name] for name, default in _VAD_DEFAULTS.items()}
+
+
+def frame_features(y: np.ndarray, sr: int, frame_seconds: float = 0.03) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Compute per-frame log energy and zero-crossing rate over non-overlapping frames.
+
+    Args:
+        y (np.ndarray): Mono audio signal.
+        sr (int): Sampling rate of the signal.
+        frame_seconds (float, optional): Frame length in seconds. Defaults to 0.03.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: (energy_db, zero_crossing_rate), one value per frame.
+    """
+    frame_length = max(1, int(frame_seconds * sr))
+    n_frames = len(y) // frame_length
+    frames = np.asarray(y[: n_frames * frame_length], dtype=np.float32).reshape(n_frames, frame_length)
+
+    energy_db = 10 * np.log10(np.einsum("ij,ij->i", frames, frames) / frame_length + 1e-10)
+    signs = np.signbit(frames)
+    zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / frame_length
+    return energy_db, zcr
+
+
+def detect_speech(
+    y: np.ndarray,
+    sr: int,
+    frame_seconds: float = None,
+    energy_margin_db: float = None,
+    zcr_max: float = None,
+    min_speech_seconds: float = None,
+    min_silence_seconds: float = None,
+    padding_seconds: float = None,
+) -> list[tuple[float, float]]:
+    """
+    Detect speech regions with an adaptive energy / zero-crossing-rate detector.
+
+    A frame is speech when its energy is `energy_margin_db` above the noise floor
+    (10th percentile of frame energy) and its zero-crossing rate is below `zcr_max`
+    (noise-like frames cross zero far more often than voiced speech), or when its
+    energy is twice the margin above the floor. Gaps shorter than
+    `min_silence_seconds` are bridged, regions shorter than `min_speech_seconds`
+    are dropped and the rest are padded by `padding_seconds` on both sides.
+
+    All optional parameters default to the `audio.vad` config values.
+
+    Args:
+        y (np.ndarray): Mono audio signal.
+        sr (int): Sampling rate of the signal.
+
+    Returns:
+        list[tuple[float, float]]: Sorted, non-overlapping (start, end) regions in seconds.
+    """
+    config = vad_settings()
+    frame_seconds = frame_seconds or config["frame_seconds"]
+    energy_margin_db = energy_margin_db if energy_margin_db is not None else config["energy_margin_db"]
+    zcr_max = zcr_max if zcr_max is not None else config["zcr_max"]
+    min_speech_seconds = min_speech_seconds if min_speech_seconds is not None else config["min_speech_seconds"]
+    min_silence_seconds = min_silence_seconds if min_silence_seconds is not None else config["min_silence_seconds"]
+    padding_seconds = padding_seconds if padding_seconds is not None else config["padding_seconds"]
+
+    energy_db, zcr = frame_features(y, sr, frame_seconds)
+    if len(energy_db) == 0:
+        return []
+
+    noise_floor = np.percentile(energy_db, 10)
+    speech = ((energy_db > noise_floor + energy_margin_db) & (zcr < zcr_max)) | (
+        energy_db > noise_floor + 2 * energy_margin_db
+    )
+
+    # Run boundaries of the boolean speech mask
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], speech.view(np.int8), [0]))))
+    starts, ends = edges[::2] * frame_seconds, edges[1::2] * frame_seconds
+
+    regions = []
+    for start, end in zip(starts, ends):
+        if regions and start - regions[-1][1] < min_silence_seconds:
+            regions[-1][1] = end
+        else:
+            regions.append([start, end])
+
+    duration = len(y) / sr
+    padded = []
+    for start, end in regions:
+        if end - start < min_speech_seconds:
+            continue
+        start, end = max(0.0, start - padding_seconds), min(duration, end + padding_seconds)
+        if padded and start <= padded[-1][1]:
+            padded[-1] = (padded[-1][0], end)
+        else:
+            padded.append((float(start), float(end)))
+    return padded
+
+
+def condense_audio(y: np.ndarray, sr: int, regions: list[tuple[float, float]]) -> tuple[np.ndarray, OffsetMap]:
+    """
+    Concatenate the given regions into one buffer and build its offset map.
+
+    Args:
+        y (np.ndarray): Mono audio signal.
+        sr (int): Sampling rate of the signal.
+        regions (list[tuple[float, float]]): (start, end) regions in seconds.
+
+    Returns:
+        tuple[np.ndarray, OffsetMap]: Condensed buffer and the map back to `y`'s timeline.
+    """
+    pieces, spans, cursor = [], [], 0
+    for start, end in regions:
+        piece = y[int(start * sr): int(end * sr)]
+        if len(piece) == 0:
+            continue
+        spans.append((cursor / sr, int(start * sr) / sr, len(piece) / sr))
+        pieces.append(piece)
+        cursor += len(piece)
+
+    condensed = np.concatenate(pieces) if pieces else np.zeros(0, dtype=y.dtype)
+    return condensed, OffsetMap(spans)
+
+
+def trim_silence(y: np.ndarray, sr: int, **vad_options) -> tuple[np.ndarray, OffsetMap, list[tuple[float, float]]]:
+    """
+    Remove non-speech audio from a signal.
+
+    Args:
+        y (np.ndarray): Mono audio signal.
+        sr (int): Sampling rate of the signal.
+        **vad_options: Overrides for `detect_speech`.
+
+    Returns:
+        tuple: (condensed buffer, OffsetMap, speech regions in seconds)
+    """
+    regions = detect_speech(y, sr, **vad_options)
+    condensed, offset_map = condense_audio(y, sr, regions)
+
+    removed = 1 - len(condensed) / max(len(y), 1)
+    logging.info(f"VAD kept {len(regions)} speech regions, removed {removed:.1%} of the audio")
+    return condensed, offset_map, regions
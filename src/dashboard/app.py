@@ -1,6 +1,6 @@
 import streamlit as st
 from pathlib import Path
-import tempfile
+import time
 import sys 
 import os 
 import pandas as pd
@@ -11,14 +11,25 @@ if str(PROJECT_ROOT) not in sys.path:
     sys.path.append(str(PROJECT_ROOT))
 
 # Modules
-from src.audio.enhancer import enhance_audio
-from src.transcription.whisper_transcriber import WhisperTranscriber
+from src.audio.enhancer import enhance_audio_to_array, enhancement_settings
+from src.transcription.factory import create_transcriber
+from src.transcription.streaming_transcriber import StreamingTranscriber
 from src.analysis.summarizer import MeetingSummarizer
 from src.analysis.task_extractor import TaskExtractor
 from src.analysis.sentiment_analyzer import SentimentAnalyzer
+from src.analysis.combined_analyzer import CombinedAnalyzer, SECTIONS
 from src.research.topic_extractor import TopicExtractor
 from src.research.web_searcher import WebSearcher
-from src.dashboard.components import record_audio_stream , save_recording
+from src.llm.base_llm_client import generate_many
+from src.llm.cached_client import get_llm_cache
+from src.llm.hedged_client import latency_stats
+from src.llm.single_flight import get_single_flight
+from src.llm.client_registry import get_client, run_async
+from src.llm.structured_output import parse_stats
+from src.handlers.error_handler import format_streamlit_error
+from config.config_loader import load_model_config
+from src.dashboard.components import RingBufferRecorder, RECORDINGS_DIR
+from src.dashboard.ingestion import spool_upload, cleanup_stale_spools
 
 # ================= UI CONFIG =================
 st.set_page_config(
@@ -63,54 +74,181 @@ st.markdown("<div class='subtitle'>Transform your meetings into structured knowl
 # ================= SESSION STATES =================
 if "recording" not in st.session_state:
     st.session_state.recording = False
-    st.session_state.stream = None
+    st.session_state.recorder = None
     st.session_state.audio_data = None
+    st.session_state.streamer = None
+    st.session_state.live_transcript = None
 
 if "processed" not in st.session_state:
     st.session_state.processed = False
 
 if "results" not in st.session_state:
     st.session_state.results = {}
+    # First run of a new session: remove uploads abandoned by earlier sessions
+    cleanup_stale_spools()
 
 # ================= MAIN CARD =================
 with st.sidebar:
 
     st.markdown("### Upload or Record Your Meeting Audio")
     audio_file = st.file_uploader("🎧 Upload Audio (mp3/wav)", type=["mp3","wav"])
+
+    st.markdown("#### 🎙️ Or record from your microphone")
+    start_col, stop_col = st.columns(2)
+    if start_col.button("⏺️ Start", use_container_width=True, disabled=st.session_state.recording):
+        recording_file = RECORDINGS_DIR / f"recording_{int(time.time())}.wav"
+        # Transcribe while recording, so the transcript is ready when recording stops
+        st.session_state.streamer = StreamingTranscriber().start()
+        st.session_state.recorder = RingBufferRecorder(
+            recording_file, listeners=[st.session_state.streamer.feed]
+        ).start()
+        st.session_state.live_transcript = None
+        st.session_state.recording = True
+    if stop_col.button("⏹️ Stop", use_container_width=True, disabled=not st.session_state.recording):
+        st.session_state.audio_data = st.session_state.recorder.stop()
+        with st.spinner("Finishing live transcript..."):
+            st.session_state.live_transcript = st.session_state.streamer.finish()
+        st.session_state.recording = False
+
+    if st.session_state.recorder is not None:
+        stats = st.session_state.recorder.stats()
+        status = "Recording" if st.session_state.recording else "Recorded"
+        st.caption(
+            f"{status}: {stats['seconds']:.0f} s · dropped frames: {stats['dropped_frames']} "
+            f"· overflows: {stats['ring_overflows'] + stats['input_overflows']}"
+        )
+
+    with st.expander("📊 LLM cache"):
+        namespaces = get_llm_cache().stats()["namespaces"]
+        for name, counters in namespaces.items():
+            st.caption(f"{name}: {counters['hits']} hits / {counters['misses']} misses ({counters['hit_rate']:.0%})")
+        if not namespaces:
+            st.caption("No LLM calls yet")
+        shared = sum(counters["deduplicated"] for counters in get_single_flight().stats()["namespaces"].values())
+        if shared:
+            st.caption(f"Duplicate in-flight requests shared: {shared}")
+        usage = get_client("deepseek").usage_stats()
+        if usage["calls"]:
+            st.caption(
+                f"Provider prompt cache: {usage['cached_tokens']} of {usage['prompt_tokens']} "
+                f"prompt tokens ({usage['cached_rate']:.0%})"
+            )
+        parsing = parse_stats()
+        if parsing["total"]:
+            st.caption(
+                f"JSON outputs: {parsing['parse_failure_rate']:.0%} needed repair · "
+                f"{parsing['repaired']} repair requests succeeded · {parsing['failed']} failed"
+            )
+
+    with st.expander("⏱️ LLM latency"):
+        providers = latency_stats()
+        for name, latency in providers.items():
+            if latency["samples"]:
+                st.caption(
+                    f"{name}: p50 {latency['p50']:.1f} s · p95 {latency['p95']:.1f} s · "
+                    f"p99 {latency['p99']:.1f} s ({latency['samples']} calls, {latency['errors']} errors)"
+                )
+        if not any(latency["samples"] for latency in providers.values()):
+            st.caption("No hedged LLM calls yet")
+
+    # Use the last microphone recording when no file is uploaded
+    if audio_file is None and st.session_state.audio_data:
+        audio_file = st.session_state.audio_data
+
+# ================= LIVE TRANSCRIPT =================
+@st.fragment(run_every=2)
+def live_transcript():
+    """Show the partial transcript of the current recording, refreshed every 2 seconds."""
+    if not st.session_state.recording or st.session_state.streamer is None:
+        return
+    partial = st.session_state.streamer.partial()
+    st.markdown("#### 🔴 Live transcript")
+    st.markdown(f"{partial['committed']} <span style='color:gray;'>{partial['tentative']}</span>", unsafe_allow_html=True)
+
+live_transcript()
+
 # ================= PROCESS BUTTON =================
 
 st.markdown("<div class='subtitle'>📌 When your audio is ready, click Process Meeting to analyze it.</div>", unsafe_allow_html=True)
 process_button = st.button("🚀 Start Processing Meeting", use_container_width=True)
 
 # ================= MAIN PROCESSING =================
+async def analyze_meeting(transcript: str):
+    """Run the structured LLM analyses concurrently (summary and research are streamed separately)."""
+    return await generate_many([
+        TaskExtractor().aextract_tasks(transcript),
+        SentimentAnalyzer().aanalyze_sentiment(transcript),
+        TopicExtractor().aextract_topic(transcript),
+    ])
+
+
+def stream_section(title: str, pieces, error_message: str):
+    """Render streamed LLM text under a heading as it arrives and return the full text."""
+    st.markdown(f"#### {title}")
+    try:
+        return st.write_stream(pieces)
+    except Exception as e:
+        st.error(format_streamlit_error(str(e)))
+        return {"status": "error", "message": f"{error_message}: {e}"}
+
+def show_error(result) -> bool:
+    """Display a stage's error result (e.g. rate limited after retries); return True if it was one."""
+    if isinstance(result, dict) and result.get("status") == "error":
+        st.error(format_streamlit_error(result["message"]))
+        return True
+    return False
+
 if process_button and audio_file:
     with st.spinner("Processing meeting data..."):
-        temp_audio = tempfile.NamedTemporaryFile(delete=False, suffix=".wav")
-        if isinstance(audio_file, str):
-            audio_path = audio_file
+        if isinstance(audio_file, str) and st.session_state.live_transcript is not None:
+            # The recording was transcribed while it was captured
+            transcript = st.session_state.live_transcript
         else:
-            temp_audio.write(audio_file.read())
-            audio_path = temp_audio.name
-
-        enhanced_audio_path = enhance_audio(audio_path)
-
-        transcriber = WhisperTranscriber()
-        transcript = transcriber.transcribe(enhanced_audio_path)
-
-        summarizer = MeetingSummarizer()
-        summary = summarizer.summarize(transcript)
-
-        task_extractor = TaskExtractor()
-        tasks = task_extractor.extract_tasks(transcript)
-
-        sentiment_analyzer = SentimentAnalyzer()
-        sentiment = sentiment_analyzer.analyze_sentiment(transcript)
-
-        topic_extractor = TopicExtractor()
-        topic = topic_extractor.extract_topic(transcript)
-
-        web_searcher = WebSearcher()
-        web_results = web_searcher.search(topic)
+            transcriber = create_transcriber()
+            # Cached transcripts are looked up by the original audio, before it is denoised
+            if isinstance(audio_file, str):
+                result = transcriber.transcribe_with_digest(
+                    audio_file, preprocess=enhance_audio_to_array, preprocessing=enhancement_settings()
+                )
+            else:
+                with spool_upload(audio_file) as upload:
+                    result = transcriber.transcribe_with_digest(
+                        upload.path,
+                        preprocess=lambda path: enhance_audio_to_array(path, cache_key=upload.sha256),
+                        preprocessing=enhancement_settings(),
+                        source_sha256=upload.sha256,
+                    )
+            transcript = result if isinstance(result, dict) else result[0]
+
+        combined = load_model_config().get("llm", {}).get("analysis_mode") == "combined"
+        # Structured analyses run in the background while the summary streams in
+        if combined:
+            analyses = run_async(CombinedAnalyzer().aanalyze(transcript))
+        else:
+            analyses = run_async(analyze_meeting(transcript))
+
+        live = st.empty()
+        with live.container():
+            if combined:
+                # One request returns every section: the summary cannot be streamed on its own
+                analysis = analyses.result()
+                if isinstance(analysis, dict) and analysis.get("status") == "error":
+                    summary = tasks = sentiment = topic = analysis
+                else:
+                    summary, tasks, sentiment, topic = (analysis[section] for section in SECTIONS)
+            else:
+                summary = stream_section(
+                    "📌 Summary", MeetingSummarizer().stream_summary(transcript), "Failed to summarize transcript"
+                )
+                tasks, sentiment, topic = analyses.result()
+            if isinstance(topic, dict):
+                web_results = {"status": "error", "message": f"No research topic: {topic.get('message')}"}
+            else:
+                web_results = stream_section(
+                    f"🌍 Research: {topic}", WebSearcher().stream_search(topic), "Failed to perform web search"
+                )
+        # The results tabs below replace the live output
+        live.empty()
 
         st.session_state.results = {
             "transcript": transcript,
@@ -131,34 +269,41 @@ if st.session_state.processed:
         st.markdown(st.session_state.results["transcript"])
 
     with tabs[1]:
-        st.markdown(st.session_state.results["summary"], unsafe_allow_html=True)
+        summary = st.session_state.results["summary"]
+        if not show_error(summary):
+            st.markdown(summary, unsafe_allow_html=True)
 
     with tabs[2]:
         tasks = st.session_state.results["tasks"]
-        if tasks:
-            st.dataframe(pd.DataFrame(tasks), use_container_width=True)
-        else:
-            st.info("No tasks detected")
+        if not show_error(tasks):
+            if tasks:
+                st.dataframe(pd.DataFrame(tasks), use_container_width=True)
+            else:
+                st.info("No tasks detected")
 
     with tabs[3]:
         sentiment = st.session_state.results["sentiment"]
-        overall = sentiment["sentiment"]["overall_sentiment"]
-        emotions = sentiment["sentiment"]["emotions"]
-
-        color = "gray"
-        if overall.lower() == "positive":
-            color = "green"
-        elif overall.lower() == "negative":
-            color = "red"
-        elif overall.lower() == "neutral":
-            color = "orange"
-
-        st.markdown(f"**Overall Sentiment:** <span style='color:{color}; font-weight:bold;'>{overall}</span>", unsafe_allow_html=True)
-        if emotions:
-            badges = ", ".join(emotions)
-            st.markdown(f"**Detected Emotions:** {badges}", unsafe_allow_html=True)
+        if not show_error(sentiment):
+            overall = sentiment["sentiment"]["overall_sentiment"]
+            emotions = sentiment["sentiment"]["emotions"]
+
+            color = "gray"
+            if overall.lower() == "positive":
+                color = "green"
+            elif overall.lower() == "negative":
+                color = "red"
+            elif overall.lower() == "neutral":
+                color = "orange"
+
+            st.markdown(f"**Overall Sentiment:** <span style='color:{color}; font-weight:bold;'>{overall}</span>", unsafe_allow_html=True)
+            if emotions:
+                badges = ", ".join(emotions)
+                st.markdown(f"**Detected Emotions:** {badges}", unsafe_allow_html=True)
 
     with tabs[4]:
         topic = st.session_state.results["topic"]
-        st.markdown(f"### Main Topic: {topic}")
-        st.markdown(st.session_state.results["web_results"])
+        web_results = st.session_state.results["web_results"]
+        if not show_error(topic):
+            st.markdown(f"### Main Topic: {topic}")
+        if not show_error(web_results):
+            st.markdown(web_results)
@@ -1,6 +1,23 @@
 import sounddevice as sd
+import soundfile as sf
 import numpy as np
+import threading
+import logging
 import wave
+import sys
+from pathlib import Path
+
+# --- Project path setup ---
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+RECORDINGS_DIR = PROJECT_ROOT / "data" / "recordings"
+RECORDINGS_DIR.mkdir(parents=True, exist_ok=True)
+
+# Logging configuration
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
 
 def record_audio_stream():
     """
@@ -31,6 +48,9 @@ def save_recording(recording, fs, filename):
     """
     Save a recorded audio stream to a WAV file.
 
+    Chunks are converted and written one at a time, so the recording is never
+    concatenated into a second full-size array.
+
     Args:
         recording (list): List of numpy arrays representing audio chunks.
         samplerate (int): Sampling rate used for recording.
@@ -39,12 +59,179 @@ def save_recording(recording, fs, filename):
     Returns:
         str: Path to the saved WAV file.
     """
-    audio = np.concatenate(recording, axis=0)
-
     with wave.open(filename, 'wb') as wf:
         wf.setnchannels(1)
         wf.setsampwidth(2)
         wf.setframerate(fs)
-        wf.writeframes((audio * 32767).astype(np.int16).tobytes())
+        for chunk in recording:
+            wf.writeframes((chunk * 32767).astype(np.int16).tobytes())
+    return filename
+
+
+class RingBufferRecorder:
+    """
+    Constant-memory microphone recorder that spools audio to disk while recording.
+
+    The audio callback converts each block to int16 and copies it into a
+    preallocated ring buffer; a background writer thread drains the ring into
+    an open WAV/FLAC file (format taken from the file extension). Memory use is
+    fixed by `buffer_seconds`, whatever the length of the recording.
+
+    Responsibilities:
+    - Capture microphone input without growing Python lists.
+    - Stream captured frames to disk from a writer thread.
+    - Count dropped frames (ring full) and input overflows (reported by PortAudio).
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        samplerate: int = 16000,
+        channels: int = 1,
+        buffer_seconds: float = 30.0,
+        listeners: list = None,
+    ):
+        """
+        Initialize RingBufferRecorder.
+
+        Args:
+            filename (str): Output audio file (.wav or .flac).
+            samplerate (int, optional): Sampling rate in Hz. Defaults to 16000.
+            channels (int, optional): Number of audio channels. Defaults to 1 (mono).
+            buffer_seconds (float, optional): Capacity of the ring buffer. Defaults to 30.
+            listeners (list, optional): Callables receiving every captured block as a
+                                        mono float32 array (e.g. `StreamingTranscriber.feed`).
+                                        They run in the audio callback and must return quickly.
+        """
+        self.filename = str(filename)
+        self.listeners = listeners or []
+        self.samplerate = samplerate
+        self.channels = channels
+
+        self._capacity = int(buffer_seconds * samplerate)
+        self._ring = np.zeros((self._capacity, channels), dtype=np.int16)
+        # Monotonic frame counters; positions in the ring are taken modulo capacity
+        self._written = 0
+        self._read = 0
+        self._condition = threading.Condition()
+        self._stopping = False
+
+        self.dropped_frames = 0
+        self.ring_overflows = 0
+        self.input_overflows = 0
+        self.frames_recorded = 0
+
+        self._stream = None
+        self._writer = None
+
+    def _callback(self, indata, frames, time, status):
+        if status.input_overflow:
+            self.input_overflows += 1
+
+        for listener in self.listeners:
+            listener(indata.mean(axis=1))
+
+        block = np.clip(indata * 32767, -32768, 32767).astype(np.int16)
+
+        with self._condition:
+            free = self._capacity - (self._written - self._read)
+            if frames > free:
+                # The writer fell behind: keep what fits and count the rest
+                self.dropped_frames += frames - free
+                self.ring_overflows += 1
+                block = block[:free]
+
+            start = self._written % self._capacity
+            first = min(len(block), self._capacity - start)
+            self._ring[start:start + first] = block[:first]
+            self._ring[: len(block) - first] = block[first:]
+            self._written += len(block)
+            self._condition.notify()
+
+    def _drain(self, sink):
+        """Writer thread: copy filled ring regions to the output file until stopped."""
+        while True:
+            with self._condition:
+                while self._written == self._read and not self._stopping:
+                    self._condition.wait()
+                available = self._written - self._read
+                if available == 0 and self._stopping:
+                    return
+                read = self._read
+
+            # The callback never writes into the unread region, so it can be read without the lock
+            start = read % self._capacity
+            first = min(available, self._capacity - start)
+            sink.write(self._ring[start:start + first])
+            if available > first:
+                sink.write(self._ring[: available - first])
+
+            with self._condition:
+                self._read += available
+                self.frames_recorded += available
+
+    def start(self):
+        """
+        Open the output file and start capturing from the default input device.
+
+        Returns:
+            RingBufferRecorder: The recorder itself.
+        """
+        sink = sf.SoundFile(self.filename, "w", samplerate=self.samplerate, channels=self.channels, subtype="PCM_16")
+
+        def run():
+            try:
+                self._drain(sink)
+            finally:
+                sink.close()
+
+        self._writer = threading.Thread(target=run, name="recording-writer", daemon=True)
+        self._writer.start()
+
+        self._stream = sd.InputStream(
+            samplerate=self.samplerate, channels=self.channels, dtype="float32", callback=self._callback
+        )
+        self._stream.start()
+        logging.info(f"Recording to {self.filename}")
+        return self
+
+    def stop(self) -> str:
+        """
+        Stop capturing, flush the remaining frames and close the output file.
+
+        Returns:
+            str: Path to the saved recording.
+        """
+        if self._stream is not None:
+            self._stream.stop()
+            self._stream.close()
+            self._stream = None
+
+        with self._condition:
+            self._stopping = True
+            self._condition.notify()
+        if self._writer is not None:
+            self._writer.join()
+            self._writer = None
+
+        logging.info(f"Recording saved to {self.filename}: {self.stats()}")
+        return self.filename
 
+    def stats(self) -> dict:
+        """
+        Return recording counters.
 
+        Returns:
+            dict: seconds recorded, frames recorded, dropped frames, ring buffer
+                  overflows, input overflows and current ring buffer fill (0-1).
+        """
+        with self._condition:
+            fill = (self._written - self._read) / self._capacity
+        return {
+            "seconds": self.frames_recorded / self.samplerate,
+            "frames_recorded": self.frames_recorded,
+            "dropped_frames": self.dropped_frames,
+            "ring_overflows": self.ring_overflows,
+            "input_overflows": self.input_overflows,
+            "buffer_fill": fill,
+        }
@@ -0,0 +1,185 @@
+from pathlib import Path
+import hashlib
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+
+from config.config_loader import load_model_config
+
+# --- Project path setup ---
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+UPLOADS_DIR = PROJECT_ROOT / "data" / "uploads"
+UPLOADS_DIR.mkdir(parents=True, exist_ok=True)
+
+# Spool files shared by concurrent sessions are deleted when the last one releases them
+_REFERENCES = {}
+_REFERENCES_LOCK = threading.Lock()
+
+# Logging configuration
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+
+def detect_audio_format(header: bytes, filename: str = "") -> str:
+    """
+    Detect the container format of an audio file from its first bytes.
+
+    Args:
+        header (bytes): At least the first 12 bytes of the file.
+        filename (str, optional): Original file name, used when the header is not recognised.
+
+    Returns:
+        str: File extension including the dot (e.g. ".wav", ".mp3").
+    """
+    if header[:4] == b"RIFF" and header[8:12] == b"WAVE":
+        return ".wav"
+    if header[:4] == b"fLaC":
+        return ".flac"
+    if header[:4] == b"OggS":
+        return ".ogg"
+    if header[4:8] == b"ftyp":
+        return ".m4a"
+    if header[:3] == b"ID3" or (len(header) > 1 and header[0] == 0xFF and header[1] & 0xE0 == 0xE0):
+        return ".mp3"
+    return Path(filename).suffix.lower() or ".bin"
+
+
+class SpooledUpload:
+    """
+    An uploaded audio file spooled to disk under its content hash.
+
+    Use it as a context manager (or call `cleanup()`) to delete the spool file
+    once it is no longer needed.
+    """
+
+    def __init__(self, path: Path, sha256: str, size: int, audio_format: str):
+        """
+        Initialize SpooledUpload.
+
+        Args:
+            path (Path): Location of the spool file.
+            sha256 (str): Hex SHA-256 of the uploaded content.
+            size (int): Size of the upload in bytes.
+            audio_format (str): Detected container extension (e.g. ".mp3").
+        """
+        self.path = str(path)
+        self.sha256 = sha256
+        self.size = size
+        self.format = audio_format
+        self._released = False
+
+    def cleanup(self):
+        """
+        Release this upload and delete the spool file if no other session uses it.
+        """
+        if self._released:
+            return
+        self._released = True
+
+        with _REFERENCES_LOCK:
+            _REFERENCES[self.path] -= 1
+            if _REFERENCES[self.path] > 0:
+                return
+            del _REFERENCES[self.path]
+            Path(self.path).unlink(missing_ok=True)
+        logging.info(f"Deleted spool file {self.path}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.cleanup()
+
+
+def spool_upload(uploaded_file, chunk_size: int = None) -> SpooledUpload:
+    """
+    Copy an uploaded file to disk in fixed-size chunks, hashing it on the way.
+
+    When the upload exposes its in-memory buffer (Streamlit's `UploadedFile`
+    does, via `getbuffer()`), chunks are written as memoryview slices without
+    copying; otherwise it is read chunk by chunk. The spool file is named after
+    the SHA-256 of its content and keeps the real container extension, so
+    identical uploads share one file.
+
+    Args:
+        uploaded_file: File-like upload object (e.g. `streamlit.UploadedFile`).
+        chunk_size (int, optional): Bytes copied per step. Defaults to the
+                                    `dashboard.ingestion.chunk_size_mb` config value.
+
+    Returns:
+        SpooledUpload: Spool file path, content hash, size and detected format.
+    """
+    if chunk_size is None:
+        config = load_model_config().get("dashboard", {}).get("ingestion", {})
+        chunk_size = int(config.get("chunk_size_mb", 8) * 1024 * 1024)
+
+    hasher = hashlib.sha256()
+    size, header = 0, b""
+
+    with tempfile.NamedTemporaryFile(dir=UPLOADS_DIR, suffix=".part", delete=False) as spool:
+        try:
+            if hasattr(uploaded_file, "getbuffer"):
+                buffer = uploaded_file.getbuffer()
+                chunks = (buffer[start:start + chunk_size] for start in range(0, len(buffer), chunk_size))
+            else:
+                chunks = iter(lambda: uploaded_file.read(chunk_size), b"")
+
+            for chunk in chunks:
+                if not header:
+                    header = bytes(chunk[:12])
+                hasher.update(chunk)
+                spool.write(chunk)
+                size += len(chunk)
+        except BaseException:
+            Path(spool.name).unlink(missing_ok=True)
+            raise
+
+    sha256 = hasher.hexdigest()
+    audio_format = detect_audio_format(header, getattr(uploaded_file, "name", ""))
+    path = UPLOADS_DIR / f"{sha256}{audio_format}"
+
+    with _REFERENCES_LOCK:
+        if path.exists():
+            Path(spool.name).unlink()
+        else:
+            os.replace(spool.name, path)
+        _REFERENCES[str(path)] = _REFERENCES.get(str(path), 0) + 1
+
+    logging.info(f"Spooled upload ({size / 1e6:.1f} MB, {audio_format}) to {path}")
+    return SpooledUpload(path, sha256, size, audio_format)
+
+
+def cleanup_stale_spools(max_age_seconds: float = None) -> int:
+    """
+    Delete spool files left behind by crashed or abandoned sessions.
+
+    Files still referenced by a session in this process are kept.
+
+    Args:
+        max_age_seconds (float, optional): Minimum age of files to delete. Defaults
+                                           to the `dashboard.ingestion.max_age_hours` config value.
+
+    Returns:
+        int: Number of files deleted.
+    """
+    if max_age_seconds is None:
+        config = load_model_config().get("dashboard", {}).get("ingestion", {})
+        max_age_seconds = config.get("max_age_hours", 24) * 3600
+
+    cutoff = time.time() - max_age_seconds
+    deleted = 0
+    with _REFERENCES_LOCK:
+        for path in UPLOADS_DIR.iterdir():
+            if str(path) in _REFERENCES or path.stat().st_mtime > cutoff:
+                continue
+            path.unlink(missing_ok=True)
+            deleted += 1
+
+    if deleted:
+        logging.info(f"Deleted {deleted} stale spool files from {UPLOADS_DIR}")
+    return deleted
@@ -1,4 +1,5 @@
 import logging
+import inspect
 import traceback
 from pathlib import Path
 from functools import wraps
@@ -39,6 +40,44 @@ class MeetingMindError(Exception):
         self.message = message
 
 
+class RateLimitError(MeetingMindError):
+    """
+    Raised when an API provider rejects a call because of rate limits (HTTP 429),
+    or is temporarily unavailable (HTTP 5xx, connection errors, timeouts). The call can be retried.
+
+    Responsibilities:
+    - Carry the provider's requested wait (`Retry-After`), when given.
+    - Carry the HTTP status, telling rate limits (429) from unavailability.
+    """
+
+    def __init__(self, message="API rate limit exceeded", retry_after: float = None, status_code: int = None):
+        """
+        Initialize RateLimitError.
+
+        Args:
+            message (str): A descriptive message for the exception.
+            retry_after (float, optional): Seconds the provider asked to wait before retrying.
+            status_code (int, optional): HTTP status of the response; None for connection errors and timeouts.
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
+        self.status_code = status_code
+
+
+class CircuitOpenError(MeetingMindError):
+    """
+    Raised without calling the provider while its circuit breaker is open
+    after repeated failures.
+    """
+
+
+class StructuredOutputError(MeetingMindError):
+    """
+    Raised when an LLM output cannot be parsed into the requested structure,
+    even after local JSON repair and a repair request.
+    """
+
+
 
 def handle_errors(user_message="An unexpected error occurred"):
     """
@@ -46,6 +85,7 @@ def handle_errors(user_message="An unexpected error occurred"):
 
     Catches all exceptions, logs them, and returns a structured dictionary
     with an error message. Specifically handles MeetingMindError separately.
+    Works for both regular functions and coroutine functions.
 
     Args:
         user_message (str): User-friendly message to return for generic exceptions.
@@ -54,6 +94,19 @@ def handle_errors(user_message="An unexpected error occurred"):
         Callable: Wrapped function that handles exceptions and logs them.
     """
     def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                try:
+                    return await func(*args, **kwargs)
+                except MeetingMindError as e:
+                    logger.error(f"MeetingMindError: {e.message}")
+                    return {"status": "error", "message": e.message}
+                except Exception as e:
+                    logger.error(traceback.format_exc())
+                    return {"status": "error", "message": f"{user_message}: {str(e)}"}
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args, **kwargs):
             try:
@@ -0,0 +1,26 @@
+from src.llm.base_llm_client import BaseLLMClient
+from src.llm.cached_client import maybe_cached
+from src.llm.client_registry import get_client
+from src.llm.hedged_client import maybe_hedged
+from src.llm.single_flight import maybe_single_flight
+
+
+def build_analysis_client(namespace: str, client: BaseLLMClient = None) -> BaseLLMClient:
+    """
+    Build the LLM client of an analysis stage.
+
+    The base client defaults to the shared DeepSeekV3Client of the client
+    registry (API key from OPENROUTER_API_KEY), hedged when `llm.hedging.enabled`
+    is set. Responses are cached when `llm.cache.enabled` is set, and identical
+    requests in flight are sent once when `llm.single_flight.enabled` is set.
+
+    Args:
+        namespace (str): Stage name used for cache and deduplication statistics (e.g. "summarizer").
+        client (BaseLLMClient, optional): Custom base client (e.g., DeepSeekV3Client).
+                                          Defaults to the hedged shared DeepSeek client.
+
+    Returns:
+        BaseLLMClient: The wrapped client.
+    """
+    client = client or maybe_hedged(get_client("deepseek"))
+    return maybe_single_flight(maybe_cached(client, namespace), namespace)
@@ -1,4 +1,9 @@
 from abc import ABC, abstractmethod
+from typing import Iterator
+import asyncio
+
+from config.config_loader import load_model_config
+
 
 class BaseLLMClient(ABC):
     """
@@ -21,3 +26,84 @@ class BaseLLMClient(ABC):
             str: Text generated by the LLM.
         """
         pass
+
+    def describe(self) -> dict:
+        """
+        Describe the model and sampling settings that determine this client's output.
+
+        Used to key response caches; clients override it with their real settings.
+
+        Returns:
+            dict: provider, model, temperature and max_tokens (None when unknown).
+        """
+        return {"provider": type(self).__name__, "model": None, "temperature": None, "max_tokens": None}
+
+    def stream(self, prompt: str, **kwargs) -> Iterator[str]:
+        """
+        Generate text and yield it in pieces as it arrives.
+
+        Clients with a streaming API override this; the default yields the
+        complete `generate` result as a single piece.
+
+        Args:
+            prompt (str): Input prompt to send to the LLM.
+            **kwargs: Additional keyword arguments specific to the LLM implementation.
+
+        Yields:
+            str: Successive pieces of the generated text.
+        """
+        yield self.generate(prompt, **kwargs)
+
+    async def agenerate(self, prompt: str, *args, **kwargs) -> str:
+        """
+        Generate text without blocking the event loop.
+
+        Clients with a native async API override this; the default runs
+        `generate` in a worker thread.
+
+        Args:
+            prompt (str): Input prompt to send to the LLM.
+            *args, **kwargs: Same arguments as `generate` (e.g. an output parser).
+
+        Returns:
+            str: Text generated by the LLM.
+        """
+        return await asyncio.to_thread(self.generate, prompt, *args, **kwargs)
+
+
+def with_context(prompt: str, context: str = None) -> str:
+    """
+    Place shared context (e.g. a transcript) before a prompt, for clients without chat messages.
+
+    Args:
+        prompt (str): Task-specific prompt.
+        context (str, optional): Input shared by several requests.
+
+    Returns:
+        str: The prompt, preceded by the context when given.
+    """
+    return f"{context}\n\n{prompt}" if context else prompt
+
+
+async def generate_many(calls, max_concurrency: int = None) -> list:
+    """
+    Await several LLM calls concurrently, with at most `max_concurrency` in flight.
+
+    Args:
+        calls (Iterable[Awaitable]): Coroutines to run, e.g. `client.agenerate(prompt)`
+                                     or async analyzer methods.
+        max_concurrency (int, optional): Maximum calls in flight. Defaults to the
+                                         `llm.max_concurrency` config value or 4.
+
+    Returns:
+        list: Results in the order of `calls`.
+    """
+    if max_concurrency is None:
+        max_concurrency = load_model_config().get("llm", {}).get("max_concurrency", 4)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def bounded(call):
+        async with semaphore:
+            return await call
+
+    return await asyncio.gather(*(bounded(call) for call in calls))
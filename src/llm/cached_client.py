@@ -0,0 +1,350 @@
+from pathlib import Path
+import importlib
+import threading
+import hashlib
+import logging
+import sqlite3
+import json
+import time
+import sys
+
+from pydantic import BaseModel
+from langchain_core.output_parsers import StrOutputParser
+
+from config.config_loader import load_model_config
+from src.llm.base_llm_client import BaseLLMClient
+
+# Ensure project root is in sys.path for absolute imports
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+LLM_CACHE_DIR = PROJECT_ROOT / "data" / "llm_cache"
+LLM_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+_CACHE = None
+_CACHE_LOCK = threading.Lock()
+
+# Logging configuration
+logging.basicConfig(level=logging.INFO)
+
+
+def _serialize(value) -> str:
+    """Encode a client output (text, JSON data or Pydantic model) for storage."""
+    if isinstance(value, BaseModel):
+        model = type(value)
+        return json.dumps({
+            "type": "pydantic",
+            "model": f"{model.__module__}:{model.__qualname__}",
+            "data": value.model_dump(mode="json"),
+        })
+    return json.dumps({"type": "json", "data": value})
+
+
+def _deserialize(payload: str):
+    """Decode a stored output, rebuilding Pydantic models from their class path."""
+    entry = json.loads(payload)
+    if entry["type"] == "pydantic":
+        module, name = entry["model"].split(":")
+        return getattr(importlib.import_module(module), name).model_validate(entry["data"])
+    return entry["data"]
+
+
+def request_key(client: BaseLLMClient, prompt: str, output_parser=None, kwargs: dict = None) -> str:
+    """
+    Return a key identifying a full LLM request.
+
+    Covers the client's provider, model, temperature and max_tokens (from
+    `describe()`), a hash of the prompt, the output parser (and its Pydantic
+    model) and the call options.
+
+    Args:
+        client (BaseLLMClient): Client the request is sent to.
+        prompt (str): Input prompt.
+        output_parser (optional): Parser applied to the output.
+        kwargs (dict, optional): Additional call options.
+
+    Returns:
+        str: SHA-256 hex digest of the request.
+    """
+    parser = None
+    if output_parser is not None:
+        parser = type(output_parser).__name__
+        pydantic_object = getattr(output_parser, "pydantic_object", None)
+        if pydantic_object is not None:
+            parser += f":{pydantic_object.__module__}.{pydantic_object.__qualname__}"
+    payload = json.dumps(
+        {
+            "client": client.describe(),
+            "prompt": hashlib.sha256(prompt.encode()).hexdigest(),
+            "parser": parser,
+            "options": kwargs or {},
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class LLMResponseCache:
+    """
+    Persistent SQLite cache of LLM outputs with TTL and size-bounded LRU eviction.
+
+    Entries expire `ttl_hours` after they were written. When the stored
+    outputs exceed `max_size_mb`, the least recently used ones are deleted.
+    Hits and misses are counted per namespace (e.g. per analyzer).
+
+    Responsibilities:
+    - Store and look up outputs by cache key.
+    - Expire old entries and evict least recently used ones.
+    - Report hit rates per namespace.
+    """
+
+    def __init__(self, path: Path = None, ttl_hours: float = None, max_size_mb: float = None):
+        """
+        Initialize LLMResponseCache.
+
+        Args:
+            path (Path, optional): SQLite database file. Defaults to data/llm_cache/llm_cache.sqlite3.
+            ttl_hours (float, optional): Lifetime of an entry. Defaults to the
+                                         `llm.cache.ttl_hours` config value or 168 (one week).
+            max_size_mb (float, optional): Size limit of stored outputs. Defaults to the
+                                           `llm.cache.max_size_mb` config value or 100.
+        """
+        config = load_model_config().get("llm", {}).get("cache", {})
+        self.path = Path(path or LLM_CACHE_DIR / "llm_cache.sqlite3")
+        self.ttl_seconds = (ttl_hours or config.get("ttl_hours", 168)) * 3600
+        self.max_bytes = int((max_size_mb or config.get("max_size_mb", 100)) * 1024 * 1024)
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, namespace TEXT, value TEXT, size INTEGER, "
+            "created REAL, last_access REAL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_last_access ON responses (last_access)")
+        self._db.commit()
+        self._counters = {}
+
+    def _count(self, namespace: str, outcome: str):
+        counters = self._counters.setdefault(namespace, {"hits": 0, "misses": 0})
+        counters[outcome] += 1
+
+    def get(self, key: str, namespace: str = "default"):
+        """
+        Look up a cached output.
+
+        Args:
+            key (str): Cache key.
+            namespace (str, optional): Label the lookup is counted under.
+
+        Returns:
+            tuple: (found, value). `found` is False on a miss or expired entry.
+        """
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value FROM responses WHERE key = ? AND created >= ?", (key, now - self.ttl_seconds)
+            ).fetchone()
+            if row is None:
+                self._count(namespace, "misses")
+                return False, None
+            self._db.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+            self._db.commit()
+            self._count(namespace, "hits")
+        return True, _deserialize(row[0])
+
+    def put(self, key: str, value, namespace: str = "default"):
+        """
+        Store an output, then drop expired entries and evict over the size limit.
+
+        Args:
+            key (str): Cache key.
+            value: Output to store (str, JSON-serializable data or a Pydantic model).
+            namespace (str, optional): Label of the entry.
+        """
+        try:
+            payload = _serialize(value)
+        except TypeError as e:
+            logging.warning(f"Not caching LLM output of type {type(value).__name__}: {e}")
+            return
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (key, namespace, payload, len(payload), now, now),
+            )
+            self._db.execute("DELETE FROM responses WHERE created < ?", (now - self.ttl_seconds,))
+            self._evict()
+            self._db.commit()
+
+    def _evict(self):
+        """Delete least recently used entries until the cache fits. Must be called with the lock held."""
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        evicted = 0
+        for key, size in self._db.execute("SELECT key, size FROM responses ORDER BY last_access").fetchall():
+            if total <= self.max_bytes:
+                break
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            evicted += 1
+        logging.info(f"Evicted {evicted} LLM cache entries")
+
+    def stats(self) -> dict:
+        """
+        Return hit counters per namespace and the size of the cache.
+
+        Returns:
+            dict: {"namespaces": {name: {"hits", "misses", "hit_rate"}}, "entries": int, "size_bytes": int}
+        """
+        with self._lock:
+            entries, size = self._db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+            namespaces = {
+                name: {**counters, "hit_rate": counters["hits"] / max(counters["hits"] + counters["misses"], 1)}
+                for name, counters in self._counters.items()
+            }
+        return {"namespaces": namespaces, "entries": entries, "size_bytes": size}
+
+
+def get_llm_cache() -> LLMResponseCache:
+    """
+    Return the process-wide LLM response cache shared by all sessions.
+
+    Returns:
+        LLMResponseCache: The shared cache.
+    """
+    global _CACHE
+    with _CACHE_LOCK:
+        if _CACHE is None:
+            _CACHE = LLMResponseCache()
+        return _CACHE
+
+
+class CachedLLMClient(BaseLLMClient):
+    """
+    Wrapper that serves repeated LLM requests from the persistent response cache.
+
+    The cache key covers the wrapped client's provider, model, temperature and
+    max_tokens (from `describe()`), a hash of the prompt and the output parser,
+    so raw text and parsed outputs (Pydantic models, JSON dicts) of the same
+    prompt are stored separately.
+    """
+
+    def __init__(self, client: BaseLLMClient, namespace: str = "default", cache: LLMResponseCache = None):
+        """
+        Initialize CachedLLMClient.
+
+        Args:
+            client (BaseLLMClient): Client whose responses are cached.
+            namespace (str, optional): Label for hit statistics (e.g. the analyzer name).
+            cache (LLMResponseCache, optional): Cache to use. Defaults to the shared cache.
+        """
+        self.client = client
+        self.namespace = namespace
+        self.cache = cache or get_llm_cache()
+
+    def describe(self) -> dict:
+        return self.client.describe()
+
+    def _key(self, prompt: str, output_parser, kwargs: dict) -> str:
+        return request_key(self.client, prompt, output_parser, kwargs)
+
+    @staticmethod
+    def _cacheable(result, output_parser) -> bool:
+        """Skip raw text returned because a structured parser failed: it would be served as the parsed output."""
+        if isinstance(result, dict) and result.get("status") == "error":
+            return False
+        return output_parser is None or isinstance(output_parser, StrOutputParser) or not isinstance(result, str)
+
+    def generate(self, prompt: str, output_parser=None, **kwargs):
+        """
+        Generate a response, from the cache when the same request was made before.
+
+        Args:
+            prompt (str): Input prompt to send to the LLM.
+            output_parser (optional): Parser passed to the wrapped client.
+            **kwargs: Additional keyword arguments passed to the wrapped client.
+
+        Returns:
+            The wrapped client's output (text or parsed object).
+        """
+        key = self._key(prompt, output_parser, kwargs)
+        found, value = self.cache.get(key, self.namespace)
+        if found:
+            logging.info(f"LLM cache hit ({self.namespace})")
+            return value
+
+        result = self.client.generate(prompt, output_parser=output_parser, **kwargs)
+        if self._cacheable(result, output_parser):
+            self.cache.put(key, result, self.namespace)
+        return result
+
+    def stream(self, prompt: str, **kwargs):
+        """
+        Stream a response; a cached response is yielded as a single piece.
+
+        The streamed text is stored once the stream completes, under the same
+        key as an unparsed `generate` call. Nothing is stored when the wrapped
+        stream raises (e.g. it ended before the response was complete).
+
+        Args:
+            prompt (str): Input prompt to send to the LLM.
+            **kwargs: Additional keyword arguments passed to the wrapped client.
+
+        Yields:
+            str: Successive pieces of the generated text.
+        """
+        key = self._key(prompt, None, kwargs)
+        found, value = self.cache.get(key, self.namespace)
+        if found:
+            logging.info(f"LLM cache hit ({self.namespace})")
+            yield value
+            return
+
+        pieces = []
+        for piece in self.client.stream(prompt, **kwargs):
+            pieces.append(piece)
+            yield piece
+        self.cache.put(key, "".join(pieces), self.namespace)
+
+    async def agenerate(self, prompt: str, output_parser=None, **kwargs):
+        """
+        Async version of `generate`.
+
+        Args:
+            prompt (str): Input prompt to send to the LLM.
+            output_parser (optional): Parser passed to the wrapped client.
+            **kwargs: Additional keyword arguments passed to the wrapped client.
+
+        Returns:
+            The wrapped client's output (text or parsed object).
+        """
+        key = self._key(prompt, output_parser, kwargs)
+        found, value = self.cache.get(key, self.namespace)
+        if found:
+            logging.info(f"LLM cache hit ({self.namespace})")
+            return value
+
+        result = await self.client.agenerate(prompt, output_parser=output_parser, **kwargs)
+        if self._cacheable(result, output_parser):
+            self.cache.put(key, result, self.namespace)
+        return result
+
+
+def maybe_cached(client: BaseLLMClient, namespace: str) -> BaseLLMClient:
+    """
+    Wrap a client in `CachedLLMClient` when the `llm.cache.enabled` config value is set.
+
+    Args:
+        client (BaseLLMClient): Client to wrap.
+        namespace (str): Label for hit statistics (e.g. the analyzer name).
+
+    Returns:
+        BaseLLMClient: The cached wrapper, or the client itself when caching is off.
+    """
+    if load_model_config().get("llm", {}).get("cache", {}).get("enabled", True):
+        return CachedLLMClient(client, namespace)
+    return client
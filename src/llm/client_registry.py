@@ -0,0 +1,187 @@
+import os
+import atexit
+import asyncio
+import logging
+import threading
+import weakref
+from concurrent.futures import Future
+from dotenv import load_dotenv
+
+from src.llm.http_session import close_http_sessions, aclose_async_http_clients
+
+# Load environment variables
+load_dotenv()
+
+# Clients shared by the whole process: {(provider, options): client}
+_CLIENTS = {}
+# Async SDK clients are bound to the event loop they were created in: one table per loop
+_LOOP_CLIENTS = weakref.WeakKeyDictionary()
+_CLIENTS_LOCK = threading.Lock()
+
+# Long-lived event loop running the async LLM calls of the process (see `run_async`)
+_LOOP = None
+_LOOP_THREAD = None
+_LOOP_LOCK = threading.Lock()
+
+# Logging configuration
+logging.basicConfig(level=logging.INFO)
+
+
+def _deepseek(**options):
+    from src.llm.deepseek_client import DeepSeekV3Client
+    return DeepSeekV3Client(api_key=os.getenv("OPENROUTER_API_KEY"), **options)
+
+
+def _gemini(**options):
+    from src.llm.gemini_client import GeminiClient
+    return GeminiClient(api_key=os.getenv("GOOGLE_API_KEY"), **options)
+
+
+def _langchain_google(**options):
+    from src.llm.langchain_google_client import LangChainGoogleClient
+    return LangChainGoogleClient(api_key=os.getenv("GOOGLE_API_KEY"), **options)
+
+
+def _groq(**options):
+    from groq import Groq
+    # Retries are done by the shared rate limiter (src.llm.rate_limiter)
+    return Groq(api_key=os.getenv("GROQ_API_KEY"), max_retries=0, **options)
+
+
+def _groq_async(**options):
+    from groq import AsyncGroq
+    return AsyncGroq(api_key=os.getenv("GROQ_API_KEY"), max_retries=0, **options)
+
+
+# Client factories by provider name; clients are imported lazily so unused SDKs are never loaded
+CLIENT_FACTORIES = {
+    "deepseek": _deepseek,
+    "gemini": _gemini,
+    "langchain_google": _langchain_google,
+    "groq": _groq,
+    "groq_async": _groq_async,
+}
+ASYNC_PROVIDERS = {"groq_async"}
+
+
+def get_client(provider: str = "deepseek", **options):
+    """
+    Return the shared client of a provider and configuration, creating it on first use.
+
+    Every caller asking for the same provider and options gets the same
+    instance, so connection pools, rate limiters and warm state are shared by
+    all analyzers of the process. Clients of `ASYNC_PROVIDERS` are kept per
+    running event loop and must be requested from a coroutine.
+
+    Args:
+        provider (str, optional): One of `CLIENT_FACTORIES` ("deepseek", "gemini",
+                                  "langchain_google", "groq", "groq_async"). Defaults to "deepseek".
+        **options: Constructor arguments overriding the config (e.g. temperature=0.0).
+
+    Returns:
+        The shared client instance.
+
+    Raises:
+        ValueError: If the provider is unknown.
+    """
+    if provider not in CLIENT_FACTORIES:
+        raise ValueError(f"Unknown LLM provider '{provider}'. Available: {', '.join(CLIENT_FACTORIES)}")
+
+    key = (provider, tuple(sorted(options.items())))
+    with _CLIENTS_LOCK:
+        if provider in ASYNC_PROVIDERS:
+            clients = _LOOP_CLIENTS.setdefault(asyncio.get_running_loop(), {})
+        else:
+            clients = _CLIENTS
+        client = clients.get(key)
+        if client is None:
+            client = CLIENT_FACTORIES[provider](**options)
+            clients[key] = client
+            logging.info(f"Created shared {provider} client")
+        return client
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Return the background event loop, starting its thread on first use."""
+    global _LOOP, _LOOP_THREAD
+    with _LOOP_LOCK:
+        if _LOOP is None:
+            _LOOP = asyncio.new_event_loop()
+            _LOOP_THREAD = threading.Thread(target=_LOOP.run_forever, name="llm-event-loop", daemon=True)
+            _LOOP_THREAD.start()
+        return _LOOP
+
+
+def run_async(coro) -> Future:
+    """
+    Run a coroutine on the process-wide background event loop.
+
+    Async clients (`ASYNC_PROVIDERS`, pooled `httpx.AsyncClient`s) are bound to
+    the loop they were created in. Running every call on one long-lived loop
+    lets them be reused with their open connections, instead of being created
+    again and left open by each `asyncio.run`.
+
+    Args:
+        coro (Coroutine): Coroutine to run.
+
+    Returns:
+        concurrent.futures.Future: Future of the coroutine's result, usable from any thread.
+    """
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop())
+
+
+async def aclose_loop_clients():
+    """
+    Close the async clients and HTTP clients bound to the running event loop.
+
+    Await it before a loop that made async calls ends (e.g. at the end of the
+    coroutine given to `asyncio.run`); `run_async` does not need it.
+    """
+    with _CLIENTS_LOCK:
+        clients = list(_LOOP_CLIENTS.pop(asyncio.get_running_loop(), {}).values())
+    for client in clients:
+        try:
+            await client.close()
+        except Exception as e:
+            logging.warning(f"Failed to close {type(client).__name__}: {e}")
+    await aclose_async_http_clients()
+
+
+def shutdown():
+    """
+    Close every shared client and HTTP session; later `get_client` calls create new ones.
+
+    Intended for process exit and tests. Async clients of the background loop
+    are closed on it before it stops. Those of other loops can only be closed
+    on their own loop (see `aclose_loop_clients`) and are just dropped here.
+    """
+    global _LOOP, _LOOP_THREAD
+    with _LOOP_LOCK:
+        loop, thread = _LOOP, _LOOP_THREAD
+        _LOOP = _LOOP_THREAD = None
+    if loop is not None:
+        try:
+            asyncio.run_coroutine_threadsafe(aclose_loop_clients(), loop).result(timeout=10)
+        except Exception as e:
+            logging.warning(f"Failed to close async clients: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=10)
+        if not thread.is_alive():
+            loop.close()
+
+    with _CLIENTS_LOCK:
+        clients = list(_CLIENTS.values())
+        _CLIENTS.clear()
+        _LOOP_CLIENTS.clear()
+
+    for client in clients:
+        close = getattr(client, "close", None)
+        if callable(close):
+            try:
+                close()
+            except Exception as e:
+                logging.warning(f"Failed to close {type(client).__name__}: {e}")
+    close_http_sessions()
+
+
+atexit.register(shutdown)
@@ -1,7 +1,19 @@
+from typing import Iterator
 import requests
+import httpx
+import logging
 import json
+import time
+import threading
 from config.config_loader import load_model_config
 from src.llm.base_llm_client import BaseLLMClient
+from src.llm.http_session import get_http_session, get_async_http_client
+from src.llm.rate_limiter import get_rate_limiter, estimate_tokens, parse_retry_after
+from src.llm.structured_output import parse_output, aparse_output
+from src.handlers.error_handler import RateLimitError
+
+# Statuses retried with backoff: rate limited, or the provider is temporarily unavailable
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
 
 
 class DeepSeekV3Client(BaseLLMClient):
@@ -11,8 +23,14 @@ class DeepSeekV3Client(BaseLLMClient):
     Responsibilities:
     - Load DeepSeek model configuration from config file.
     - Initialize API client with authentication and model parameters.
-    - Generate text responses from prompts.
-    - Optionally parse output into structured JSON using an output parser.
+    - Reuse pooled keep-alive connections with connect/read timeouts.
+    - Stay within the provider's shared rate limits, retrying 429/5xx responses,
+      timeouts and connection errors.
+    - Generate text responses from prompts, blocking, async or streamed token by token.
+    - Record the token usage reported for the latest call, and running totals
+      of prompt tokens served from the provider's prompt cache.
+    - Optionally request JSON output and parse it with an output parser,
+      repairing malformed JSON instead of returning raw text.
     """
     def __init__(self, api_key: str, model_name: str = None, temperature: float = None, max_tokens: int = None):
         """
@@ -31,11 +49,138 @@ class DeepSeekV3Client(BaseLLMClient):
         
         self.api_key = api_key
         self.model_name = model_name or config.get("model_name", "deepseek/deepseek-chat")
-        self.temperature = temperature or config.get("temperature", 0.3)
+        self.temperature = temperature if temperature is not None else config.get("temperature", 0.3)
         self.max_tokens = max_tokens or config.get("max_tokens", 1024)
-        self.url = "https://openrouter.ai/api/v1/chat/completions"
+        self.url = config.get("url", "https://openrouter.ai/api/v1/chat/completions")
+
+        http = config.get("http", {})
+        self.provider = config.get("provider", "openrouter")
+        self.timeout = (http.get("connect_timeout", 5), http.get("read_timeout", 120))
+        self.pool_maxsize = http.get("pool_maxsize", 10)
+        self.session = get_http_session(
+            self.provider,
+            pool_connections=http.get("pool_connections", 4),
+            pool_maxsize=self.pool_maxsize,
+        )
+        self.rate_limiter = get_rate_limiter(self.provider, "deepseek")
+        # Token counts of the latest completed call, as reported by the API
+        self.last_usage = None
+        self._usage_totals = {"calls": 0, "prompt_tokens": 0, "cached_tokens": 0, "completion_tokens": 0}
+        self._usage_lock = threading.Lock()
+        # Ask for the provider's JSON response format when structured output is requested
+        self.json_mode = load_model_config().get("llm", {}).get("structured_output", {}).get("json_mode", True)
+
+    def describe(self) -> dict:
+        return {
+            "provider": self.provider,
+            "model": self.model_name,
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens,
+        }
+
+    def _headers(self) -> dict:
+        return {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.api_key}",
+            "HTTP-Referer": "https://yourproject.com",
+            "X-Title": "MeetingMind-App"
+        }
+
+    def _payload(self, prompt: str, json_output: bool = False, context: str = None) -> dict:
+        messages = [{"role": "user", "content": prompt}]
+        if context:
+            # Leading message shared by every request about the same input: a cacheable prefix
+            messages.insert(0, {"role": "system", "content": context})
+        payload = {
+            "model": self.model_name,
+            "messages": messages,
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens
+        }
+        if json_output and self.json_mode:
+            payload["response_format"] = {"type": "json_object"}
+        return payload
+
+    @staticmethod
+    def _check_response(status_code: int, headers, text: str):
+        """
+        Raise for an unsuccessful response.
+
+        Raises:
+            RateLimitError: For retryable statuses (429, 500, 502, 503, 504), with the `Retry-After` wait.
+            RuntimeError: For any other status != 200.
+        """
+        if status_code in RETRYABLE_STATUSES:
+            raise RateLimitError(
+                f"DeepSeek API Error {status_code}: {text}",
+                retry_after=parse_retry_after(headers.get("Retry-After")),
+                status_code=status_code,
+            )
+        if status_code != 200:
+            raise RuntimeError(f"DeepSeek API Error {status_code}: {text}")
+
+    def _tokens(self, prompt: str, context: str = None) -> int:
+        return estimate_tokens((context or "") + prompt, self.max_tokens)
+
+    def _record_usage(self, usage: dict):
+        """Keep the usage of a completed call, adding it to the running totals."""
+        self.last_usage = usage
+        if not usage:
+            return
+        details = usage.get("prompt_tokens_details") or {}
+        with self._usage_lock:
+            self._usage_totals["calls"] += 1
+            self._usage_totals["prompt_tokens"] += usage.get("prompt_tokens") or 0
+            self._usage_totals["cached_tokens"] += details.get("cached_tokens") or 0
+            self._usage_totals["completion_tokens"] += usage.get("completion_tokens") or 0
+
+    def usage_stats(self) -> dict:
+        """
+        Return the token usage of all calls made through this client.
+
+        Returns:
+            dict: calls, prompt_tokens, cached_tokens (prompt tokens served from the
+                  provider's prompt cache), completion_tokens and cached_rate.
+        """
+        with self._usage_lock:
+            totals = dict(self._usage_totals)
+        return {**totals, "cached_rate": totals["cached_tokens"] / max(totals["prompt_tokens"], 1)}
+
+    def _complete(self, prompt: str, json_output: bool = False, context: str = None) -> str:
+        """Send one chat completion request and return the generated text."""
+        def post():
+            try:
+                response = self.session.post(
+                    self.url, headers=self._headers(), json=self._payload(prompt, json_output, context), timeout=self.timeout
+                )
+            except (requests.Timeout, requests.ConnectionError) as e:
+                raise RateLimitError(f"DeepSeek API connection error (timeouts {self.timeout} s connect, read): {e}") from e
+            self._check_response(response.status_code, response.headers, response.text)
+            return response.json()
+
+        data = self.rate_limiter.call(post, self._tokens(prompt, context))
+        self._record_usage(data.get("usage"))
+        return data["choices"][0]["message"]["content"]
+
+    async def _acomplete(self, prompt: str, json_output: bool = False, context: str = None) -> str:
+        """Async version of `_complete`, using the pooled async HTTP client of the running loop."""
+        client = get_async_http_client(self.provider, pool_maxsize=self.pool_maxsize, timeout=self.timeout)
+
+        async def post():
+            try:
+                response = await client.post(self.url, headers=self._headers(), json=self._payload(prompt, json_output, context))
+            except (httpx.TimeoutException, httpx.NetworkError) as e:
+                raise RateLimitError(f"DeepSeek API connection error (timeouts {self.timeout} s connect, read): {e}") from e
+            self._check_response(response.status_code, response.headers, response.text)
+            return response.json()
 
-    def generate(self, prompt: str, output_parser=None, **kwargs) -> str:
+        data = await self.rate_limiter.acall(post, self._tokens(prompt, context))
+        self._record_usage(data.get("usage"))
+        return data["choices"][0]["message"]["content"]
+
+    def generate(
+        self, prompt: str, output_parser=None, json_output: bool = False, context: str = None, **kwargs
+    ) -> str:
         """
         Generate a response from DeepSeek-V3 model.
 
@@ -43,40 +188,127 @@ class DeepSeekV3Client(BaseLLMClient):
             prompt (str): The input prompt to send to the model.
             output_parser (optional): An object with a `.parse()` method to convert
                                       raw text into structured output (e.g., JSON).
+                                      Malformed JSON is repaired (see `parse_output`).
+            json_output (bool, optional): Request the JSON response format. Defaults to False.
+            context (str, optional): Input shared by several requests (e.g. the transcript),
+                                     sent as a leading system message before the prompt.
             **kwargs: Additional keyword arguments (reserved for future use).
 
         Returns:
             str: The model-generated text, optionally parsed via output_parser.
 
         Raises:
+            RateLimitError: If the call is still rate limited, or the provider unavailable
+                            (5xx, timeout, connection error), after the configured retries.
+            CircuitOpenError: If the provider's circuit breaker is open.
+            StructuredOutputError: If the output cannot be parsed, even after repair.
             RuntimeError: If the API response is not successful (HTTP status != 200).
         """
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self.api_key}",
-            "HTTP-Referer": "https://yourproject.com",
-            "X-Title": "MeetingMind-App"
-        }
+        text = self._complete(prompt, json_output, context)
+        return parse_output(text, output_parser, repair=lambda repair: self._complete(repair, json_output=True))
 
-        payload = {
-            "model": self.model_name,
-            "messages": [{"role": "user", "content": prompt}],
-            "temperature": self.temperature,
-            "max_tokens": self.max_tokens
-        }
+    def stream(self, prompt: str, context: str = None, **kwargs) -> Iterator[str]:
+        """
+        Stream a response from DeepSeek-V3 model as server-sent events.
 
-        response = requests.post(self.url, headers=headers, json=payload)
+        Yields the content of each SSE chunk as it arrives and logs the time to
+        first token and the total time of the call.
 
-        if response.status_code != 200:
-            raise RuntimeError(f"DeepSeek API Error {response.status_code}: {response.text}")
+        Args:
+            prompt (str): The input prompt to send to the model.
+            context (str, optional): Input shared by several requests, sent as a leading system message.
+            **kwargs: Additional keyword arguments (reserved for future use).
+
+        Yields:
+            str: Successive pieces of the generated text.
 
-        data = response.json()
-        text = data["choices"][0]["message"]["content"]
+        Raises:
+            RateLimitError: If the call is still rate limited, or the provider unavailable
+                            (5xx, timeout, connection error), after the configured retries.
+            CircuitOpenError: If the provider's circuit breaker is open.
+            RuntimeError: If the API response is not successful (HTTP status != 200),
+                          the stream reports an error or it ends without `[DONE]`
+                          or a finish reason.
+        """
+        # The final chunk carries the usage of the call
+        payload = {**self._payload(prompt, context=context), "stream": True, "stream_options": {"include_usage": True}}
+        start = time.perf_counter()
+        first_token = None
 
-        if output_parser:
+        def post():
             try:
-                return output_parser.parse(text)
-            except Exception:
-                pass
+                response = self.session.post(
+                    self.url, headers=self._headers(), json=payload, timeout=self.timeout, stream=True
+                )
+            except (requests.Timeout, requests.ConnectionError) as e:
+                raise RateLimitError(f"DeepSeek API connection error (timeouts {self.timeout} s connect, read): {e}") from e
+            if response.status_code != 200:
+                with response:
+                    self._check_response(response.status_code, response.headers, response.text)
+            return response
 
-        return text
+        # Only the request is retried: once tokens have been yielded the stream cannot be replayed
+        response = self.rate_limiter.call(post, self._tokens(prompt, context))
+        finished = False
+        with response:
+            for line in response.iter_lines(decode_unicode=True):
+                # Blank lines separate events; lines starting with ":" are keep-alive comments
+                if not line or not line.startswith("data:"):
+                    continue
+                data = line[len("data:"):].strip()
+                if data == "[DONE]":
+                    finished = True
+                    break
+
+                chunk = json.loads(data)
+                if "error" in chunk:
+                    raise RuntimeError(f"DeepSeek API stream error: {chunk['error']}")
+                if chunk.get("usage"):
+                    self._record_usage(chunk["usage"])
+                choices = chunk.get("choices") or [{}]
+                finished = finished or bool(choices[0].get("finish_reason"))
+                token = choices[0].get("delta", {}).get("content")
+                if token:
+                    if first_token is None:
+                        first_token = time.perf_counter() - start
+                        logging.info(f"DeepSeek time to first token: {first_token * 1000:.0f} ms")
+                    yield token
+
+        # A dropped connection also ends the event stream: the text yielded so far is truncated
+        if not finished:
+            raise RuntimeError("DeepSeek API stream ended before the response was complete")
+        logging.info(f"DeepSeek stream complete in {time.perf_counter() - start:.2f} s")
+
+    async def agenerate(
+        self, prompt: str, output_parser=None, json_output: bool = False, context: str = None, **kwargs
+    ) -> str:
+        """
+        Generate a response from DeepSeek-V3 model without blocking the event loop.
+
+        Uses a pooled `httpx.AsyncClient` shared by all clients of the provider
+        on the running event loop.
+
+        Args:
+            prompt (str): The input prompt to send to the model.
+            output_parser (optional): An object with a `.parse()` method to convert
+                                      raw text into structured output (e.g., JSON).
+                                      Malformed JSON is repaired (see `parse_output`).
+            json_output (bool, optional): Request the JSON response format. Defaults to False.
+            context (str, optional): Input shared by several requests (e.g. the transcript),
+                                     sent as a leading system message before the prompt.
+            **kwargs: Additional keyword arguments (reserved for future use).
+
+        Returns:
+            str: The model-generated text, optionally parsed via output_parser.
+
+        Raises:
+            RateLimitError: If the call is still rate limited, or the provider unavailable
+                            (5xx, timeout, connection error), after the configured retries.
+            CircuitOpenError: If the provider's circuit breaker is open.
+            StructuredOutputError: If the output cannot be parsed, even after repair.
+            RuntimeError: If the API response is not successful (HTTP status != 200).
+        """
+        text = await self._acomplete(prompt, json_output, context)
+        return await aparse_output(
+            text, output_parser, arepair=lambda repair: self._acomplete(repair, json_output=True)
+        )
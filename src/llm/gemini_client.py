@@ -1,8 +1,22 @@
 from abc import ABC
+import threading
 import google.generativeai as genai
 
 from config.config_loader import load_model_config
-from src.llm.base_llm_client import BaseLLMClient
+from src.llm.base_llm_client import BaseLLMClient, with_context
+from src.llm.structured_output import parse_output, aparse_output
+
+# genai.configure sets process-wide state: only call it when the API key changes
+_CONFIGURED_KEY = None
+_CONFIGURE_LOCK = threading.Lock()
+
+
+def _configure(api_key: str):
+    global _CONFIGURED_KEY
+    with _CONFIGURE_LOCK:
+        if api_key != _CONFIGURED_KEY:
+            genai.configure(api_key=api_key)
+            _CONFIGURED_KEY = api_key
 
 
 class GeminiClient(BaseLLMClient):
@@ -25,28 +39,82 @@ class GeminiClient(BaseLLMClient):
                                           in JSON format. Defaults to False.
         """
         config = load_model_config()["gemini"]
-        genai.configure(api_key=api_key)
+        _configure(api_key)
 
         model_name = config["model_name"]
-        generation_config = config["generation"]
+        # Copied: the JSON option below must not leak into other clients' settings
+        generation_config = dict(config["generation"])
 
         if json_output or config.get("json_output", False):
             generation_config["response_mime_type"] = "application/json"
 
+        self.model_name = model_name
+        self.generation_config = generation_config
         self.model = genai.GenerativeModel(
             model_name=model_name,
             generation_config=generation_config
         )
 
-    def generate(self, prompt: str, **kwargs) -> str:
+    def describe(self) -> dict:
+        return {
+            "provider": "gemini",
+            "model": self.model_name,
+            "temperature": self.generation_config.get("temperature"),
+            "max_tokens": self.generation_config.get("max_output_tokens"),
+            "generation": self.generation_config,
+        }
+
+    def _request_config(self, json_output: bool) -> dict | None:
+        """Per-call generation settings: the JSON response type when structured output is requested."""
+        return {"response_mime_type": "application/json"} if json_output else None
+
+    def _complete(self, prompt: str, json_output: bool = False) -> str:
+        return self.model.generate_content(prompt, generation_config=self._request_config(json_output)).text
+
+    async def _acomplete(self, prompt: str, json_output: bool = False) -> str:
+        response = await self.model.generate_content_async(prompt, generation_config=self._request_config(json_output))
+        return response.text
+
+    def generate(
+        self, prompt: str, output_parser=None, json_output: bool = False, context: str = None, **kwargs
+    ) -> str:
         """
         Generate a chat response from the Gemini LLM.
 
         Args:
             prompt (str): The input prompt to send to the model.
+            output_parser (optional): An object with a `.parse()` method to convert
+                                      raw text into structured output (e.g., JSON).
+                                      Malformed JSON is repaired (see `parse_output`).
+            json_output (bool, optional): Request a JSON response. Defaults to False.
+            context (str, optional): Input shared by several requests (e.g. the transcript),
+                                     placed before the prompt.
 
         Returns:
-            object: The raw response object from Gemini containing the generated content.
+            str: The generated text, optionally parsed via output_parser.
         """
-        response = self.model.generate_content(prompt)
-        return response.text
+        text = self._complete(with_context(prompt, context), json_output)
+        return parse_output(text, output_parser, repair=lambda repair: self._complete(repair, json_output=True))
+
+    async def agenerate(
+        self, prompt: str, output_parser=None, json_output: bool = False, context: str = None, **kwargs
+    ) -> str:
+        """
+        Generate a chat response from the Gemini LLM without blocking the event loop.
+
+        Args:
+            prompt (str): The input prompt to send to the model.
+            output_parser (optional): An object with a `.parse()` method to convert
+                                      raw text into structured output (e.g., JSON).
+                                      Malformed JSON is repaired (see `parse_output`).
+            json_output (bool, optional): Request a JSON response. Defaults to False.
+            context (str, optional): Input shared by several requests (e.g. the transcript),
+                                     placed before the prompt.
+
+        Returns:
+            str: The generated text, optionally parsed via output_parser.
+        """
+        text = await self._acomplete(with_context(prompt, context), json_output)
+        return await aparse_output(
+            text, output_parser, arepair=lambda repair: self._acomplete(repair, json_output=True)
+        )
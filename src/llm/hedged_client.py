@@ -0,0 +1,373 @@
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from collections import deque
+import threading
+import logging
+import asyncio
+import bisect
+import math
+import time
+
+from config.config_loader import load_model_config
+from src.llm.base_llm_client import BaseLLMClient
+from src.llm.client_registry import get_client
+
+# Upper bounds (seconds) of the latency histogram buckets; the last bucket is open-ended
+LATENCY_BUCKETS = (0.5, 1, 2, 5, 10, 20, 30, 60)
+
+# Latency histograms shared by every client of the same provider and model
+_HISTOGRAMS = {}
+_HISTOGRAMS_LOCK = threading.Lock()
+
+# Threads running blocking hedged calls, one pool per role: {"primary"|"secondary": executor}.
+# A losing call keeps its thread until it returns, so stuck primaries never delay a hedge.
+_EXECUTORS = {}
+_EXECUTOR_LOCK = threading.Lock()
+
+# Logging configuration
+logging.basicConfig(level=logging.INFO)
+
+
+class LatencyHistogram:
+    """
+    Latencies of successful calls to one provider.
+
+    Keeps bucket counts over the process lifetime and a window of recent
+    latencies from which percentiles are computed.
+    """
+
+    def __init__(self, window: int = 200):
+        """
+        Initialize LatencyHistogram.
+
+        Args:
+            window (int, optional): Recent latencies kept for percentiles. Defaults to 200.
+        """
+        self.recent = deque(maxlen=window)
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.errors = 0
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float):
+        with self._lock:
+            self.recent.append(seconds)
+            self.buckets[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+
+    def record_error(self):
+        with self._lock:
+            self.errors += 1
+
+    def percentile(self, percent: float) -> float | None:
+        """
+        Return a percentile of the recent latencies.
+
+        Args:
+            percent (float): Percentile between 0 and 100.
+
+        Returns:
+            float | None: Latency in seconds, or None without samples.
+        """
+        with self._lock:
+            samples = sorted(self.recent)
+        if not samples:
+            return None
+        return samples[max(0, math.ceil(percent / 100 * len(samples)) - 1)]
+
+    def stats(self) -> dict:
+        """
+        Return the histogram and recent percentiles.
+
+        Returns:
+            dict: samples, errors, p50/p95/p99 (seconds) and counts per bucket ("<=0.5s", ..., ">60s").
+        """
+        with self._lock:
+            buckets = list(self.buckets)
+            samples, errors = len(self.recent), self.errors
+        labels = [f"<={bound}s" for bound in LATENCY_BUCKETS] + [f">{LATENCY_BUCKETS[-1]}s"]
+        return {
+            "samples": samples,
+            "errors": errors,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "buckets": dict(zip(labels, buckets)),
+        }
+
+
+def get_latency_histogram(client: BaseLLMClient, window: int = 200) -> LatencyHistogram:
+    """
+    Return the shared latency histogram of a client's provider and model.
+
+    Args:
+        client (BaseLLMClient): Client whose `describe()` identifies the provider and model.
+        window (int, optional): Recent latencies kept, used when the histogram is created.
+
+    Returns:
+        LatencyHistogram: Histogram shared by all clients of the same provider and model.
+    """
+    description = client.describe()
+    name = f"{description['provider']}:{description['model']}"
+    with _HISTOGRAMS_LOCK:
+        histogram = _HISTOGRAMS.get(name)
+        if histogram is None:
+            histogram = LatencyHistogram(window)
+            _HISTOGRAMS[name] = histogram
+        return histogram
+
+
+def latency_stats() -> dict:
+    """
+    Return the latency histograms of every provider seen so far.
+
+    Returns:
+        dict: {"provider:model": LatencyHistogram.stats()}
+    """
+    with _HISTOGRAMS_LOCK:
+        histograms = dict(_HISTOGRAMS)
+    return {name: histogram.stats() for name, histogram in histograms.items()}
+
+
+def _get_executor(role: str) -> ThreadPoolExecutor:
+    """Return the thread pool of blocking calls to the primary or secondary clients."""
+    with _EXECUTOR_LOCK:
+        executor = _EXECUTORS.get(role)
+        if executor is None:
+            max_workers = load_model_config().get("llm", {}).get("hedging", {}).get("max_workers", 16)
+            executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"llm-hedge-{role}")
+            _EXECUTORS[role] = executor
+        return executor
+
+
+class HedgedLLMClient(BaseLLMClient):
+    """
+    Composite client that hedges slow requests to a primary provider with a secondary one.
+
+    The request goes to the primary client first. If it has not answered
+    within the hedge delay (a percentile of the primary's recent latencies),
+    or it fails, the same request is sent to the secondary client and the
+    first successful answer is returned. Async losers are cancelled; a
+    blocking loser cannot be interrupted, so its result is discarded.
+
+    Responsibilities:
+    - Derive the hedge delay from the primary's latency histogram.
+    - Race primary and secondary calls and return the first answer.
+    - Count hedges, failovers and secondary wins.
+    """
+
+    def __init__(
+        self,
+        primary: BaseLLMClient,
+        secondary: BaseLLMClient,
+        percentile: float = None,
+        min_samples: int = None,
+        initial_delay: float = None,
+        min_delay: float = None,
+    ):
+        """
+        Initialize HedgedLLMClient.
+
+        Args:
+            primary (BaseLLMClient): Client every request is sent to first.
+            secondary (BaseLLMClient): Client hedges and failovers are sent to.
+            percentile (float, optional): Percentile of recent primary latencies used as hedge delay.
+                                          Defaults to the `llm.hedging.percentile` config value or 95.
+            min_samples (int, optional): Samples needed before the percentile is used. Defaults to
+                                         the `llm.hedging.min_samples` config value or 20.
+            initial_delay (float, optional): Hedge delay until then, in seconds. Defaults to the
+                                             `llm.hedging.initial_delay_seconds` config value or 10.
+            min_delay (float, optional): Lower bound of the hedge delay, in seconds. Defaults to the
+                                         `llm.hedging.min_delay_seconds` config value or 2.
+        """
+        config = load_model_config().get("llm", {}).get("hedging", {})
+        self.primary = primary
+        self.secondary = secondary
+        self.percentile = percentile or config.get("percentile", 95)
+        self.min_samples = min_samples or config.get("min_samples", 20)
+        self.initial_delay = initial_delay or config.get("initial_delay_seconds", 10)
+        self.min_delay = min_delay if min_delay is not None else config.get("min_delay_seconds", 2)
+
+        window = config.get("window", 200)
+        self.latency = {
+            "primary": get_latency_histogram(primary, window),
+            "secondary": get_latency_histogram(secondary, window),
+        }
+        self._counters = {"requests": 0, "hedged": 0, "failovers": 0, "secondary_wins": 0}
+        self._lock = threading.Lock()
+
+    def describe(self) -> dict:
+        primary = self.primary.describe()
+        return {**primary, "provider": f"hedged:{primary['provider']}", "secondary": self.secondary.describe()}
+
+    def hedge_delay(self) -> float:
+        """
+        Return how long to wait for the primary before sending a hedge.
+
+        Returns:
+            float: Seconds; `initial_delay` until `min_samples` latencies were recorded.
+        """
+        histogram = self.latency["primary"]
+        if len(histogram.recent) < self.min_samples:
+            return self.initial_delay
+        return max(self.min_delay, histogram.percentile(self.percentile))
+
+    def _count(self, counter: str):
+        with self._lock:
+            self._counters[counter] += 1
+
+    def _timed(self, role: str, prompt: str, output_parser, kwargs: dict):
+        """Call one client, recording its latency or error."""
+        client = self.primary if role == "primary" else self.secondary
+        start = time.perf_counter()
+        try:
+            result = client.generate(prompt, output_parser=output_parser, **kwargs)
+        except Exception:
+            self.latency[role].record_error()
+            raise
+        self.latency[role].record(time.perf_counter() - start)
+        return role, result
+
+    async def _atimed(self, role: str, prompt: str, output_parser, kwargs: dict):
+        """Async version of `_timed`; a cancelled call records nothing."""
+        client = self.primary if role == "primary" else self.secondary
+        start = time.perf_counter()
+        try:
+            result = await client.agenerate(prompt, output_parser=output_parser, **kwargs)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.latency[role].record_error()
+            raise
+        self.latency[role].record(time.perf_counter() - start)
+        return role, result
+
+    def _hedge_reason(self, primary_failed: bool, delay: float) -> str:
+        self._count("failovers" if primary_failed else "hedged")
+        reason = "failed" if primary_failed else f"no answer after {delay:.1f} s"
+        logging.info(f"Primary LLM {reason}; sending request to secondary")
+        return reason
+
+    def _won(self, role: str, result):
+        if role == "secondary":
+            self._count("secondary_wins")
+        return result
+
+    def generate(self, prompt: str, output_parser=None, **kwargs):
+        """
+        Generate a response, hedging to the secondary client if the primary is slow or fails.
+
+        Args:
+            prompt (str): Input prompt to send to the LLM.
+            output_parser (optional): Parser passed to both clients.
+            **kwargs: Additional keyword arguments passed to both clients.
+
+        Returns:
+            The first successful output.
+
+        Raises:
+            Exception: The primary's error, if both clients fail.
+        """
+        self._count("requests")
+        delay = self.hedge_delay()
+        primary = _get_executor("primary").submit(self._timed, "primary", prompt, output_parser, kwargs)
+        done, _ = wait([primary], timeout=delay)
+        if done and primary.exception() is None:
+            return self._won(*primary.result())
+
+        self._hedge_reason(bool(done), delay)
+        secondary = _get_executor("secondary").submit(self._timed, "secondary", prompt, output_parser, kwargs)
+        pending = {primary, secondary}
+        errors = {}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    return self._won(*future.result())
+                errors[future is primary] = future.exception()
+        raise errors[True]
+
+    async def agenerate(self, prompt: str, output_parser=None, **kwargs):
+        """
+        Async version of `generate`; the losing call is cancelled.
+
+        Args:
+            prompt (str): Input prompt to send to the LLM.
+            output_parser (optional): Parser passed to both clients.
+            **kwargs: Additional keyword arguments passed to both clients.
+
+        Returns:
+            The first successful output.
+
+        Raises:
+            Exception: The primary's error, if both clients fail.
+        """
+        self._count("requests")
+        delay = self.hedge_delay()
+        primary = asyncio.create_task(self._atimed("primary", prompt, output_parser, kwargs))
+        pending = {primary}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=delay)
+            if done and primary.exception() is None:
+                return self._won(*primary.result())
+
+            self._hedge_reason(bool(done), delay)
+            pending.add(asyncio.create_task(self._atimed("secondary", prompt, output_parser, kwargs)))
+            errors = {}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return self._won(*task.result())
+                    errors[task is primary] = task.exception()
+            raise errors[True]
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def stream(self, prompt: str, **kwargs):
+        """
+        Stream a response from the primary client (streams are not hedged).
+
+        Args:
+            prompt (str): Input prompt to send to the LLM.
+            **kwargs: Additional keyword arguments passed to the primary client.
+
+        Yields:
+            str: Successive pieces of the generated text.
+        """
+        yield from self.primary.stream(prompt, **kwargs)
+
+    def stats(self) -> dict:
+        """
+        Return hedging counters and the latency histograms of both providers.
+
+        Returns:
+            dict: requests, hedged, failovers, secondary_wins, hedge_rate, hedge_delay and
+                  {"latency": {"primary": ..., "secondary": ...}}.
+        """
+        with self._lock:
+            counters = dict(self._counters)
+        return {
+            **counters,
+            "hedge_rate": (counters["hedged"] + counters["failovers"]) / max(counters["requests"], 1),
+            "hedge_delay": self.hedge_delay(),
+            "latency": {role: histogram.stats() for role, histogram in self.latency.items()},
+        }
+
+
+def maybe_hedged(client: BaseLLMClient) -> BaseLLMClient:
+    """
+    Wrap a client in `HedgedLLMClient` when the `llm.hedging.enabled` config value is set.
+
+    The secondary is the shared registry client named by `llm.hedging.secondary`
+    ("gemini" or "langchain_google", authenticated with GOOGLE_API_KEY).
+
+    Args:
+        client (BaseLLMClient): Primary client.
+
+    Returns:
+        BaseLLMClient: The hedged wrapper, or the client itself when hedging is off.
+    """
+    config = load_model_config().get("llm", {}).get("hedging", {})
+    if not config.get("enabled", False):
+        return client
+
+    return HedgedLLMClient(client, get_client(config.get("secondary", "gemini")))
@@ -0,0 +1,89 @@
+import asyncio
+import logging
+import threading
+import weakref
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+# Sessions shared by every client of the same provider, so all analyzers reuse one pool
+_SESSIONS = {}
+_SESSIONS_LOCK = threading.Lock()
+
+# Async clients are bound to the event loop they were created in: one set per loop
+_ASYNC_CLIENTS = weakref.WeakKeyDictionary()
+
+
+def get_http_session(name: str, pool_connections: int = 4, pool_maxsize: int = 10) -> requests.Session:
+    """
+    Return the shared keep-alive HTTP session of a provider, creating it on first use.
+
+    The session's connection pool keeps TCP+TLS connections open between calls,
+    so later requests skip the handshake. A `requests.Session` can be used from
+    several threads for plain requests; the pool hands each thread its own connection.
+
+    Args:
+        name (str): Provider name (e.g. "openrouter"); one session is kept per name.
+        pool_connections (int, optional): Number of hosts with a cached pool. Defaults to 4.
+        pool_maxsize (int, optional): Connections kept open per host. Defaults to 10.
+
+    Returns:
+        requests.Session: Session with pooled HTTP and HTTPS adapters.
+    """
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(name)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _SESSIONS[name] = session
+        return session
+
+
+def get_async_http_client(name: str, pool_maxsize: int = 10, timeout: tuple = (5, 120)) -> httpx.AsyncClient:
+    """
+    Return the shared keep-alive async HTTP client of a provider for the running event loop.
+
+    Args:
+        name (str): Provider name (e.g. "openrouter"); one client is kept per name and loop.
+        pool_maxsize (int, optional): Connections kept open. Defaults to 10.
+        timeout (tuple, optional): (connect, read) timeouts in seconds. Defaults to (5, 120).
+
+    Returns:
+        httpx.AsyncClient: Pooled client usable from coroutines on the current loop.
+    """
+    with _SESSIONS_LOCK:
+        clients = _ASYNC_CLIENTS.setdefault(asyncio.get_running_loop(), {})
+        client = clients.get(name)
+        if client is None:
+            connect, read = timeout
+            client = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=pool_maxsize, max_keepalive_connections=pool_maxsize),
+                timeout=httpx.Timeout(read, connect=connect),
+            )
+            clients[name] = client
+        return client
+
+
+def close_http_sessions():
+    """
+    Close every shared session and its pooled connections.
+    """
+    with _SESSIONS_LOCK:
+        for session in _SESSIONS.values():
+            session.close()
+        _SESSIONS.clear()
+
+
+async def aclose_async_http_clients():
+    """
+    Close the shared async HTTP clients of the running event loop and their pooled connections.
+    """
+    with _SESSIONS_LOCK:
+        clients = list(_ASYNC_CLIENTS.pop(asyncio.get_running_loop(), {}).values())
+    for client in clients:
+        try:
+            await client.aclose()
+        except Exception as e:
+            logging.warning(f"Failed to close async HTTP client: {e}")
@@ -2,7 +2,8 @@ from langchain_google_genai import GoogleGenerativeAI
 from langchain.chains import LLMChain
 from langchain.prompts import PromptTemplate
 from config.config_loader import load_model_config
-from src.llm.base_llm_client import BaseLLMClient
+from src.llm.base_llm_client import BaseLLMClient, with_context
+from src.llm.structured_output import parse_output, aparse_output
 
 class LangChainGoogleClient(BaseLLMClient):
     """
@@ -26,20 +27,37 @@ class LangChainGoogleClient(BaseLLMClient):
 
         generation_config = config["generation"]
 
+        self.model_name = model_name
+        self.generation_config = generation_config
         self.model = GoogleGenerativeAI(
             api_key=api_key,
             model=model_name,
             **generation_config
         )
 
-    def generate(self, prompt,output_parser=None, **kwargs) -> str:
+    def describe(self) -> dict:
+        return {
+            "provider": "langchain-google",
+            "model": self.model_name,
+            "temperature": self.generation_config.get("temperature"),
+            "max_tokens": self.generation_config.get("max_output_tokens"),
+            "generation": self.generation_config,
+        }
+
+    def generate(self, prompt,output_parser=None, json_output: bool = False, context: str = None, **kwargs) -> str:
         """
         Generate text from the LLM using a prompt.
         
         Args:
             prompt (str): Input prompt to send to the model.
             output_parser (optional): An output parser object with a `.parse()`
-                                      method to format the model output.
+                                      method to format the model output. Malformed
+                                      JSON is repaired (see `parse_output`).
+            json_output (bool, optional): Structured output is requested. The model has
+                                          no per-call JSON mode here, so only the parsing
+                                          and repair apply.
+            context (str, optional): Input shared by several requests (e.g. the transcript),
+                                     placed before the prompt.
             **kwargs: Additional keyword arguments passed to the LLM invocation.
 
         Returns:
@@ -47,12 +65,34 @@ class LangChainGoogleClient(BaseLLMClient):
         """
         prompt_template = PromptTemplate.from_template("{input}")
 
-        result = (prompt_template | self.model).invoke({"input": prompt}, **kwargs)
+        def complete(text: str) -> str:
+            return (prompt_template | self.model).invoke({"input": text}, **kwargs)
 
         # Parse output if parser is provided
-        if output_parser:
-            result = output_parser.parse(result)
+        return parse_output(complete(with_context(prompt, context)), output_parser, repair=complete)
+
+    async def agenerate(
+        self, prompt, output_parser=None, json_output: bool = False, context: str = None, **kwargs
+    ) -> str:
+        """
+        Generate text from the LLM using a prompt without blocking the event loop.
+
+        Args:
+            prompt (str): Input prompt to send to the model.
+            output_parser (optional): An output parser object with a `.parse()`
+                                      method to format the model output. Malformed
+                                      JSON is repaired (see `parse_output`).
+            json_output (bool, optional): Structured output is requested (see `generate`).
+            context (str, optional): Input shared by several requests, placed before the prompt.
+            **kwargs: Additional keyword arguments passed to the LLM invocation.
+
+        Returns:
+            str: Generated text from the LLM, optionally parsed.
+        """
+        prompt_template = PromptTemplate.from_template("{input}")
 
-        return result
+        async def complete(text: str) -> str:
+            return await (prompt_template | self.model).ainvoke({"input": text}, **kwargs)
 
+        return await aparse_output(await complete(with_context(prompt, context)), output_parser, arepair=complete)
      
\ No newline at end of file
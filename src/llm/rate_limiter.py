@@ -0,0 +1,359 @@
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+import threading
+import logging
+import asyncio
+import random
+import time
+
+from config.config_loader import load_model_config
+from src.handlers.error_handler import RateLimitError, CircuitOpenError
+
+# Limiters shared by every client of the same provider
+_LIMITERS = {}
+_LIMITERS_LOCK = threading.Lock()
+
+# Logging configuration
+logging.basicConfig(level=logging.INFO)
+
+
+def parse_retry_after(value: str) -> float | None:
+    """
+    Parse a `Retry-After` header given either in seconds or as an HTTP date.
+
+    Args:
+        value (str): Header value (e.g. "20" or "Wed, 21 Oct 2026 07:28:00 GMT").
+
+    Returns:
+        float | None: Seconds to wait, or None if the header is missing or malformed.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+def estimate_tokens(prompt: str, max_tokens: int = 0) -> int:
+    """
+    Estimate the tokens a call consumes: about 4 characters per prompt token plus the output budget.
+
+    Args:
+        prompt (str): Prompt text.
+        max_tokens (int, optional): Maximum output tokens of the call.
+
+    Returns:
+        int: Estimated tokens.
+    """
+    return len(prompt) // 4 + (max_tokens or 0)
+
+
+class TokenBucket:
+    """
+    Token bucket refilled continuously at `per_minute` tokens per minute.
+
+    `reserve()` takes tokens immediately, letting the balance go negative, and
+    returns how long the caller must wait for its share. Concurrent callers are
+    therefore served in order without busy waiting.
+    """
+
+    def __init__(self, per_minute: float, burst: float = None):
+        """
+        Initialize TokenBucket.
+
+        Args:
+            per_minute (float): Refill rate. A falsy value disables the limit.
+            burst (float, optional): Bucket capacity. Defaults to one minute of tokens.
+        """
+        self.rate = (per_minute or 0) / 60
+        self.capacity = burst or per_minute or 0
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, amount: float = 1) -> float:
+        """
+        Take `amount` tokens and return the wait until they are available.
+
+        Args:
+            amount (float, optional): Tokens to take. Capped at the bucket capacity.
+
+        Returns:
+            float: Seconds to wait before proceeding (0 when tokens are available).
+        """
+        if not self.rate:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= min(amount, self.capacity)
+            return max(0.0, -self._tokens / self.rate)
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker that stops calls to a provider after repeated failures.
+
+    After `failure_threshold` consecutive failures the circuit opens and calls
+    fail fast with `CircuitOpenError`. After `reset_seconds` one trial call is
+    let through (half-open): success closes the circuit, failure reopens it.
+    `ProviderRateLimiter` records timeouts, connection and server errors as
+    failures, but a rate-limited call only once its retries are exhausted.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_seconds: float = 60):
+        """
+        Initialize CircuitBreaker.
+
+        Args:
+            failure_threshold (int, optional): Consecutive failures that open the circuit. Defaults to 5.
+            reset_seconds (float, optional): Time the circuit stays open. Defaults to 60.
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.opened_at = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Return "closed", "open" or "half-open"."""
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at < self.reset_seconds:
+            return "open"
+        return "half-open"
+
+    def before_call(self, name: str):
+        """
+        Check that a call may proceed.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with a trial call already running.
+        """
+        with self._lock:
+            state = self.state
+            if state == "closed":
+                return
+            if state == "half-open" and not self._trial_running:
+                self._trial_running = True
+                return
+            remaining = max(0.0, self.reset_seconds - (time.monotonic() - self.opened_at))
+        raise CircuitOpenError(f"{name} circuit open after repeated failures; retry in {remaining:.0f} s")
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial_running = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self._trial_running = False
+            if self.opened_at is not None or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+
+    def release_trial(self):
+        """Let a new trial call through after one ended without an outcome (e.g. it was cancelled)."""
+        with self._lock:
+            self._trial_running = False
+
+
+class ProviderRateLimiter:
+    """
+    Rate limiting, retries and circuit breaking for all calls to one API provider.
+
+    Responsibilities:
+    - Pace calls with request-per-minute and token-per-minute buckets.
+    - Retry rate-limited calls with jittered exponential backoff, honouring `Retry-After`.
+    - Fail fast through a circuit breaker when the provider keeps failing.
+
+    A 429 being retried is the provider pacing us, not failing, so it does not
+    count towards opening the circuit; if the circuit opens while a call backs
+    off anyway, the call ends with its last `RateLimitError`.
+    """
+
+    def __init__(self, provider: str, config: dict = None):
+        """
+        Initialize ProviderRateLimiter.
+
+        Args:
+            provider (str): Provider name used in logs and errors (e.g. "openrouter").
+            config (dict, optional): Limits (requests_per_minute, tokens_per_minute, max_retries,
+                                     backoff_base_seconds, backoff_max_seconds,
+                                     circuit_failure_threshold, circuit_reset_seconds).
+        """
+        config = config or {}
+        self.provider = provider
+        self.requests = TokenBucket(config.get("requests_per_minute"))
+        self.tokens = TokenBucket(config.get("tokens_per_minute"))
+        self.max_retries = config.get("max_retries", 4)
+        self.backoff_base = config.get("backoff_base_seconds", 1.0)
+        self.backoff_max = config.get("backoff_max_seconds", 30.0)
+        self.breaker = CircuitBreaker(
+            config.get("circuit_failure_threshold", 5), config.get("circuit_reset_seconds", 60)
+        )
+        self.retries = 0
+        self.rate_limited = 0
+
+    def _admit(self, tokens: int) -> float:
+        """Check the circuit and reserve bucket capacity; return the wait before calling."""
+        self.breaker.before_call(self.provider)
+        return max(self.requests.reserve(1), self.tokens.reserve(tokens))
+
+    def _admit_retry(self, tokens: int, last_error: RateLimitError | None) -> float:
+        """`_admit`, raising the previous attempt's error instead if the circuit opened during its backoff."""
+        try:
+            return self._admit(tokens)
+        except CircuitOpenError:
+            if last_error is None:
+                raise
+            raise last_error
+
+    def _backoff(self, attempt: int, error: RateLimitError) -> float:
+        """
+        Record a retryable error and return the delay before the next attempt (full jitter, capped).
+
+        Server and connection errors count as circuit breaker failures; a 429 only
+        once the retries are exhausted. A half-open trial that is rate limited is
+        given back, so the retry can take it again.
+        """
+        self.rate_limited += 1
+        if error.status_code != 429 or attempt == self.max_retries:
+            self.breaker.record_failure()
+        else:
+            self.breaker.release_trial()
+        if error.retry_after is not None:
+            return min(error.retry_after, self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    def call(self, func, tokens: int = 0):
+        """
+        Call `func()` within the provider's limits, retrying on `RateLimitError`.
+
+        Args:
+            func (Callable): Function performing one API call.
+            tokens (int, optional): Estimated tokens of the call (see `estimate_tokens`).
+
+        Returns:
+            The result of `func()`.
+
+        Raises:
+            RateLimitError: If the call is still rate limited after `max_retries` retries,
+                            or the circuit opened while it was backing off.
+            CircuitOpenError: If the provider's circuit is open.
+            Exception: Any other error of `func()`, recorded as a circuit breaker failure.
+        """
+        last_error = None
+        for attempt in range(self.max_retries + 1):
+            wait = self._admit_retry(tokens, last_error)
+            try:
+                if wait:
+                    time.sleep(wait)
+                result = func()
+            except RateLimitError as e:
+                delay = self._backoff(attempt, e)
+                if attempt == self.max_retries:
+                    raise
+                self.retries += 1
+                last_error = e
+                logging.warning(f"{self.provider} rate limited ({e.message}); retry {attempt + 1} in {delay:.1f} s")
+                time.sleep(delay)
+                continue
+            except Exception:
+                # Timeouts, connection and server errors count towards opening the circuit too
+                self.breaker.record_failure()
+                raise
+            except BaseException:
+                # Cancelled or interrupted: not a provider failure, but a half-open trial must not stay taken
+                self.breaker.release_trial()
+                raise
+            self.breaker.record_success()
+            return result
+
+    async def acall(self, func, tokens: int = 0):
+        """
+        Async version of `call`: `func()` returns an awaitable, and waits do not block the event loop.
+
+        Args:
+            func (Callable): Function returning an awaitable that performs one API call.
+            tokens (int, optional): Estimated tokens of the call.
+
+        Returns:
+            The awaited result of `func()`.
+
+        Raises:
+            RateLimitError: If the call is still rate limited after `max_retries` retries,
+                            or the circuit opened while it was backing off.
+            CircuitOpenError: If the provider's circuit is open.
+            Exception: Any other error of `func()`, recorded as a circuit breaker failure.
+        """
+        last_error = None
+        for attempt in range(self.max_retries + 1):
+            wait = self._admit_retry(tokens, last_error)
+            try:
+                if wait:
+                    await asyncio.sleep(wait)
+                result = await func()
+            except RateLimitError as e:
+                delay = self._backoff(attempt, e)
+                if attempt == self.max_retries:
+                    raise
+                self.retries += 1
+                last_error = e
+                logging.warning(f"{self.provider} rate limited ({e.message}); retry {attempt + 1} in {delay:.1f} s")
+                await asyncio.sleep(delay)
+                continue
+            except Exception:
+                # Timeouts, connection and server errors count towards opening the circuit too
+                self.breaker.record_failure()
+                raise
+            except BaseException:
+                # Cancelled or interrupted: not a provider failure, but a half-open trial must not stay taken
+                self.breaker.release_trial()
+                raise
+            self.breaker.record_success()
+            return result
+
+    def stats(self) -> dict:
+        """
+        Return limiter counters.
+
+        Returns:
+            dict: retries, rate-limited responses, circuit state and consecutive failures.
+        """
+        return {
+            "retries": self.retries,
+            "rate_limited": self.rate_limited,
+            "circuit": self.breaker.state,
+            "consecutive_failures": self.breaker.failures,
+        }
+
+
+def get_rate_limiter(provider: str, config_section: str = None) -> ProviderRateLimiter:
+    """
+    Return the shared limiter of a provider, created from its config on first use.
+
+    Args:
+        provider (str): Provider name (e.g. "openrouter", "groq").
+        config_section (str, optional): Top-level config section holding `rate_limits`
+                                        (e.g. "deepseek"). Defaults to `provider`.
+
+    Returns:
+        ProviderRateLimiter: Limiter shared by all clients of the provider.
+    """
+    with _LIMITERS_LOCK:
+        limiter = _LIMITERS.get(provider)
+        if limiter is None:
+            config = load_model_config().get(config_section or provider, {}).get("rate_limits", {})
+            limiter = ProviderRateLimiter(provider, config)
+            _LIMITERS[provider] = limiter
+        return limiter
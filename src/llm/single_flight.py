@@ -0,0 +1,255 @@
+from concurrent.futures import Future, CancelledError
+import threading
+import logging
+import asyncio
+
+from config.config_loader import load_model_config
+from src.llm.base_llm_client import BaseLLMClient
+from src.llm.cached_client import request_key
+
+_GROUP = None
+_GROUP_LOCK = threading.Lock()
+
+# Logging configuration
+logging.basicConfig(level=logging.INFO)
+
+
+class SingleFlightGroup:
+    """
+    Table of LLM requests in flight, shared by every thread and event loop of the process.
+
+    The first caller of a request (the leader) registers a future and makes
+    the upstream call; identical requests made before it completes (followers)
+    wait on that future and share its result or error. Futures are
+    `concurrent.futures.Future`, so followers may be threads or coroutines on
+    any event loop. If the leader is cancelled, its followers retry and one of
+    them becomes the new leader.
+
+    Responsibilities:
+    - Elect one leader per in-flight request key.
+    - Hand the leader's outcome to its followers.
+    - Count upstream calls and deduplicated calls per namespace.
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        self._counters = {}
+
+    def _count(self, namespace: str, outcome: str):
+        counters = self._counters.setdefault(namespace, {"upstream": 0, "deduplicated": 0})
+        counters[outcome] += 1
+
+    def join(self, key: str, namespace: str = "default") -> tuple[bool, Future]:
+        """
+        Join the in-flight call of a request, or register a new one.
+
+        Args:
+            key (str): Request key.
+            namespace (str, optional): Label the call is counted under.
+
+        Returns:
+            tuple: (leader, future). The leader must call `finish` or `abandon` once done.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                self._count(namespace, "deduplicated")
+                return False, future
+            future = Future()
+            self._calls[key] = future
+            self._count(namespace, "upstream")
+            return True, future
+
+    def finish(self, key: str, future: Future, result=None, error: BaseException = None):
+        """Publish the leader's result or error to its followers."""
+        with self._lock:
+            self._calls.pop(key, None)
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def abandon(self, key: str, future: Future):
+        """Withdraw a cancelled leader's call; its followers retry."""
+        with self._lock:
+            self._calls.pop(key, None)
+        future.cancel()
+
+    def stats(self) -> dict:
+        """
+        Return call counters per namespace.
+
+        Returns:
+            dict: {"namespaces": {name: {"upstream", "deduplicated", "saved_rate"}}, "in_flight": int}
+        """
+        with self._lock:
+            namespaces = {
+                name: {
+                    **counters,
+                    "saved_rate": counters["deduplicated"] / max(counters["upstream"] + counters["deduplicated"], 1),
+                }
+                for name, counters in self._counters.items()
+            }
+            return {"namespaces": namespaces, "in_flight": len(self._calls)}
+
+
+def get_single_flight() -> SingleFlightGroup:
+    """
+    Return the process-wide table of in-flight LLM requests.
+
+    Returns:
+        SingleFlightGroup: The shared group.
+    """
+    global _GROUP
+    with _GROUP_LOCK:
+        if _GROUP is None:
+            _GROUP = SingleFlightGroup()
+        return _GROUP
+
+
+class SingleFlightClient(BaseLLMClient):
+    """
+    Wrapper that lets concurrent identical requests share one upstream call.
+
+    Requests are keyed like the response cache (client settings, prompt,
+    output parser and options). A duplicate of a request already in flight,
+    from any thread or event loop, waits for it instead of calling the
+    provider again. A duplicated stream receives the complete text as a
+    single piece once the leading stream ends.
+    """
+
+    def __init__(self, client: BaseLLMClient, namespace: str = "default", group: SingleFlightGroup = None):
+        """
+        Initialize SingleFlightClient.
+
+        Args:
+            client (BaseLLMClient): Client whose calls are deduplicated.
+            namespace (str, optional): Label for deduplication statistics (e.g. the analyzer name).
+            group (SingleFlightGroup, optional): In-flight table to use. Defaults to the shared group.
+        """
+        self.client = client
+        self.namespace = namespace
+        self.group = group or get_single_flight()
+
+    def describe(self) -> dict:
+        return self.client.describe()
+
+    def generate(self, prompt: str, output_parser=None, **kwargs):
+        """
+        Generate a response, sharing the result of an identical call in flight.
+
+        Args:
+            prompt (str): Input prompt to send to the LLM.
+            output_parser (optional): Parser passed to the wrapped client.
+            **kwargs: Additional keyword arguments passed to the wrapped client.
+
+        Returns:
+            The wrapped client's output (text or parsed object).
+        """
+        key = request_key(self.client, prompt, output_parser, kwargs)
+        while True:
+            leader, future = self.group.join(key, self.namespace)
+            if not leader:
+                try:
+                    return future.result()
+                except CancelledError:
+                    continue
+
+            try:
+                result = self.client.generate(prompt, output_parser=output_parser, **kwargs)
+            except BaseException as e:
+                self.group.finish(key, future, error=e)
+                raise
+            self.group.finish(key, future, result)
+            return result
+
+    async def agenerate(self, prompt: str, output_parser=None, **kwargs):
+        """
+        Async version of `generate`; followers wait without blocking the event loop.
+
+        Args:
+            prompt (str): Input prompt to send to the LLM.
+            output_parser (optional): Parser passed to the wrapped client.
+            **kwargs: Additional keyword arguments passed to the wrapped client.
+
+        Returns:
+            The wrapped client's output (text or parsed object).
+        """
+        key = request_key(self.client, prompt, output_parser, kwargs)
+        while True:
+            leader, future = self.group.join(key, self.namespace)
+            if not leader:
+                # Shielded: a cancelled follower must not cancel the shared call
+                try:
+                    return await asyncio.shield(asyncio.wrap_future(future))
+                except asyncio.CancelledError:
+                    if future.cancelled():
+                        continue
+                    raise
+
+            try:
+                result = await self.client.agenerate(prompt, output_parser=output_parser, **kwargs)
+            except asyncio.CancelledError:
+                self.group.abandon(key, future)
+                raise
+            except Exception as e:
+                self.group.finish(key, future, error=e)
+                raise
+            self.group.finish(key, future, result)
+            return result
+
+    def stream(self, prompt: str, **kwargs):
+        """
+        Stream a response; a duplicate of a stream in flight gets its full text as one piece.
+
+        The text is only published to duplicates once the wrapped stream completes;
+        when it raises (e.g. it ended early), they get the error instead.
+
+        Args:
+            prompt (str): Input prompt to send to the LLM.
+            **kwargs: Additional keyword arguments passed to the wrapped client.
+
+        Yields:
+            str: Successive pieces of the generated text.
+        """
+        key = request_key(self.client, prompt, None, {**kwargs, "stream": True})
+        while True:
+            leader, future = self.group.join(key, self.namespace)
+            if not leader:
+                try:
+                    yield future.result()
+                    return
+                except CancelledError:
+                    continue
+
+            pieces = []
+            try:
+                for piece in self.client.stream(prompt, **kwargs):
+                    pieces.append(piece)
+                    yield piece
+            except GeneratorExit:
+                # The consumer stopped reading before the end: followers start their own stream
+                self.group.abandon(key, future)
+                raise
+            except BaseException as e:
+                self.group.finish(key, future, error=e)
+                raise
+            self.group.finish(key, future, "".join(pieces))
+            return
+
+
+def maybe_single_flight(client: BaseLLMClient, namespace: str) -> BaseLLMClient:
+    """
+    Wrap a client in `SingleFlightClient` when the `llm.single_flight.enabled` config value is set.
+
+    Args:
+        client (BaseLLMClient): Client to wrap.
+        namespace (str): Label for deduplication statistics (e.g. the analyzer name).
+
+    Returns:
+        BaseLLMClient: The deduplicating wrapper, or the client itself when disabled.
+    """
+    if load_model_config().get("llm", {}).get("single_flight", {}).get("enabled", True):
+        return SingleFlightClient(client, namespace)
+    return client
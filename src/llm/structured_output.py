@@ -0,0 +1,317 @@
+import re
+import json
+import logging
+import threading
+
+from langchain_core.output_parsers import StrOutputParser
+
+from config.config_loader import load_model_config
+from src.prompt_engineering.templates import load_prompt_template
+from src.handlers.error_handler import StructuredOutputError
+
+# Outcomes of structured parses: parsed as returned, after local extraction/repair,
+# after a repair request, or not at all
+_STATS = {"parsed": 0, "extracted": 0, "repaired": 0, "failed": 0}
+_STATS_LOCK = threading.Lock()
+
+# Truncated outputs are cut back at most this many times while looking for a parseable prefix
+MAX_TRUNCATION_CUTS = 50
+
+# Logging configuration
+logging.basicConfig(level=logging.INFO)
+
+
+def _strip_fences(text: str) -> str:
+    """Return the content of the first markdown code fence (possibly unterminated), or the text."""
+    match = re.search(r"```(?:json|JSON)?\s*\n?(.*?)(?:```|$)", text, re.DOTALL)
+    return match.group(1) if match else text
+
+
+def _scan(fragment: str) -> tuple[list, bool, list, int | None]:
+    """
+    Scan JSON text, tracking open brackets and strings.
+
+    Returns:
+        tuple: (open brackets, inside a string at the end, offsets of commas outside strings,
+               end offset of the first complete value or None if truncated).
+    """
+    stack, commas = [], []
+    in_string = escaped = False
+    for i, char in enumerate(fragment):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in "{[":
+            stack.append(char)
+        elif char in "}]":
+            if stack and (stack[-1] == "{") == (char == "}"):
+                stack.pop()
+                if not stack:
+                    return stack, False, commas, i + 1
+        elif char == ",":
+            commas.append(i)
+    return stack, in_string, commas, None
+
+
+def _loads(text: str):
+    """Parse JSON, retrying without trailing commas before a closing bracket."""
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        return json.loads(re.sub(r",\s*([}\]])", r"\1", text))
+
+
+def _close_truncated(fragment: str):
+    """Parse JSON cut off at the end, closing what is open and cutting back to earlier commas until it parses."""
+    _, _, commas, _ = _scan(fragment)
+    for cut in [len(fragment)] + commas[::-1][:MAX_TRUNCATION_CUTS]:
+        candidate = fragment[:cut]
+        stack, in_string, _, _ = _scan(candidate)
+        closed = (candidate + ('"' if in_string else "")).rstrip().rstrip(",")
+        closed += "".join("}" if bracket == "{" else "]" for bracket in reversed(stack))
+        try:
+            return _loads(closed)
+        except json.JSONDecodeError:
+            continue
+    raise ValueError("Truncated JSON output could not be repaired")
+
+
+def _json_candidates(text: str):
+    """
+    Yield the JSON values found in LLM output, in order of their start offset.
+
+    Every `{` or `[` outside a value already found is tried as the start of a
+    value, so brackets in surrounding prose (e.g. "[note]") are skipped. A
+    value still open at the end of the text (truncated) is closed and is the
+    last candidate, since everything after its start belongs to it.
+
+    Raises:
+        ValueError: If no JSON value can be recovered.
+    """
+    fragment = _strip_fences(text)
+    decoder = json.JSONDecoder()
+    starts = [i for i, char in enumerate(fragment) if char in "{["]
+    if not starts:
+        raise ValueError("No JSON object or array in output")
+
+    # Offset where the last value found ends: brackets before it are nested in that value
+    found, skip_until, error = False, 0, None
+    for start in starts:
+        if start < skip_until:
+            continue
+        try:
+            value, skip_until = decoder.raw_decode(fragment, start)
+        except json.JSONDecodeError:
+            pass
+        else:
+            found = True
+            yield value
+            continue
+
+        _, _, _, end = _scan(fragment[start:])
+        try:
+            if end is None:
+                value = _close_truncated(fragment[start:])
+            else:
+                # Complete but invalid as returned, e.g. trailing commas
+                value = _loads(fragment[start:start + end])
+        except (ValueError, json.JSONDecodeError) as e:
+            error = e
+            continue
+        found = True
+        yield value
+        if end is None:
+            return
+        skip_until = start + end
+    if not found:
+        raise ValueError(f"No valid JSON object or array in output: {error}")
+
+
+def extract_json(text: str):
+    """
+    Extract a JSON value from LLM output that may be fenced, wrapped in prose or truncated.
+
+    The first complete object or array in the text is parsed; brackets in
+    the prose before it are skipped. If the output was cut off (e.g. at
+    max_tokens), open strings and brackets are closed; when that is not
+    enough, the text is cut back to earlier commas until the prefix parses.
+    The last element may be partial; the output parser validates it.
+
+    Args:
+        text (str): Raw LLM output.
+
+    Returns:
+        The parsed JSON value (dict or list).
+
+    Raises:
+        ValueError: If no JSON value can be recovered.
+    """
+    return next(_json_candidates(text))
+
+
+def _record(outcome: str):
+    with _STATS_LOCK:
+        _STATS[outcome] += 1
+
+
+def _parse_locally(text: str, output_parser):
+    """
+    Parse with the output parser, then with each JSON value extracted from the text
+    until one is accepted. Returns (value, outcome).
+    """
+    try:
+        return output_parser.parse(text), "parsed"
+    except Exception as e:
+        error = e
+    try:
+        for candidate in _json_candidates(text):
+            try:
+                return output_parser.parse(json.dumps(candidate)), "extracted"
+            except Exception as e:
+                error = e
+    except ValueError as e:
+        error = e
+    raise error
+
+
+def repair_prompt(text: str, output_parser, error: Exception) -> str:
+    """
+    Build the repair request for an unparseable output: only the output and its format, not the original input.
+
+    Args:
+        text (str): Unparseable output.
+        output_parser: Parser whose format instructions describe the expected structure.
+        error (Exception): Parse error to report to the model.
+
+    Returns:
+        str: Prompt asking the model to return the corrected JSON.
+    """
+    try:
+        instructions = output_parser.get_format_instructions()
+    except Exception:
+        instructions = "Return a valid JSON value."
+    return load_prompt_template("json_repair").format(error=error, format_instructions=instructions, output=text)
+
+
+def _is_structured(output_parser) -> bool:
+    return output_parser is not None and not isinstance(output_parser, StrOutputParser)
+
+
+def _repair_retries() -> int:
+    return load_model_config().get("llm", {}).get("structured_output", {}).get("repair_retries", 1)
+
+
+def _fail(text: str, error: Exception):
+    _record("failed")
+    raise StructuredOutputError(f"Could not parse LLM output as structured data: {error}; output: {text[:200]!r}")
+
+
+def parse_output(text: str, output_parser=None, repair=None):
+    """
+    Parse LLM output, repairing malformed or truncated JSON instead of returning raw text.
+
+    Tries in turn: the output parser on the raw text; the parser on JSON
+    extracted locally by `extract_json`; up to `llm.structured_output.repair_retries`
+    repair requests through `repair`, which receive only the broken output.
+
+    Args:
+        text (str): Raw LLM output.
+        output_parser (optional): Parser with a `.parse()` method. Text is returned as is without one.
+        repair (Callable[[str], str], optional): Sends a repair prompt to the LLM and returns its text.
+
+    Returns:
+        The parsed output.
+
+    Raises:
+        StructuredOutputError: If the output cannot be parsed or repaired.
+    """
+    if not _is_structured(output_parser):
+        return output_parser.parse(text) if output_parser else text
+
+    try:
+        value, outcome = _parse_locally(text, output_parser)
+        _record(outcome)
+        return value
+    except Exception as e:
+        error = e
+
+    latest = text
+    for _ in range(_repair_retries() if repair else 0):
+        logging.warning(f"Unparseable LLM output ({error}); sending a repair request")
+        # Errors of the repair call itself (e.g. rate limits) propagate; only parse errors are retried
+        fixed = repair(repair_prompt(latest, output_parser, error))
+        try:
+            value, _ = _parse_locally(fixed, output_parser)
+            _record("repaired")
+            return value
+        except Exception as e:
+            # The next repair request starts from this attempt, not from the original output
+            latest, error = fixed, e
+    _fail(latest, error)
+
+
+async def aparse_output(text: str, output_parser=None, arepair=None):
+    """
+    Async version of `parse_output`; `arepair` is a coroutine function sending the repair prompt.
+
+    Args:
+        text (str): Raw LLM output.
+        output_parser (optional): Parser with a `.parse()` method.
+        arepair (Callable[[str], Awaitable[str]], optional): Sends a repair prompt and returns its text.
+
+    Returns:
+        The parsed output.
+
+    Raises:
+        StructuredOutputError: If the output cannot be parsed or repaired.
+    """
+    if not _is_structured(output_parser):
+        return output_parser.parse(text) if output_parser else text
+
+    try:
+        value, outcome = _parse_locally(text, output_parser)
+        _record(outcome)
+        return value
+    except Exception as e:
+        error = e
+
+    latest = text
+    for _ in range(_repair_retries() if arepair else 0):
+        logging.warning(f"Unparseable LLM output ({error}); sending a repair request")
+        # Errors of the repair call itself (e.g. rate limits) propagate; only parse errors are retried
+        fixed = await arepair(repair_prompt(latest, output_parser, error))
+        try:
+            value, _ = _parse_locally(fixed, output_parser)
+            _record("repaired")
+            return value
+        except Exception as e:
+            # The next repair request starts from this attempt, not from the original output
+            latest, error = fixed, e
+    _fail(latest, error)
+
+
+def parse_stats() -> dict:
+    """
+    Return how structured outputs were parsed since the process started.
+
+    Returns:
+        dict: Counts (parsed, extracted, repaired, failed, total) and rates: parse_failure_rate
+              (outputs that did not parse as returned), repair_rate (fixed by a repair request)
+              and failed_rate.
+    """
+    with _STATS_LOCK:
+        stats = dict(_STATS)
+    total = sum(stats.values())
+    return {
+        **stats,
+        "total": total,
+        "parse_failure_rate": (total - stats["parsed"]) / max(total, 1),
+        "repair_rate": stats["repaired"] / max(total, 1),
+        "failed_rate": stats["failed"] / max(total, 1),
+    }
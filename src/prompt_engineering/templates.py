@@ -1,11 +1,7 @@
-from pathlib import Path
-import yaml
+from config.config_loader import load_model_config, load_prompt_config
 
-# Base directory of the project (two levels above this file)
-BASE_DIR = Path(__file__).resolve().parents[2]
-
-# Path to YAML file containing prompt templates
-PROMPT_TEMPLATES_PATH = BASE_DIR / "config" / "prompt_templates.yaml"
+# Stands in for the transcript in instructions when it is sent as a leading context message
+TRANSCRIPT_REFERENCE = "(the meeting transcript provided above)"
 
 
 def load_prompt_template(task_name: str) -> str:
@@ -19,7 +15,34 @@ def load_prompt_template(task_name: str) -> str:
         str: Prompt template string corresponding to the task_name.
              Returns an empty string if the task is not found.
     """
-    with open(PROMPT_TEMPLATES_PATH, "r", encoding="utf-8") as f:
-        templates = yaml.safe_load(f)
-    
+    # Parsed once and reused until the file changes
+    templates = load_prompt_config()
+
     return templates.get(task_name, "")
+
+
+def build_prompt(template: str, transcript: str, **variables) -> tuple[str, dict]:
+    """
+    Format an analysis prompt according to the `llm.prompt_layout` config value.
+
+    With the "inline" layout (default) the transcript is embedded in the
+    template. With "shared_prefix" the instruction refers to the transcript,
+    which is returned as a `context` option: clients send it first, as a
+    leading message that is identical for every analysis of the meeting, so
+    provider-side prompt caching can reuse it.
+
+    Args:
+        template (str): Prompt template with a `{transcript}` placeholder.
+        transcript (str): Meeting transcript.
+        **variables: Other template variables (e.g. format_instructions).
+
+    Returns:
+        tuple: (prompt, options), where options are extra keyword arguments for
+               the client's `generate`, `agenerate` or `stream` call.
+    """
+    layout = load_model_config().get("llm", {}).get("prompt_layout", "inline")
+    if layout != "shared_prefix":
+        return template.format(transcript=transcript, **variables), {}
+
+    context = load_prompt_template("transcript_context").format(transcript=transcript)
+    return template.format(transcript=TRANSCRIPT_REFERENCE, **variables), {"context": context}
@@ -4,9 +4,8 @@ import logging
 from dotenv import load_dotenv
 from src.llm.gemini_client import GeminiClient
 from src.handlers.error_handler import handle_errors, MeetingMindError
-from src.prompt_engineering.templates import load_prompt_template
-from src.llm.deepseek_client import DeepSeekV3Client
-from langchain_core.prompts import PromptTemplate
+from src.prompt_engineering.templates import load_prompt_template, build_prompt
+from src.llm.analysis_client import build_analysis_client
 from langchain_core.output_parsers import StrOutputParser
 
 # --- Project path setup ---
@@ -38,11 +37,11 @@ class TopicExtractor:
 
         Args:
             client (optional): Custom LLM client instance (e.g., DeepSeekV3Client). 
-                If None, initializes DeepSeekV3Client with API key from environment (OPENROUTER_API_KEY).
+                If None, uses the default analysis client (see `build_analysis_client`).
         """
         self.parser = StrOutputParser()
         self.prompt_template = load_prompt_template("topic_extraction")
-        self.client = client or DeepSeekV3Client(api_key=os.getenv("OPENROUTER_API_KEY"))
+        self.client = build_analysis_client("topic_extractor", client)
 
 
     @handle_errors("Failed to extract topic from transcript")
@@ -56,13 +55,29 @@ class TopicExtractor:
         Returns:
             str: Extracted topic (stripped of whitespace).
         """
-        prompt = PromptTemplate(
-            template=self.prompt_template,
-            input_variables=["transcript"]
-        )
-    
-        prompt = prompt.format(transcript=transcript)
-        topic = self.client.generate(prompt , self.parser)
+        prompt, options = self._format_prompt(transcript)
+        topic = self.client.generate(prompt, self.parser, **options)
 
         logging.info("Topic extraction completed successfully.")
         return topic.strip()
+
+    @handle_errors("Failed to extract topic from transcript")
+    async def aextract_topic(self, transcript: str) -> str:
+        """
+        Extract the main topic from a transcript without blocking the event loop.
+
+        Args:
+            transcript (str): Meeting transcript text.
+
+        Returns:
+            str: Extracted topic (stripped of whitespace).
+        """
+        prompt, options = self._format_prompt(transcript)
+        topic = await self.client.agenerate(prompt, self.parser, **options)
+
+        logging.info("Topic extraction completed successfully.")
+        return topic.strip()
+
+    def _format_prompt(self, transcript: str) -> tuple[str, dict]:
+        """Return the prompt and client options for the configured prompt layout (see `build_prompt`)."""
+        return build_prompt(self.prompt_template, transcript)
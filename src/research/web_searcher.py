@@ -2,11 +2,15 @@ import sys
 import os
 from pathlib import Path
 import logging
+import time
+from contextlib import contextmanager
 from dotenv import load_dotenv
 from src.prompt_engineering.templates import load_prompt_template
-from src.handlers.error_handler import handle_errors, MeetingMindError
+from src.handlers.error_handler import handle_errors, MeetingMindError, RateLimitError
+from src.llm.rate_limiter import get_rate_limiter, estimate_tokens, parse_retry_after
 from config.config_loader import load_model_config
-from groq import Groq
+from src.llm.client_registry import get_client
+from groq import APIStatusError, APIConnectionError
 
 
 # Ensure project root is available for imports
@@ -28,13 +32,14 @@ class WebSearcher:
     Responsibilities:
     - Load a prompt template for web search.
     - Format the query using the template.
-    - Execute the search via Groq LLM.
+    - Execute the search via Groq LLM within the provider's shared rate limits.
     - Return the research result as text.
     """
 
     def __init__(self):
         """
-        Initialize the WebSearcher with a Groq client using the API key from environment variables.
+        Initialize the WebSearcher with the shared Groq client of the client registry
+        (API key from the GROQ_API_KEY environment variable).
         """
         config = load_model_config()["groq"]
 
@@ -42,7 +47,8 @@ class WebSearcher:
         self.temperature = config["temperature"]
         self.max_tokens = config["max_tokens"]
 
-        self.client = Groq(api_key=os.environ.get("GROQ_API_KEY"))
+        self.client = get_client("groq")
+        self.rate_limiter = get_rate_limiter(config.get("provider", "groq"), "groq")
 
     @handle_errors("Failed to perform web search")
     def search(self, query: str) -> str:
@@ -55,19 +61,103 @@ class WebSearcher:
         Returns:
             str: The summarized research result generated by the LLM.
         """
-        # Load and format web search prompt template
-        template = load_prompt_template(task_name="web_search")
-        prompt = template.format(query=query)
+        request = self._request(query)
+
+        def create():
+            with self._rate_limit_errors():
+                return self.client.chat.completions.create(**request)
 
         # Call the Groq LLM API
-        chat_completion = self.client.chat.completions.create(
-            model=self.model_name,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=self.temperature,
-            max_tokens=self.max_tokens
-        )
+        chat_completion = self.rate_limiter.call(create, self._tokens(request))
 
         # Extract content from LLM response
         research_result = chat_completion.choices[0].message.content
         logging.info("Web search completed successfully")
         return research_result
+
+    @handle_errors("Failed to perform web search")
+    async def asearch(self, query: str) -> str:
+        """
+        Perform a web search without blocking the event loop, using the async Groq client.
+
+        Args:
+            query (str): The research query or topic.
+
+        Returns:
+            str: The summarized research result generated by the LLM.
+        """
+        request = self._request(query)
+
+        async def create():
+            with self._rate_limit_errors():
+                # The async client is bound to the running event loop
+                return await get_client("groq_async").chat.completions.create(**request)
+
+        chat_completion = await self.rate_limiter.acall(create, self._tokens(request))
+
+        research_result = chat_completion.choices[0].message.content
+        logging.info("Web search completed successfully")
+        return research_result
+
+    def stream_search(self, query: str):
+        """
+        Perform a web search and yield the result piece by piece as it is generated.
+
+        Logs the time to first token of the call.
+
+        Args:
+            query (str): The research query or topic.
+
+        Yields:
+            str: Successive pieces of the research result.
+        """
+        request = self._request(query)
+        start = time.perf_counter()
+        first_token = None
+
+        def create():
+            with self._rate_limit_errors():
+                return self.client.chat.completions.create(**request, stream=True)
+
+        for chunk in self.rate_limiter.call(create, self._tokens(request)):
+            token = chunk.choices[0].delta.content if chunk.choices else None
+            if token:
+                if first_token is None:
+                    first_token = time.perf_counter() - start
+                    logging.info(f"Groq time to first token: {first_token * 1000:.0f} ms")
+                yield token
+        logging.info(f"Web search completed successfully in {time.perf_counter() - start:.2f} s")
+
+    @staticmethod
+    @contextmanager
+    def _rate_limit_errors():
+        """Turn Groq 429, 5xx, connection and timeout errors into `RateLimitError` so the rate limiter retries them."""
+        try:
+            yield
+        except APIConnectionError as e:
+            # Also covers APITimeoutError; the SDK's own retries are disabled (max_retries=0)
+            raise RateLimitError(f"Groq API connection error: {e}") from e
+        except APIStatusError as e:
+            if e.status_code == 429 or e.status_code >= 500:
+                raise RateLimitError(
+                    f"Groq API Error {e.status_code}: {e.message}",
+                    retry_after=parse_retry_after(e.response.headers.get("retry-after")),
+                    status_code=e.status_code,
+                ) from e
+            raise
+
+    def _tokens(self, request: dict) -> int:
+        return estimate_tokens(request["messages"][0]["content"], self.max_tokens)
+
+    def _request(self, query: str) -> dict:
+        """Build the Groq chat completion request for a query."""
+        # Load and format web search prompt template
+        template = load_prompt_template(task_name="web_search")
+        prompt = template.format(query=query)
+
+        return {
+            "model": self.model_name,
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens,
+        }
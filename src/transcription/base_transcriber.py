@@ -22,13 +22,14 @@ class BaseTranscriber(ABC):
         pass
 
     @abstractmethod
-    def save_transcript(self, transcript: str, output_file: str = None) -> str:
+    def save_transcript(self, transcript: str, output_file: str = None, audio_sha256: str = None) -> str:
         """
         Save a transcription text to a file.
 
         Args:
             transcript (str): The text obtained from transcription.
             output_file (str, optional): Path to save the transcript. Defaults to a standard directory.
+            audio_sha256 (str, optional): Hash of the transcribed audio, used to name the default file.
 
         Returns:
             str: Path to the saved transcript file.
@@ -0,0 +1,47 @@
+import threading
+
+from config.config_loader import load_model_config
+from src.transcription.base_transcriber import BaseTranscriber
+
+# The parallel backend owns a process pool, so one instance is shared per process
+_PARALLEL_TRANSCRIBER = None
+_PARALLEL_LOCK = threading.Lock()
+
+
+def create_transcriber(backend: str = None) -> BaseTranscriber:
+    """
+    Create the transcriber configured for this deployment.
+
+    Args:
+        backend (str, optional): "local" (Whisper model loaded in this process),
+                                 "server" (shared Whisper model server),
+                                 "parallel" (chunks decoded in a shared process pool) or
+                                 "faster_whisper" (int8-quantized CPU inference).
+                                 Defaults to the `whisper.backend` config value or "local".
+
+    Returns:
+        BaseTranscriber: Transcriber instance for the selected backend.
+
+    Raises:
+        ValueError: If the backend is unknown.
+    """
+    backend = backend or load_model_config()["whisper"].get("backend", "local")
+
+    if backend == "local":
+        from src.transcription.whisper_transcriber import WhisperTranscriber
+        return WhisperTranscriber()
+    if backend == "server":
+        from src.transcription.model_server import WhisperServerTranscriber
+        return WhisperServerTranscriber()
+    if backend == "parallel":
+        from src.transcription.parallel_transcriber import ParallelWhisperTranscriber
+        global _PARALLEL_TRANSCRIBER
+        with _PARALLEL_LOCK:
+            if _PARALLEL_TRANSCRIBER is None:
+                _PARALLEL_TRANSCRIBER = ParallelWhisperTranscriber()
+            return _PARALLEL_TRANSCRIBER
+    if backend == "faster_whisper":
+        from src.transcription.faster_whisper_transcriber import FasterWhisperTranscriber
+        return FasterWhisperTranscriber()
+
+    raise ValueError(f"Unknown transcription backend '{backend}'")
@@ -0,0 +1,65 @@
+from pathlib import Path
+import logging
+import sys
+
+from src.transcription.whisper_transcriber import WhisperTranscriber, load_audio, load_decode_profile
+from src.transcription.scheduler import get_scheduler
+from config.config_loader import load_model_config
+
+# Ensure project root is in sys.path for absolute imports
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+# Logging configuration
+logging.basicConfig(level=logging.INFO)
+
+
+class FasterWhisperTranscriber(WhisperTranscriber):
+    """
+    Transcriber using faster-whisper (CTranslate2) with int8 weights on CPU.
+
+    Uses the same model sizes as `WhisperTranscriber` and keeps its behaviour
+    (VAD, timestamps, saving transcripts); only decoding differs. int8 weights
+    avoid the fp32 fallback of PyTorch Whisper on machines without a GPU.
+
+    Responsibilities:
+    - Load a quantized Whisper model of the configured size.
+    - Decode 16 kHz audio into timestamped segments.
+    """
+
+    def __init__(self, compute_type: str = None, cpu_threads: int = None):
+        """
+        Initialize FasterWhisperTranscriber.
+
+        Args:
+            compute_type (str, optional): CTranslate2 compute type ("int8", "int8_float32",
+                                          "float32"...). Defaults to config value or "int8".
+            cpu_threads (int, optional): Threads used for decoding. Defaults to config
+                                         value or the thread budget of a scheduler slot.
+        """
+        from faster_whisper import WhisperModel
+
+        config = load_model_config()["whisper"]
+        options = config.get("faster_whisper", {})
+        self.model_size = config["model_size"]
+        self.use_vad = config.get("use_vad", False)
+        self.use_cache = config.get("transcript_cache", {}).get("enabled", True)
+        self.compute_type = compute_type or options.get("compute_type", "int8")
+        self.cpu_threads = cpu_threads or options.get("cpu_threads") or get_scheduler().threads_per_job
+        # Same decode profile as the PyTorch backend; fp16 does not apply to CTranslate2
+        self.decode_options = {key: value for key, value in load_decode_profile().items() if key != "fp16"}
+        self.decode_options["beam_size"] = self.decode_options.get("beam_size") or 1
+
+        self.model = WhisperModel(
+            self.model_size, device="cpu", compute_type=self.compute_type, cpu_threads=self.cpu_threads
+        )
+        logging.info(f"Loaded faster-whisper '{self.model_size}' model ({self.compute_type})")
+
+    def _decode_options(self) -> dict:
+        return {**self.decode_options, "compute_type": self.compute_type}
+
+    def _decode(self, audio, options: dict = None) -> list[dict]:
+        # faster-whisper returns a lazy generator: decoding happens while iterating
+        segments, _ = self.model.transcribe(load_audio(audio), **(options or self.decode_options))
+        return [{"start": segment.start, "end": segment.end, "text": segment.text} for segment in segments]
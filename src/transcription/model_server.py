@@ -0,0 +1,471 @@
+from collections import OrderedDict, deque
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from pathlib import Path
+import multiprocessing as mp
+from multiprocessing.connection import wait as wait_connections
+import itertools
+import threading
+import logging
+import time
+import atexit
+import os
+import sys
+
+from src.transcription.whisper_transcriber import WhisperTranscriber, load_audio, load_decode_profile, _as_segment
+from src.transcription.scheduler import get_scheduler, partition_cores
+from src.handlers.error_handler import MeetingMindError
+from config.config_loader import load_model_config
+
+# Ensure project root is in sys.path for absolute imports
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+# Logging configuration
+logging.basicConfig(level=logging.INFO)
+
+_SERVER = None
+_SERVER_LOCK = threading.Lock()
+
+
+def _worker_main(worker_id: int, jobs, results, max_resident_models: int, cores: list[int]):
+    """
+    Transcription worker process: keep Whisper models resident and serve jobs.
+
+    The worker is pinned to `cores` and uses one PyTorch thread per core.
+    Models are kept in an LRU cache of at most `max_resident_models` sizes.
+    Results are sent on the worker's own pipe, so terminating the worker
+    cannot leave a queue lock shared with other workers held.
+    A `None` job stops the worker.
+    """
+    import torch
+    import whisper
+
+    if hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, cores)
+    torch.set_num_threads(len(cores))
+
+    models = OrderedDict()
+    while True:
+        job = jobs.get()
+        if job is None:
+            return
+
+        job_id, model_size, audio, options = job
+        try:
+            if model_size in models:
+                models.move_to_end(model_size)
+            else:
+                if len(models) >= max_resident_models:
+                    evicted, _ = models.popitem(last=False)
+                    logging.info(f"Worker {worker_id}: evicted Whisper '{evicted}' model")
+                logging.info(f"Worker {worker_id}: loading Whisper '{model_size}' model")
+                models[model_size] = whisper.load_model(model_size)
+
+            result = models[model_size].transcribe(load_audio(audio), **options)
+            results.send((job_id, worker_id, None, [_as_segment(segment) for segment in result["segments"]]))
+        except Exception as e:
+            results.send((job_id, worker_id, f"{type(e).__name__}: {e}", None))
+
+
+class WhisperModelServer:
+    """
+    Pool of long-lived worker processes that keep Whisper models resident.
+
+    Jobs are sent over multiprocessing queues and results come back on one
+    pipe per worker. A job waits in the server until a
+    worker is idle, and goes preferably to an idle worker that already holds the
+    requested model size. Each worker keeps up to `max_resident_models` model
+    sizes and evicts the least recently used one. A worker that dies is
+    restarted, up to `max_restarts` times in a row; when no worker is left,
+    queued jobs fail instead of waiting forever. A worker still running a job
+    whose caller gave up (see `abandon`) is terminated and restarted.
+
+    Responsibilities:
+    - Start, restart and stop the worker processes.
+    - Route transcription jobs to workers and return results as futures.
+    - Track which model sizes are resident in each worker.
+    - Pin each worker to its own core set.
+    """
+
+    def __init__(
+        self,
+        workers: int = None,
+        max_resident_models: int = None,
+        threads_per_worker: int = None,
+        max_restarts: int = None,
+    ):
+        """
+        Initialize WhisperModelServer.
+
+        Args:
+            workers (int, optional): Number of worker processes. Defaults to config
+                                     value or the number of transcription scheduler slots.
+            max_resident_models (int, optional): Model sizes kept loaded per worker.
+                                                 Defaults to config value or 2.
+            threads_per_worker (int, optional): Cores each worker is pinned to. Defaults
+                                                to the thread budget of a scheduler slot.
+            max_restarts (int, optional): Consecutive restarts of a worker that keeps dying
+                                          before it is given up. Defaults to config value or 3.
+        """
+        config = load_model_config()["whisper"].get("server", {})
+        self.workers = workers or config.get("workers") or get_scheduler().slots
+        # Workers pinned to disjoint core sets, one scheduler slot each
+        self.core_sets = partition_cores(self.workers, threads_per_worker or get_scheduler().threads_per_job)
+        self.max_resident_models = max_resident_models or config.get("max_resident_models", 2)
+        self.max_restarts = max_restarts if max_restarts is not None else config.get("max_restarts", 3)
+
+        self._context = mp.get_context("spawn")
+        self._queues = []
+        self._connections = []
+        self._processes = []
+        # Mirror of each worker's LRU order, updated in dispatch order
+        self._resident = [OrderedDict() for _ in range(self.workers)]
+        # Job id currently running in each worker, None when idle, -1 when the worker was given up
+        self._assigned = [None] * self.workers
+        # Restarts of each worker since it last completed a job
+        self._restarts = [0] * self.workers
+
+        self._pending = deque()
+        self._futures = {}
+        # Per-job timestamps and the queue wait / run time of recent jobs
+        self._submitted = {}
+        self._started = {}
+        self._history = deque(maxlen=100)
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+        self._collector = None
+        self._running = False
+
+    def start(self):
+        """
+        Start the worker processes and the result collector thread.
+
+        Returns:
+            WhisperModelServer: The server itself.
+        """
+        self._queues = [None] * self.workers
+        self._connections = [None] * self.workers
+        self._processes = [None] * self.workers
+        for worker_id in range(self.workers):
+            self._start_worker(worker_id)
+
+        self._running = True
+        self._collector = threading.Thread(target=self._collect, name="whisper-results", daemon=True)
+        self._collector.start()
+        logging.info(f"Whisper model server started with {self.workers} workers")
+        return self
+
+    def _start_worker(self, worker_id: int):
+        """Start (or replace) the process of a worker, with a fresh job queue and result pipe."""
+        jobs = self._context.Queue()
+        receiver, sender = self._context.Pipe(duplex=False)
+        process = self._context.Process(
+            target=_worker_main,
+            args=(worker_id, jobs, sender, self.max_resident_models, self.core_sets[worker_id]),
+            name=f"whisper-worker-{worker_id}",
+            daemon=True,
+        )
+        process.start()
+        # Only the worker keeps the sending end, so its exit shows up as end of file
+        sender.close()
+        if self._connections[worker_id] is not None:
+            self._connections[worker_id].close()
+        self._queues[worker_id] = jobs
+        self._connections[worker_id] = receiver
+        self._processes[worker_id] = process
+
+    def submit(self, model_size: str, audio, **options) -> Future:
+        """
+        Queue a transcription job.
+
+        Args:
+            model_size (str): Whisper model size (e.g. "base").
+            audio (str | np.ndarray): Path to the audio file or a 16 kHz mono float32 buffer.
+            **options: Decode options passed to `whisper.transcribe`.
+
+        Returns:
+            Future: Resolves to a list of {"start", "end", "text"} segments.
+                    Cancelling it before a worker picks the job up drops the job.
+
+        Raises:
+            MeetingMindError: If the server is not running or all its workers have failed.
+        """
+        if not self._running:
+            raise MeetingMindError("Whisper model server is not running")
+
+        future = Future()
+        with self._lock:
+            if all(job_id == -1 for job_id in self._assigned):
+                raise MeetingMindError("All Whisper model server workers have failed")
+            job_id = next(self._ids)
+            self._futures[job_id] = future
+            self._submitted[job_id] = time.perf_counter()
+            self._pending.append((job_id, model_size, audio, options))
+            self._dispatch()
+        return future
+
+    def _dispatch(self):
+        """Assign pending jobs to idle workers. Must be called with the lock held."""
+        while self._pending:
+            idle = [worker for worker in range(self.workers) if self._assigned[worker] is None]
+            if not idle:
+                return
+
+            job = self._pending.popleft()
+            # Marks the future running; False if the caller cancelled it while it was queued
+            if not self._futures[job[0]].set_running_or_notify_cancel():
+                self._futures.pop(job[0])
+                self._submitted.pop(job[0], None)
+                continue
+            model_size = job[1]
+            warm = [worker for worker in idle if model_size in self._resident[worker]]
+            worker = (warm or idle)[0]
+
+            resident = self._resident[worker]
+            resident[model_size] = True
+            resident.move_to_end(model_size)
+            if len(resident) > self.max_resident_models:
+                resident.popitem(last=False)
+
+            self._assigned[worker] = job[0]
+            self._started[job[0]] = time.perf_counter()
+            self._queues[worker].put(job)
+
+    def _collect(self):
+        """Collector thread: resolve futures as results come back, and reap dead workers on every pass."""
+        while self._running:
+            with self._lock:
+                connections = list(self._connections)
+            try:
+                ready = wait_connections(connections, timeout=1.0)
+            except OSError:
+                # A pipe was closed because its worker was replaced meanwhile
+                ready = []
+            for connection in ready:
+                try:
+                    message = connection.recv()
+                except (EOFError, OSError):
+                    # The worker exited or was replaced; the reaper handles its job
+                    continue
+                self._complete(message)
+            self._reap_dead_workers()
+
+    def _complete(self, message: tuple):
+        """Resolve the future of a job a worker finished."""
+        job_id, worker_id, error, segments = message
+        with self._lock:
+            # The reaper may already have failed the job of a worker that died
+            future = self._futures.pop(job_id, None)
+            if self._assigned[worker_id] == job_id:
+                self._assigned[worker_id] = None
+                self._restarts[worker_id] = 0
+            self._record(job_id, worker_id)
+            self._dispatch()
+
+        if future is None:
+            return
+        if error is not None:
+            future.set_exception(MeetingMindError(f"Transcription worker failed: {error}"))
+        else:
+            future.set_result(segments)
+
+    def abandon(self, future: Future):
+        """
+        Drop a job whose caller stopped waiting for it (e.g. after a timeout).
+
+        A queued job is removed. A worker already running the job is terminated
+        and restarted, so it does not keep decoding audio nobody waits for.
+        The future fails with `MeetingMindError`.
+
+        Args:
+            future (Future): Future returned by `submit`.
+        """
+        with self._lock:
+            job_id = next((job_id for job_id, pending in self._futures.items() if pending is future), None)
+            if job_id is None:
+                return
+            del self._futures[job_id]
+            self._submitted.pop(job_id, None)
+            self._started.pop(job_id, None)
+            self._pending = deque(job for job in self._pending if job[0] != job_id)
+            if self._running:
+                for worker, assigned in enumerate(self._assigned):
+                    if assigned == job_id:
+                        logging.warning(f"Terminating transcription worker {worker} running an abandoned job")
+                        self._processes[worker].terminate()
+                        self._processes[worker].join(timeout=10)
+                        self._resident[worker].clear()
+                        self._start_worker(worker)
+                        self._assigned[worker] = None
+                self._dispatch()
+
+        if not future.done():
+            future.set_exception(MeetingMindError("Transcription job was abandoned"))
+
+    def _record(self, job_id: int, worker_id: int):
+        """Move a finished job's timestamps into the history. Must be called with the lock held."""
+        submitted = self._submitted.pop(job_id, None)
+        started = self._started.pop(job_id, None)
+        if submitted is not None and started is not None:
+            self._history.append({
+                "worker": worker_id,
+                "queue_wait": started - submitted,
+                "run_time": time.perf_counter() - started,
+            })
+
+    def stats(self) -> dict:
+        """
+        Return queue wait and run time of recent jobs.
+
+        Returns:
+            dict: pending jobs, mean queue wait, mean run time and the recent jobs themselves.
+        """
+        with self._lock:
+            history = list(self._history)
+            pending = len(self._pending)
+        return {
+            "pending": pending,
+            "mean_queue_wait": sum(job["queue_wait"] for job in history) / len(history) if history else 0.0,
+            "mean_run_time": sum(job["run_time"] for job in history) / len(history) if history else 0.0,
+            "recent": history,
+        }
+
+    def _reap_dead_workers(self):
+        """
+        Handle worker processes that died, so callers do not wait forever.
+
+        The job of a dead worker fails and the worker is restarted, unless it
+        already died `max_restarts` times in a row (e.g. its imports fail); it is
+        then given up. When no worker is left, every queued job fails.
+        """
+        failed = []
+        with self._lock:
+            if not self._running:
+                return
+            for worker, process in enumerate(self._processes):
+                job_id = self._assigned[worker]
+                if job_id == -1 or process.is_alive():
+                    continue
+                if job_id is not None:
+                    failed.append((self._futures.pop(job_id, None), f"worker exited with code {process.exitcode}"))
+                    self._submitted.pop(job_id, None)
+                    self._started.pop(job_id, None)
+                self._resident[worker].clear()
+
+                if self._restarts[worker] < self.max_restarts:
+                    self._restarts[worker] += 1
+                    logging.error(
+                        f"Transcription worker {worker} exited with code {process.exitcode}; "
+                        f"restarting it ({self._restarts[worker]}/{self.max_restarts})"
+                    )
+                    self._start_worker(worker)
+                    self._assigned[worker] = None
+                else:
+                    logging.error(
+                        f"Transcription worker {worker} exited with code {process.exitcode} "
+                        f"after {self.max_restarts} restarts; giving it up"
+                    )
+                    # Keep the dead worker marked busy so no further jobs are routed to it
+                    self._assigned[worker] = -1
+
+            if all(job_id == -1 for job_id in self._assigned):
+                while self._pending:
+                    job_id = self._pending.popleft()[0]
+                    self._submitted.pop(job_id, None)
+                    failed.append((self._futures.pop(job_id, None), "no transcription worker is alive"))
+            else:
+                self._dispatch()
+
+        for future, reason in failed:
+            if future is not None and not future.done():
+                future.set_exception(MeetingMindError(f"Transcription failed: {reason}"))
+
+    def resident_models(self) -> list[list[str]]:
+        """
+        Return the model sizes resident in each worker, least recently used first.
+
+        Returns:
+            list[list[str]]: One list of model sizes per worker.
+        """
+        with self._lock:
+            return [list(resident) for resident in self._resident]
+
+    def shutdown(self):
+        """
+        Stop all workers and the collector thread.
+        """
+        if not self._running:
+            return
+        self._running = False
+
+        for jobs in self._queues:
+            jobs.put(None)
+        for process in self._processes:
+            process.join(timeout=10)
+        # The collector stops on its next pass now that the server is not running
+        self._collector.join()
+        for connection in self._connections:
+            connection.close()
+
+        with self._lock:
+            for future in self._futures.values():
+                if not future.done():
+                    future.set_exception(MeetingMindError("Whisper model server was shut down"))
+            self._futures.clear()
+            self._pending.clear()
+        logging.info("Whisper model server stopped")
+
+
+def get_model_server() -> WhisperModelServer:
+    """
+    Return the process-wide model server, starting it on first use.
+
+    All dashboard sessions in a Streamlit process share this server, so each
+    model size is loaded once per worker rather than once per session.
+
+    Returns:
+        WhisperModelServer: The running shared server.
+    """
+    global _SERVER
+    with _SERVER_LOCK:
+        if _SERVER is None:
+            _SERVER = WhisperModelServer().start()
+            atexit.register(_SERVER.shutdown)
+        return _SERVER
+
+
+class WhisperServerTranscriber(WhisperTranscriber):
+    """
+    Transcriber that sends decoding to the shared Whisper model server.
+
+    Behaves like `WhisperTranscriber` (VAD, timestamps, saving transcripts),
+    but holds no model itself, so creating one per request is cheap.
+    """
+
+    # The server's workers already bound concurrency and threads, so jobs bypass the scheduler
+    scheduled = False
+
+    def __init__(self, server: WhisperModelServer = None):
+        """
+        Initialize WhisperServerTranscriber.
+
+        Args:
+            server (WhisperModelServer, optional): Server to use. Defaults to the shared server.
+        """
+        config = load_model_config()["whisper"]
+        self.model_size = config["model_size"]
+        self.use_vad = config.get("use_vad", False)
+        self.use_cache = config.get("transcript_cache", {}).get("enabled", True)
+        self.decode_options = load_decode_profile()
+        self.job_timeout = config.get("server", {}).get("job_timeout_seconds", 3600)
+        self.server = server or get_model_server()
+
+    def _decode(self, audio, options: dict = None) -> list[dict]:
+        future = self.server.submit(self.model_size, audio, **(options or self.decode_options))
+        try:
+            return future.result(timeout=self.job_timeout)
+        except FutureTimeoutError:
+            # Frees the worker too: a running job cannot be cancelled
+            self.server.abandon(future)
+            raise MeetingMindError(f"Transcription did not finish within {self.job_timeout} s")
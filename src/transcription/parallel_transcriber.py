@@ -0,0 +1,223 @@
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import multiprocessing as mp
+import numpy as np
+import threading
+import logging
+import os
+import sys
+
+from src.transcription.whisper_transcriber import WhisperTranscriber, load_audio, load_decode_profile
+from src.audio.vad import frame_features
+from src.audio.loader import SAMPLE_RATE
+from config.config_loader import load_model_config
+
+# Ensure project root is in sys.path for absolute imports
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+# Logging configuration
+logging.basicConfig(level=logging.INFO)
+
+# Whisper model of the current worker process (set by the pool initializer)
+_WORKER_MODEL = None
+
+
+def plan_chunks(
+    audio: np.ndarray,
+    sr: int = SAMPLE_RATE,
+    max_seconds: float = 120,
+    search_seconds: float = 10,
+    overlap_seconds: float = 2,
+    silence_margin_db: float = 6,
+) -> list[dict]:
+    """
+    Split audio into chunks of bounded length, cutting at silence where possible.
+
+    For every cut, the quietest frame in the last `search_seconds` before the
+    length limit is chosen. If it is within `silence_margin_db` of the noise floor
+    (and that far below the median frame energy) the cut is clean. Otherwise
+    (continuous speech) both neighbouring chunks extend `overlap_seconds / 2` past
+    the cut, so words at the boundary are decoded in full by at least one of them.
+
+    Args:
+        audio (np.ndarray): 16 kHz mono float32 samples.
+        sr (int, optional): Sampling rate. Defaults to 16000.
+        max_seconds (float, optional): Maximum chunk length before overlap. Defaults to 120.
+        search_seconds (float, optional): Window searched for a silent cut point. Defaults to 10.
+        overlap_seconds (float, optional): Overlap added around forced cuts. Defaults to 2.
+        silence_margin_db (float, optional): Max distance from the noise floor for a clean cut.
+
+    Returns:
+        list[dict]: Chunks as {"start", "end", "core_start", "core_end"} in samples.
+                    Core ranges partition the audio; "start"/"end" include any overlap.
+    """
+    frame_seconds = 0.03
+    energy_db, _ = frame_features(audio, sr, frame_seconds)
+    frame_length = int(frame_seconds * sr)
+    noise_floor, median = np.percentile(energy_db, [10, 50]) if len(energy_db) else (0.0, 0.0)
+    silence_threshold = min(noise_floor + silence_margin_db, median - silence_margin_db)
+    half_overlap = int(overlap_seconds * sr / 2)
+
+    cuts = []  # (sample position, needs overlap)
+    position, total = 0, len(audio)
+    max_length, search_length = int(max_seconds * sr), int(search_seconds * sr)
+    while total - position > max_length:
+        limit = position + max_length
+        # Frames searched for a cut: within (position, limit], so every cut advances
+        first = max((limit - search_length) // frame_length, position // frame_length + 1)
+        last = min(limit // frame_length, len(energy_db))
+        cut, forced = limit, True
+        if first < last:
+            # Latest of equally quiet frames, so cuts in a long silence keep chunks long
+            quietest = last - 1 - int(np.argmin(energy_db[first:last][::-1]))
+            candidate = quietest * frame_length + frame_length // 2
+            if energy_db[quietest] <= silence_threshold and position < candidate <= limit:
+                cut, forced = candidate, False
+        cuts.append((cut, forced))
+        position = cut
+
+    boundaries = [(0, False)] + cuts + [(total, False)]
+    chunks = []
+    for (core_start, left_forced), (core_end, right_forced) in zip(boundaries, boundaries[1:]):
+        chunks.append({
+            "start": max(0, core_start - half_overlap) if left_forced else core_start,
+            "end": min(total, core_end + half_overlap) if right_forced else core_end,
+            "core_start": core_start,
+            "core_end": core_end,
+        })
+    return chunks
+
+
+def _init_worker(model_size: str, num_threads: int):
+    """Pool initializer: load the Whisper model once per worker process."""
+    global _WORKER_MODEL
+    import torch
+    import whisper
+
+    torch.set_num_threads(num_threads)
+    _WORKER_MODEL = whisper.load_model(model_size)
+
+
+def _transcribe_chunk(audio: np.ndarray, chunk: dict, options: dict) -> list[dict]:
+    """
+    Transcribe one chunk in a worker and return segments on the full timeline.
+
+    Chunks with overlap are decoded with word timestamps, and only the words whose
+    midpoint falls inside the chunk's core range are kept, so words in an overlap
+    are emitted exactly once.
+    """
+    overlapped = chunk["start"] != chunk["core_start"] or chunk["end"] != chunk["core_end"]
+    result = _WORKER_MODEL.transcribe(audio, word_timestamps=overlapped, **options)
+
+    offset = chunk["start"] / SAMPLE_RATE
+    core_start, core_end = chunk["core_start"] / SAMPLE_RATE, chunk["core_end"] / SAMPLE_RATE
+
+    segments = []
+    for segment in result["segments"]:
+        if not overlapped:
+            segments.append({
+                "start": segment["start"] + offset,
+                "end": segment["end"] + offset,
+                "text": segment["text"],
+            })
+            continue
+
+        words = [
+            word for word in segment.get("words", [])
+            if core_start <= offset + (word["start"] + word["end"]) / 2 < core_end
+        ]
+        if words:
+            segments.append({
+                "start": words[0]["start"] + offset,
+                "end": words[-1]["end"] + offset,
+                "text": "".join(word["word"] for word in words),
+            })
+    return segments
+
+
+class ParallelWhisperTranscriber(WhisperTranscriber):
+    """
+    Transcriber that splits long recordings into chunks and decodes them in parallel.
+
+    Chunks are cut at silence (see `plan_chunks`), transcribed in a pool of worker
+    processes that each hold one Whisper model, and stitched back in order with
+    timestamps on the original timeline.
+    """
+
+    # The pool already spreads one job over every core, so it bypasses the scheduler
+    scheduled = False
+
+    def __init__(self, workers: int = None):
+        """
+        Initialize ParallelWhisperTranscriber.
+
+        Args:
+            workers (int, optional): Number of worker processes.
+                                     Defaults to config value or the number of CPU cores.
+        """
+        config = load_model_config()["whisper"]
+        self.model_size = config["model_size"]
+        self.use_vad = config.get("use_vad", False)
+        self.use_cache = config.get("transcript_cache", {}).get("enabled", True)
+        self.decode_options = load_decode_profile()
+
+        parallel = config.get("parallel", {})
+        self.workers = workers or parallel.get("workers") or os.cpu_count()
+        self.max_segment_seconds = parallel.get("max_segment_seconds", 120)
+        self.silence_search_seconds = parallel.get("silence_search_seconds", 10)
+        self.overlap_seconds = parallel.get("overlap_seconds", 2)
+
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                threads = max(1, (os.cpu_count() or 1) // self.workers)
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=mp.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(self.model_size, threads),
+                )
+            return self._executor
+
+    def _decode_options(self) -> dict:
+        # Chunk boundaries change the transcript; the worker count does not
+        return {
+            **self.decode_options,
+            "max_segment_seconds": self.max_segment_seconds,
+            "silence_search_seconds": self.silence_search_seconds,
+            "overlap_seconds": self.overlap_seconds,
+        }
+
+    def _decode(self, audio, options: dict = None) -> list[dict]:
+        audio = load_audio(audio)
+        chunks = plan_chunks(
+            audio,
+            SAMPLE_RATE,
+            max_seconds=self.max_segment_seconds,
+            search_seconds=self.silence_search_seconds,
+            overlap_seconds=self.overlap_seconds,
+        )
+        logging.info(f"Transcribing {len(chunks)} chunks on {self.workers} workers")
+
+        executor = self._get_executor()
+        futures = [
+            executor.submit(
+                _transcribe_chunk, np.array(audio[chunk["start"]:chunk["end"]]), chunk, options or self.decode_options
+            )
+            for chunk in chunks
+        ]
+        return [segment for future in futures for segment in future.result()]
+
+    def close(self):
+        """
+        Shut down the worker processes.
+        """
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
@@ -0,0 +1,172 @@
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+import threading
+import logging
+import time
+import os
+import sys
+
+from config.config_loader import load_model_config
+
+# Ensure project root is in sys.path for absolute imports
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+_SCHEDULER = None
+_SCHEDULER_LOCK = threading.Lock()
+
+# Logging configuration
+logging.basicConfig(level=logging.INFO)
+
+
+def available_cores() -> list[int]:
+    """
+    Return the CPU cores this process may run on.
+
+    Returns:
+        list[int]: Core ids, sorted.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def partition_cores(slots: int, threads_per_job: int = None) -> list[list[int]]:
+    """
+    Split the available cores into one core set per concurrent job.
+
+    Args:
+        slots (int): Number of concurrent jobs.
+        threads_per_job (int, optional): Cores per job. Defaults to an even share
+                                         of the available cores (at least 1).
+
+    Returns:
+        list[list[int]]: One list of core ids per slot. Sets are disjoint unless
+                         slots * threads_per_job exceeds the number of cores.
+    """
+    cores = available_cores()
+    threads = threads_per_job or max(1, len(cores) // slots)
+    return [
+        sorted({cores[(slot * threads + i) % len(cores)] for i in range(threads)})
+        for slot in range(slots)
+    ]
+
+
+class TranscriptionScheduler:
+    """
+    Admission control for concurrent transcriptions on a shared CPU.
+
+    The machine is divided into `slots`, each with a thread budget and a core
+    set. A job runs only once a slot is free; later jobs wait in FIFO order.
+    This keeps concurrent Whisper calls from each starting one thread per core
+    and oversubscribing the machine.
+
+    Responsibilities:
+    - Partition the cores into per-job core sets and thread budgets.
+    - Admit jobs in arrival order when a slot is free.
+    - Record queue wait and run time per job.
+    """
+
+    def __init__(self, slots: int = None, threads_per_job: int = None):
+        """
+        Initialize TranscriptionScheduler.
+
+        Args:
+            slots (int, optional): Jobs allowed to run at once. Defaults to config value or 1.
+            threads_per_job (int, optional): Thread budget of each job. Defaults to config
+                                             value or an even share of the cores.
+        """
+        config = load_model_config()["whisper"].get("scheduler", {})
+        self.slots = slots or config.get("slots") or 1
+        self.threads_per_job = (
+            threads_per_job or config.get("threads_per_job") or max(1, len(available_cores()) // self.slots)
+        )
+        self.core_sets = partition_cores(self.slots, self.threads_per_job)
+
+        self._condition = threading.Condition()
+        self._free = list(range(self.slots))
+        self._waiting = deque()
+        self._history = deque(maxlen=config.get("history", 100))
+        self._completed = 0
+
+    @contextmanager
+    def job(self, name: str = "transcription"):
+        """
+        Run a block as a scheduled job, waiting for a free slot first.
+
+        Args:
+            name (str, optional): Label used in logs and stats.
+
+        Yields:
+            dict: {"slot": int, "cores": list[int], "threads": int} assigned to the job.
+        """
+        queued = time.perf_counter()
+        ticket = object()
+        with self._condition:
+            self._waiting.append(ticket)
+            while self._waiting[0] is not ticket or not self._free:
+                self._condition.wait()
+            self._waiting.popleft()
+            slot = self._free.pop(0)
+            # The next job in line may also fit in a free slot
+            self._condition.notify_all()
+
+        started = time.perf_counter()
+        wait = started - queued
+        if wait > 0.1:
+            logging.info(f"{name} waited {wait:.1f}s for a transcription slot")
+        try:
+            yield {"slot": slot, "cores": self.core_sets[slot], "threads": self.threads_per_job}
+        finally:
+            run = time.perf_counter() - started
+            with self._condition:
+                self._free.append(slot)
+                self._completed += 1
+                self._history.append({"name": name, "slot": slot, "queue_wait": wait, "run_time": run})
+                self._condition.notify_all()
+            logging.info(f"{name} ran {run:.1f}s on slot {slot} (queue wait {wait:.1f}s)")
+
+    def stats(self) -> dict:
+        """
+        Return scheduler counters.
+
+        Returns:
+            dict: slots, threads per job, running and queued jobs, completed jobs,
+                  mean and max queue wait and mean run time over recent jobs,
+                  and the recent jobs themselves.
+        """
+        with self._condition:
+            history = list(self._history)
+            running = self.slots - len(self._free)
+            queued = len(self._waiting)
+            completed = self._completed
+
+        waits = [job["queue_wait"] for job in history]
+        runs = [job["run_time"] for job in history]
+        return {
+            "slots": self.slots,
+            "threads_per_job": self.threads_per_job,
+            "running": running,
+            "queued": queued,
+            "completed": completed,
+            "mean_queue_wait": sum(waits) / len(waits) if waits else 0.0,
+            "max_queue_wait": max(waits, default=0.0),
+            "mean_run_time": sum(runs) / len(runs) if runs else 0.0,
+            "recent": history,
+        }
+
+
+def get_scheduler() -> TranscriptionScheduler:
+    """
+    Return the process-wide transcription scheduler shared by all sessions.
+
+    Returns:
+        TranscriptionScheduler: The shared scheduler.
+    """
+    global _SCHEDULER
+    with _SCHEDULER_LOCK:
+        if _SCHEDULER is None:
+            _SCHEDULER = TranscriptionScheduler()
+        return _SCHEDULER
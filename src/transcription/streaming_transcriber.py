@@ -0,0 +1,201 @@
+from pathlib import Path
+import numpy as np
+import threading
+import logging
+import sys
+
+from src.transcription.factory import create_transcriber
+from src.transcription.utils import clean_text
+from src.audio.loader import SAMPLE_RATE
+from config.config_loader import load_model_config
+
+# Ensure project root is in sys.path for absolute imports
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+# Logging configuration
+logging.basicConfig(level=logging.INFO)
+
+
+class StreamingTranscriber:
+    """
+    Incremental Whisper transcriber for live audio.
+
+    Audio blocks are pushed with `feed()` (e.g. from a `RingBufferRecorder`
+    listener). A background thread re-transcribes the uncommitted tail of the
+    stream every `step_seconds`. Segments that end more than `stability_seconds`
+    before the end of the stream are committed: their text is final and their
+    audio is dropped from the window. The rest is shown as a tentative partial.
+    When the stream stops, only the uncommitted tail remains to be decoded.
+
+    Decoding goes through the configured transcription backend (e.g. the
+    shared model server), so live recordings load no model of their own.
+
+    Responsibilities:
+    - Buffer live audio with a bounded decoding window.
+    - Emit committed and tentative partial transcripts while recording.
+    - Produce the final transcript and timestamped segments on `finish()`.
+    """
+
+    def __init__(
+        self,
+        step_seconds: float = None,
+        stability_seconds: float = None,
+        max_window_seconds: float = None,
+        transcriber=None,
+    ):
+        """
+        Initialize StreamingTranscriber.
+
+        Args:
+            step_seconds (float, optional): Interval between partial updates.
+                                            Defaults to config value or 3.
+            stability_seconds (float, optional): Segments ending this far before the end
+                                                 of the stream are committed. Defaults to config value or 5.
+            max_window_seconds (float, optional): Uncommitted audio above this length is
+                                                  force-committed. Defaults to config value or 30.
+            transcriber (WhisperTranscriber, optional): Transcriber decoding the window.
+                                                        Defaults to `create_transcriber()`.
+        """
+        self.transcriber = transcriber or create_transcriber()
+        config = load_model_config()["whisper"].get("streaming", {})
+        self.step_seconds = step_seconds or config.get("step_seconds", 3)
+        self.stability_seconds = stability_seconds or config.get("stability_seconds", 5)
+        self.max_window_seconds = max_window_seconds or config.get("max_window_seconds", 30)
+
+        self._lock = threading.Lock()
+        self._decode_lock = threading.Lock()
+        self._chunks = []
+        self._offset = 0.0
+        self._committed = []
+        self._tentative = ""
+        self._stop = threading.Event()
+        self._thread = None
+
+    def feed(self, block: np.ndarray):
+        """
+        Append a block of 16 kHz mono float32 audio to the stream.
+
+        Args:
+            block (np.ndarray): Audio samples (1-D, or 2-D with a single channel).
+        """
+        block = np.asarray(block, dtype=np.float32).reshape(-1)
+        with self._lock:
+            self._chunks.append(block.copy())
+
+    def start(self):
+        """
+        Start the background thread that emits partial transcripts.
+
+        Returns:
+            StreamingTranscriber: The transcriber itself.
+        """
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="streaming-transcriber", daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self):
+        while not self._stop.wait(self.step_seconds):
+            try:
+                self._update()
+            except Exception as e:
+                logging.error(f"Partial transcription failed: {e}")
+
+    def _update(self, final: bool = False):
+        """Decode the uncommitted window and commit the segments that are stable."""
+        with self._decode_lock:
+            with self._lock:
+                window = np.concatenate(self._chunks) if self._chunks else np.zeros(0, dtype=np.float32)
+                self._chunks = [window]
+
+            duration = len(window) / SAMPLE_RATE
+            if duration < 1.0 and not final:
+                return
+            if duration == 0:
+                with self._lock:
+                    self._tentative = ""
+                return
+
+            prompt = "".join(segment["text"] for segment in self._committed)[-200:] or None
+            # Context comes from the committed text, so do not also condition on the window's own output
+            segments = self.transcriber.decode_buffer(window, condition_on_previous_text=False, initial_prompt=prompt)
+
+            horizon = duration - self.stability_seconds
+            n_stable = len(segments) if final else 0
+            while n_stable < len(segments) and segments[n_stable]["end"] <= horizon:
+                n_stable += 1
+
+            # Keep the window bounded when it grew too long without a stable segment
+            skip_until = 0.0
+            if not final and n_stable == 0 and duration > self.max_window_seconds:
+                if len(segments) > 1:
+                    # Commit all but the newest segment
+                    n_stable = len(segments) - 1
+                elif segments and segments[0]["start"] <= 0:
+                    # A single segment filling the window
+                    n_stable = 1
+                else:
+                    # Silence before the only segment, or no speech at all: drop it uncommitted
+                    skip_until = segments[0]["start"] if segments else horizon
+
+            stable, pending = segments[:n_stable], segments[n_stable:]
+            committed_until = stable[-1]["end"] if stable else skip_until
+            if final:
+                committed_until = duration
+
+            with self._lock:
+                self._chunks[0] = self._chunks[0][int(committed_until * SAMPLE_RATE):]
+                self._committed.extend(
+                    {"start": self._offset + s["start"], "end": self._offset + s["end"], "text": s["text"]}
+                    for s in stable
+                )
+                self._offset += committed_until
+                self._tentative = "".join(segment["text"] for segment in pending)
+
+    def partial(self) -> dict:
+        """
+        Return the current partial transcript.
+
+        Returns:
+            dict: {"committed": str, "tentative": str, "text": str, "seconds": float}
+                  where "seconds" is the length of audio already committed.
+        """
+        with self._lock:
+            committed = clean_text("".join(segment["text"] for segment in self._committed))
+            tentative = clean_text(self._tentative)
+            seconds = self._offset
+        return {
+            "committed": committed,
+            "tentative": tentative,
+            "text": clean_text(f"{committed} {tentative}"),
+            "seconds": seconds,
+        }
+
+    def finish(self) -> str:
+        """
+        Stop the partial updates, decode the remaining tail and return the final transcript.
+
+        Returns:
+            str: Cleaned transcription text of the whole stream.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+        self._update(final=True)
+        text = self.partial()["committed"]
+        logging.info(f"Live transcription complete, length: {len(text)} characters")
+        return text
+
+    def stream_segments(self) -> list[dict]:
+        """
+        Return the committed segments with timestamps on the stream timeline.
+
+        Returns:
+            list[dict]: Segments as {"start": float, "end": float, "text": str} (seconds).
+        """
+        with self._lock:
+            return list(self._committed)
@@ -0,0 +1,209 @@
+from pathlib import Path
+import numpy as np
+import threading
+import hashlib
+import logging
+import json
+import os
+import sys
+import tempfile
+import time
+
+from config.config_loader import load_model_config
+
+# Ensure project root is in sys.path for absolute imports
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+TRANSCRIPT_CACHE_DIR = PROJECT_ROOT / "data" / "transcript_cache"
+TRANSCRIPT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+# Bytes hashed per step, for files and memory-mapped buffers alike
+_HASH_BLOCK = 8 * 1024 * 1024
+
+_CACHE = None
+_CACHE_LOCK = threading.Lock()
+
+# Logging configuration
+logging.basicConfig(level=logging.INFO)
+
+
+def audio_digest(audio) -> tuple[str, int]:
+    """
+    Hash audio content in fixed-size blocks.
+
+    Args:
+        audio (str | np.ndarray): Path to an audio file (its bytes are hashed)
+                                  or a sample buffer (its samples are hashed).
+
+    Returns:
+        tuple: (hex SHA-256, number of bytes hashed)
+    """
+    hasher = hashlib.sha256()
+    if isinstance(audio, (str, Path)):
+        with open(audio, "rb") as f:
+            for block in iter(lambda: f.read(_HASH_BLOCK), b""):
+                hasher.update(block)
+        return hasher.hexdigest(), Path(audio).stat().st_size
+
+    samples = np.ascontiguousarray(audio).reshape(-1)
+    data = memoryview(samples).cast("B")
+    for start in range(0, len(data), _HASH_BLOCK):
+        hasher.update(data[start:start + _HASH_BLOCK])
+    return hasher.hexdigest(), len(data)
+
+
+class TranscriptCache:
+    """
+    Content-addressed on-disk cache of transcription segments.
+
+    Entries are JSON files named after a hash of the audio content and the
+    settings that affect the transcript (backend, model size, language, decode
+    options). The cache is bounded in size: when it grows past `max_size_mb`,
+    the least recently used entries (by file modification time, refreshed on
+    every hit) are deleted.
+
+    Responsibilities:
+    - Build cache keys from audio content and decode settings.
+    - Store and look up transcription segments.
+    - Evict least recently used entries to stay within the size limit.
+    - Count hits, misses, audio bytes and decode seconds saved.
+    """
+
+    def __init__(self, directory: Path = None, max_size_mb: float = None):
+        """
+        Initialize TranscriptCache.
+
+        Args:
+            directory (Path, optional): Cache directory. Defaults to data/transcript_cache.
+            max_size_mb (float, optional): Size limit of the cache. Defaults to the
+                                           `whisper.transcript_cache.max_size_mb` config value or 200.
+        """
+        config = load_model_config()["whisper"].get("transcript_cache", {})
+        self.directory = Path(directory or TRANSCRIPT_CACHE_DIR)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = int((max_size_mb or config.get("max_size_mb", 200)) * 1024 * 1024)
+
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+        self.seconds_saved = 0.0
+
+    @staticmethod
+    def make_key(audio_sha256: str, settings: dict) -> str:
+        """
+        Build the cache key of a transcription.
+
+        Args:
+            audio_sha256 (str): Hash of the audio content.
+            settings (dict): Everything that affects the transcript (model size,
+                             language, decode options...). Must be JSON-serializable.
+
+        Returns:
+            str: Hex SHA-256 cache key.
+        """
+        payload = json.dumps({"audio": audio_sha256, "settings": settings}, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str, audio_bytes: int = 0) -> list[dict] | None:
+        """
+        Look up cached segments.
+
+        Args:
+            key (str): Cache key from `make_key`.
+            audio_bytes (int, optional): Size of the audio, counted as saved on a hit.
+
+        Returns:
+            list[dict] | None: Cached segments, or None on a miss.
+        """
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+            # Refresh the modification time: it is the LRU order
+            os.utime(path)
+        except (FileNotFoundError, json.JSONDecodeError):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+            self.bytes_saved += audio_bytes
+            self.seconds_saved += entry.get("decode_seconds", 0.0)
+        return entry["segments"]
+
+    def put(self, key: str, segments: list[dict], decode_seconds: float = 0.0):
+        """
+        Store segments and evict old entries if the cache is over its size limit.
+
+        Args:
+            key (str): Cache key from `make_key`.
+            segments (list[dict]): Segments as {"start", "end", "text"}.
+            decode_seconds (float, optional): Time the transcription took, reported as saved on later hits.
+        """
+        entry = {"segments": segments, "decode_seconds": decode_seconds, "created": time.time()}
+        with tempfile.NamedTemporaryFile(
+            "w", dir=self.directory, suffix=".tmp", delete=False, encoding="utf-8"
+        ) as f:
+            json.dump(entry, f)
+        os.replace(f.name, self._path(key))
+        self._evict()
+
+    def _evict(self):
+        """Delete least recently used entries until the cache fits in `max_bytes`."""
+        with self._lock:
+            entries = []
+            for path in self.directory.glob("*.json"):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+                logging.info(f"Evicted transcript cache entry {path.name}")
+
+    def stats(self) -> dict:
+        """
+        Return cache counters.
+
+        Returns:
+            dict: hits, misses, hit rate, audio bytes and decode seconds saved,
+                  number of entries and size on disk in bytes.
+        """
+        sizes = [path.stat().st_size for path in self.directory.glob("*.json")]
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "bytes_saved": self.bytes_saved,
+                "seconds_saved": self.seconds_saved,
+                "entries": len(sizes),
+                "size_bytes": sum(sizes),
+            }
+
+
+def get_transcript_cache() -> TranscriptCache:
+    """
+    Return the process-wide transcript cache, so counters cover all sessions.
+
+    Returns:
+        TranscriptCache: The shared cache.
+    """
+    global _CACHE
+    with _CACHE_LOCK:
+        if _CACHE is None:
+            _CACHE = TranscriptCache()
+        return _CACHE
@@ -30,3 +30,34 @@ def split_into_sentences(text: str):
     sentences = re.split(r'(?<=[.!?]) +', text)
     sentences = [s.strip() for s in sentences if s.strip()]
     return sentences
+
+def word_error_rate(reference: str, hypothesis: str) -> float:
+    """
+    Compute the word error rate of a transcript against a reference.
+
+    Both texts are lowercased and stripped of punctuation before comparison.
+
+    Args:
+        reference (str): Ground-truth transcript.
+        hypothesis (str): Transcript to evaluate.
+
+    Returns:
+        float: (substitutions + deletions + insertions) / number of reference words.
+    """
+    ref = re.sub(r"[^\w\s']", " ", reference.lower()).split()
+    hyp = re.sub(r"[^\w\s']", " ", hypothesis.lower()).split()
+    if not ref:
+        return float(len(hyp) > 0)
+
+    # Edit distance over words, keeping one row of the table at a time
+    previous = list(range(len(hyp) + 1))
+    for i, ref_word in enumerate(ref, start=1):
+        current = [i] + [0] * len(hyp)
+        for j, hyp_word in enumerate(hyp, start=1):
+            current[j] = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (ref_word != hyp_word),
+            )
+        previous = current
+    return previous[-1] / len(ref)
@@ -1,11 +1,18 @@
 from pathlib import Path
 import logging
+import numpy as np
 import whisper
+import torch
+import time
 import sys
 import os
 
 from src.transcription.base_transcriber import BaseTranscriber
 from src.transcription.utils import clean_text
+from src.transcription.transcript_cache import get_transcript_cache, audio_digest
+from src.transcription.scheduler import get_scheduler
+from src.audio.vad import trim_silence, vad_settings
+from src.audio.loader import load_pcm, SAMPLE_RATE
 from src.handlers.error_handler import handle_errors, MeetingMindError
 from config.config_loader import load_model_config
 
@@ -27,55 +34,284 @@ class WhisperTranscriber(BaseTranscriber):
 
     Responsibilities:
     - Load Whisper model of specified size.
-    - Transcribe audio files to text.
+    - Optionally trim silence with the VAD stage before decoding.
+    - Transcribe audio files to text and timestamped segments.
+    - Reuse cached transcripts of audio already transcribed with the same settings.
+    - Run decoding within a slot granted by the transcription scheduler.
     - Save transcription text to a file.
     """
 
+    # Whether decoding waits for a slot of the shared transcription scheduler
+    scheduled = True
+
     def __init__(self):
         """
         Initialize WhisperTranscriber with a specific Whisper model size.
         """
         config = load_model_config()["whisper"]
-        model_size = config["model_size"]
-        self.model = whisper.load_model(model_size)
+        self.model_size = config["model_size"]
+        self.use_vad = config.get("use_vad", False)
+        self.use_cache = config.get("transcript_cache", {}).get("enabled", True)
+        self.decode_options = load_decode_profile()
+        # PyTorch's thread count is process-wide, but every scheduler slot has the
+        # same thread budget, so one setting fits all concurrent jobs of this process
+        torch.set_num_threads(get_scheduler().threads_per_job)
+        self.model = whisper.load_model(self.model_size)
 
 
     @handle_errors("Failed to convert audio to text")
-    def transcribe(self, audio_file: str) -> str:
+    def transcribe(self, audio_file) -> str:
 
         """
         Convert an audio file to text using Whisper.
 
         Args:
-            audio_file (str): Path to the audio file.
+            audio_file (str | np.ndarray): Path to the audio file, or a 16 kHz
+                                           mono float32 buffer (e.g. from `enhance_audio_to_array`).
 
         Returns:
             str: Cleaned transcription text.
         """
 
-        result = self.model.transcribe(audio_file)
-        text = result["text"]
+        segments, _ = self._transcribe_segments(audio_file)
+        return self._to_text(segments)
+
+    @handle_errors("Failed to convert audio to text")
+    def transcribe_with_digest(
+        self, audio_file, preprocess=None, preprocessing: dict = None, source_sha256: str = None
+    ) -> tuple[str, str]:
+        """
+        Convert audio to text and return it with the hash of the audio content.
+
+        The hash names the transcript file (see `save_transcript`). With `preprocess`,
+        the transcript is cached under the hash of the original audio and the
+        preprocessing settings, so a cache hit also skips the preprocessing (e.g.
+        denoising) of a recording already transcribed.
+
+        Args:
+            audio_file (str | np.ndarray): Path to the audio file, or a 16 kHz mono float32 buffer.
+            preprocess (Callable, optional): Turns `audio_file` into the audio to decode
+                                             (e.g. `enhance_audio_to_array`). Only called on a cache miss.
+            preprocessing (dict, optional): Settings that change the output of `preprocess`.
+            source_sha256 (str, optional): Known SHA-256 of `audio_file`'s content (e.g. the
+                                           upload's). Defaults to hashing it.
+
+        Returns:
+            tuple: (cleaned transcription text, hex SHA-256 of the audio content,
+                   or None when the transcript cache is disabled and no hash is given)
+        """
+        segments, digest = self._transcribe_segments(audio_file, preprocess, preprocessing, source_sha256)
+        return self._to_text(segments), digest
+
+    def _to_text(self, segments: list[dict]) -> str:
+        text = "".join(segment["text"] for segment in segments)
         text = clean_text(text)
         logging.info(f"Transcription complete, length: {len(text)} characters")
         return text
 
+    @handle_errors("Failed to convert audio to timestamped segments")
+    def transcribe_segments(self, audio_file) -> list[dict]:
+        """
+        Convert an audio file to timestamped text segments using Whisper.
+
+        When VAD is enabled, timestamps refer to the original recording, not
+        to the silence-trimmed audio that was decoded.
+
+        Args:
+            audio_file (str | np.ndarray): Path to the audio file, or a 16 kHz mono float32 buffer.
+
+        Returns:
+            list[dict]: Segments as {"start": float, "end": float, "text": str} (seconds).
+        """
+        segments, _ = self._transcribe_segments(audio_file)
+        return segments
+
+    def _transcribe_segments(
+        self, audio_file, preprocess=None, preprocessing: dict = None, source_sha256: str = None
+    ) -> tuple[list[dict], str]:
+        """Transcribe through the transcript cache; return the segments and the audio content hash."""
+        if not self.use_cache:
+            audio = preprocess(audio_file) if preprocess else audio_file
+            return self._transcribe_scheduled(audio), source_sha256
+
+        cache = get_transcript_cache()
+        if source_sha256 is None:
+            digest, n_bytes = audio_digest(audio_file)
+        else:
+            digest = source_sha256
+            n_bytes = Path(audio_file).stat().st_size if isinstance(audio_file, (str, Path)) else np.asarray(audio_file).nbytes
+        settings = self._cache_settings()
+        if preprocess is not None:
+            settings["preprocessing"] = preprocessing
+        key = cache.make_key(digest, settings)
+
+        segments = cache.get(key, audio_bytes=n_bytes)
+        if segments is not None:
+            logging.info(f"Transcript cache hit ({n_bytes / 1e6:.1f} MB of audio)")
+            return segments, digest
+
+        start = time.perf_counter()
+        audio = preprocess(audio_file) if preprocess else audio_file
+        segments = self._transcribe_scheduled(audio)
+        cache.put(key, segments, decode_seconds=time.perf_counter() - start)
+        return segments, digest
+
+    def _transcribe_scheduled(self, audio_file) -> list[dict]:
+        return self._run_scheduled(self._transcribe_uncached, audio_file)
+
+    def _run_scheduled(self, func, *args):
+        """
+        Run a decoding function, within a transcription scheduler slot unless `scheduled` is off.
+
+        Where supported (Linux), the calling thread is pinned to the slot's core
+        set for the duration of the job.
+        """
+        if not self.scheduled:
+            return func(*args)
+        with get_scheduler().job(type(self).__name__) as slot:
+            if not hasattr(os, "sched_setaffinity"):
+                return func(*args)
+            # On Linux, pid 0 is the calling thread, so concurrent jobs keep their own core sets
+            previous = os.sched_getaffinity(0)
+            os.sched_setaffinity(0, slot["cores"])
+            try:
+                return func(*args)
+            finally:
+                os.sched_setaffinity(0, previous)
+
+    def decode_buffer(self, audio: np.ndarray, **options) -> list[dict]:
+        """
+        Decode a 16 kHz buffer as is, with some decode options overridden.
+
+        Skips the VAD stage and the transcript cache; used to re-decode the
+        window of a live stream (see `StreamingTranscriber`).
+
+        Args:
+            audio (np.ndarray): 16 kHz mono float32 samples.
+            **options: Decode options replacing those of the decode profile
+                       (e.g. initial_prompt).
+
+        Returns:
+            list[dict]: Segments as {"start": float, "end": float, "text": str} (seconds).
+        """
+        return self._run_scheduled(self._decode, audio, {**self.decode_options, **options})
+
+    def _cache_settings(self) -> dict:
+        """
+        Return the settings that change the transcript of a given audio content.
+
+        Subclasses add their own decoding parameters through `_decode_options`.
+        With VAD on, the detector settings are included as they decide which audio is decoded.
+        """
+        settings = {
+            "backend": type(self).__name__,
+            "model_size": self.model_size,
+            "use_vad": self.use_vad,
+            "options": self._decode_options(),
+        }
+        if self.use_vad:
+            settings["vad"] = vad_settings()
+        return settings
+
+    def _decode_options(self) -> dict:
+        """Return the options that affect decoding (the decode profile by default)."""
+        return self.decode_options
+
+    def _transcribe_uncached(self, audio_file) -> list[dict]:
+        if not self.use_vad:
+            return self._decode(audio_file)
+
+        condensed, offset_map, _ = trim_silence(load_audio(audio_file), SAMPLE_RATE)
+        if len(condensed) == 0:
+            logging.info("No speech detected, skipping transcription")
+            return []
+
+        return offset_map.map_segments(self._decode(condensed))
+
+    def _decode(self, audio, options: dict = None) -> list[dict]:
+        """
+        Run Whisper on a path or 16 kHz buffer and return its segments.
+
+        Subclasses override this to decode elsewhere (e.g. in a model server process).
+
+        Args:
+            audio (str | np.ndarray): Path to the audio file or a 16 kHz buffer.
+            options (dict, optional): Decode options. Defaults to the decode profile.
+        """
+        result = self.model.transcribe(load_audio(audio), **(options or self.decode_options))
+        return [_as_segment(segment) for segment in result["segments"]]
+
     @handle_errors("Failed to save transcript")
-    def save_transcript(self, transcript: str, output_file: str = None) -> str:
+    def save_transcript(self, transcript: str, output_file: str = None, audio_sha256: str = None) -> str:
         """
         Save transcription text to a file.
 
         Args:
             transcript (str): Transcribed text.
-            output_file (str, optional): Path to save transcript. Defaults to TRANSCRIPTS_DIR/transcript.txt.
+            output_file (str, optional): Path to save transcript. Defaults to
+                                         TRANSCRIPTS_DIR/{audio hash}.txt, or
+                                         TRANSCRIPTS_DIR/transcript.txt without a hash.
+            audio_sha256 (str, optional): Hash of the transcribed audio, as returned
+                                          by `transcribe_with_digest`.
 
         Returns:
             str: Path to the saved transcript file.
         """
         if output_file is None:
-            output_file = TRANSCRIPTS_DIR / "transcript.txt"
+            output_file = TRANSCRIPTS_DIR / (f"{audio_sha256[:16]}.txt" if audio_sha256 else "transcript.txt")
         else:
             output_file = Path(output_file)
 
         output_file.write_text(transcript, encoding="utf-8")
         logging.info(f"Transcript saved to {output_file}")
         return str(output_file)
+
+
+def load_decode_profile(profile: str = None) -> dict:
+    """
+    Load the Whisper decode options of a named decode profile.
+
+    The configured `language` and `task` are always passed, so language detection
+    does not run on every file. fp16 is only enabled when a GPU is available,
+    unless the profile sets it explicitly.
+
+    Args:
+        profile (str, optional): Profile name (e.g. "fast", "balanced", "accurate").
+                                 Defaults to the `whisper.decode_profile` config value.
+
+    Returns:
+        dict: Keyword arguments for `whisper.transcribe`.
+
+    Raises:
+        MeetingMindError: If the profile is not defined in the config file.
+    """
+    config = load_model_config()["whisper"]
+    profiles = config.get("decode_profiles", {})
+    profile = profile or config.get("decode_profile", "balanced")
+
+    if profile not in profiles:
+        raise MeetingMindError(f"Unknown decode profile '{profile}'. Available: {', '.join(profiles)}")
+
+    options = dict(profiles[profile])
+    if isinstance(options.get("temperature"), list):
+        options["temperature"] = tuple(options["temperature"])
+    options.setdefault("fp16", torch.cuda.is_available())
+    options["language"] = config.get("language")
+    options["task"] = config.get("task", "transcribe")
+    return options
+
+
+def _as_segment(segment: dict) -> dict:
+    """Keep the timestamp and text fields of a Whisper segment."""
+    return {"start": segment["start"], "end": segment["end"], "text": segment["text"]}
+
+
+def load_audio(audio_file) -> np.ndarray:
+    """
+    Return a 16 kHz mono float32 buffer for a path or an existing buffer.
+
+    Paths are decoded once through the PCM cache; buffers are used as is.
+    """
+    if isinstance(audio_file, (str, Path)):
+        return load_pcm(audio_file)
+    return np.asarray(audio_file, dtype=np.float32)